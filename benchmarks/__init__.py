@@ -0,0 +1,6 @@
+"""The benchmarks of APIFlask.
+
+The scenarios are defined in `benchmarks.scenarios`, they can be run with the
+standalone runner (`python -m benchmarks`) or with pytest-benchmark
+(`pytest benchmarks --no-cov`). See `benchmarks/README.md` for details.
+"""
@@ -0,0 +1,246 @@
+"""The standalone benchmark runner.
+
+Run all the scenarios and print the results::
+
+    $ python -m benchmarks
+
+Save the results as the new baseline, or compare with the saved baseline::
+
+    $ python -m benchmarks --save benchmarks/baseline.json
+    $ python -m benchmarks --compare benchmarks/baseline.json --max-regression 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import json
+import platform
+import statistics
+import sys
+import typing as t
+from importlib.metadata import version
+from time import perf_counter
+
+from .scenarios import SCENARIOS
+from .scenarios import Scenario
+
+BASELINE_SCENARIO = 'bare-route'
+
+
+class Result:
+    """The measured durations (in seconds) of a scenario."""
+
+    def __init__(self, scenario: Scenario, durations: list[float]) -> None:
+        self.name = scenario.name
+        self.group = scenario.group
+        self.rounds = len(durations)
+        self.mean = statistics.fmean(durations)
+        self.median = statistics.median(durations)
+        self.min = min(durations)
+        self.stddev = statistics.stdev(durations) if len(durations) > 1 else 0.0
+
+    @property
+    def ops(self) -> float:
+        """The operations (requests) per second."""
+        return 1 / self.mean
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            'group': self.group,
+            'rounds': self.rounds,
+            'mean': self.mean,
+            'median': self.median,
+            'min': self.min,
+            'stddev': self.stddev,
+        }
+
+
+def measure(
+    scenario: Scenario, min_time: float = 0.5, min_rounds: int = 3, max_rounds: int = 100_000
+) -> Result:
+    """Call the scenario until `min_time` seconds and `min_rounds` rounds are reached."""
+    run = scenario.setup()
+    run()  # warm up
+    gc.collect()
+    durations: list[float] = []
+    started_at = perf_counter()
+    while len(durations) < max_rounds:
+        start = perf_counter()
+        run()
+        end = perf_counter()
+        durations.append(end - start)
+        if len(durations) >= min_rounds and end - started_at >= min_time:
+            break
+    return Result(scenario, durations)
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f'{seconds:.2f}s'
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds * 1e6:.1f}us'
+
+
+def select_scenarios(patterns: list[str], groups: list[str]) -> list[Scenario]:
+    selected = []
+    for scenario in SCENARIOS.values():
+        if groups and scenario.group not in groups:
+            continue
+        if patterns and not any(fnmatch.fnmatch(scenario.name, pattern) for pattern in patterns):
+            continue
+        selected.append(scenario)
+    return selected
+
+
+def compare(
+    results: dict[str, dict[str, t.Any]],
+    baseline: dict[str, dict[str, t.Any]],
+    normalize: bool = True,
+) -> dict[str, float]:
+    """Compare the median durations with the baseline, returns the change ratios.
+
+    The median is used since it's less affected by the outliers (e.g., garbage
+    collection pauses) than the mean. When `normalize` is `True` and both sides have
+    the bare route result, the durations are divided by the duration of the bare
+    route first, so the results measured on different machines are comparable.
+    """
+    scale = 1.0
+    if normalize and BASELINE_SCENARIO in results and BASELINE_SCENARIO in baseline:
+        scale = baseline[BASELINE_SCENARIO]['median'] / results[BASELINE_SCENARIO]['median']
+    changes = {}
+    for name, result in results.items():
+        if name in baseline:
+            changes[name] = result['median'] * scale / baseline[name]['median'] - 1
+    return changes
+
+
+def render_table(rows: list[list[str]], markdown: bool = False) -> str:
+    if markdown:
+        lines = ['| ' + ' | '.join(row) + ' |' for row in rows]
+        lines.insert(1, '|' + '---|' * len(rows[0]))
+        return '\n'.join(lines)
+    widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+    return '\n'.join(
+        '  '.join(
+            cell.ljust(widths[index]) if index == 0 else cell.rjust(widths[index])
+            for index, cell in enumerate(row)
+        )
+        for row in rows
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description=__doc__.split('\n')[0]
+    )
+    parser.add_argument(
+        '-k',
+        dest='patterns',
+        action='append',
+        default=[],
+        help='Only run the scenarios matching the glob pattern (e.g., "input-*").',
+    )
+    parser.add_argument(
+        '-g', '--group', dest='groups', action='append', default=[], help='Only run the group.'
+    )
+    parser.add_argument('--list', action='store_true', help='List the scenarios and exit.')
+    parser.add_argument(
+        '--min-time', type=float, default=0.5, help='The minimum seconds to run each scenario.'
+    )
+    parser.add_argument('--save', metavar='PATH', help='Save the results to a JSON file.')
+    parser.add_argument('--compare', metavar='PATH', help='Compare with the saved results.')
+    parser.add_argument(
+        '--no-normalize',
+        dest='normalize',
+        action='store_false',
+        help='Compare the raw durations instead of the durations relative to the bare route.',
+    )
+    parser.add_argument(
+        '--max-regression',
+        type=float,
+        metavar='PERCENT',
+        help='Exit with status 1 if a scenario is slower than the baseline by this percent.',
+    )
+    parser.add_argument('--markdown', action='store_true', help='Output a Markdown table.')
+    args = parser.parse_args(argv)
+
+    scenarios = select_scenarios(args.patterns, args.groups)
+    if args.list:
+        for scenario in scenarios:
+            print(f'{scenario.name} ({scenario.group})')
+        return 0
+    if not scenarios:
+        print('No scenario matched.', file=sys.stderr)
+        return 1
+
+    results: dict[str, Result] = {}
+    for scenario in scenarios:
+        results[scenario.name] = measure(scenario, args.min_time)
+        if not args.markdown:
+            print(
+                f'{scenario.name}: {format_duration(results[scenario.name].median)}',
+                file=sys.stderr,
+            )
+    data = {name: result.to_dict() for name, result in results.items()}
+
+    baseline: dict[str, dict[str, t.Any]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    changes = compare(data, baseline, args.normalize)
+
+    bare = results.get(BASELINE_SCENARIO)
+    header = ['scenario', 'mean', 'median', 'stddev', 'ops/s', 'overhead']
+    if baseline:
+        header.append('change')
+    rows = [header]
+    for name, result in results.items():
+        # the per-request overhead compared to a bare route
+        overhead = '-'
+        if bare is not None and result.group not in ('baseline', 'spec'):
+            overhead = format_duration(result.median - bare.median)
+        row = [
+            name,
+            format_duration(result.mean),
+            format_duration(result.median),
+            format_duration(result.stddev),
+            f'{result.ops:,.0f}',
+            overhead,
+        ]
+        if baseline:
+            row.append(f'{changes[name]:+.1%}' if name in changes else 'new')
+        rows.append(row)
+    print(render_table(rows, args.markdown))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'platform': platform.platform(),
+                    'apiflask': version('apiflask'),
+                    'results': data,
+                },
+                f,
+                indent=2,
+            )
+            f.write('\n')
+
+    if args.max_regression is not None:
+        regressions = {
+            name: change
+            for name, change in changes.items()
+            if change * 100 > args.max_regression and name != BASELINE_SCENARIO
+        }
+        if regressions:
+            print(
+                f'\n{len(regressions)} scenario(s) regressed by more than '
+                f'{args.max_regression}%: {", ".join(sorted(regressions))}',
+                file=sys.stderr,
+            )
+            return 1
+    return 0
@@ -0,0 +1,392 @@
+"""The benchmark scenarios.
+
+Each scenario is a setup function that builds an app and returns a callable
+without arguments; the callable performs one operation (usually a request sent
+with the test client) and is what the runners measure. The setup function checks
+the response once, so a broken scenario fails early instead of measuring errors.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from pydantic import BaseModel
+from pydantic import Field as PydanticField
+
+from apiflask import APIFlask
+from apiflask import HTTPBasicAuth
+from apiflask import HTTPTokenAuth
+from apiflask import Schema
+from apiflask import abort
+from apiflask.fields import Field
+from apiflask.fields import Float
+from apiflask.fields import Integer
+from apiflask.fields import String
+from apiflask.security import APIKeyCookieAuth
+from apiflask.security import APIKeyHeaderAuth
+from apiflask.security import APIKeyQueryAuth
+from apiflask.security import MultiAuth
+from apiflask.validators import Length
+from apiflask.validators import OneOf
+from apiflask.validators import Range
+
+SetupType = t.Callable[[], t.Callable[[], t.Any]]
+
+INPUT_LOCATIONS = ('json', 'form', 'query', 'headers', 'cookies', 'path')
+OUTPUT_SIZES = (10, 1_000, 100_000)
+SPEC_ROUTES = (10, 100, 1_000)
+CATEGORIES = ['book', 'food', 'toy']
+
+
+class Scenario:
+    """A benchmark scenario.
+
+    Arguments:
+        name: The unique name of the scenario, e.g., `input-json-marshmallow`.
+        group: The group of the scenario, e.g., `input`.
+        setup: The function to build the scenario, returns the callable to measure.
+    """
+
+    def __init__(self, name: str, group: str, setup: SetupType) -> None:
+        self.name = name
+        self.group = group
+        self.setup = setup
+
+    def __repr__(self) -> str:
+        return f'<Scenario {self.name}>'
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def register(name: str, group: str, setup: SetupType) -> None:
+    """Register a scenario."""
+    if name in SCENARIOS:
+        raise ValueError(f'Duplicate benchmark scenario: {name!r}.')
+    SCENARIOS[name] = Scenario(name, group, setup)
+
+
+class ItemIn(Schema):
+    name = String(required=True, validate=Length(1, 50))
+    category = String(required=True, validate=OneOf(CATEGORIES))
+    quantity = Integer(required=True, validate=Range(0, 1000))
+
+
+class ItemOut(Schema):
+    id = Integer()
+    name = String()
+    category = String()
+    quantity = Integer()
+    price = Float()
+
+
+class BaseResponse(Schema):
+    message = String()
+    code = Integer()
+    data = Field()
+
+
+class ItemInModel(BaseModel):
+    name: str = PydanticField(min_length=1, max_length=50)
+    category: t.Literal['book', 'food', 'toy']
+    quantity: int = PydanticField(ge=0, le=1000)
+
+
+class ItemOutModel(BaseModel):
+    id: int
+    name: str
+    category: str
+    quantity: int
+    price: float
+
+
+ITEM = {'name': 'foo', 'category': 'book', 'quantity': '3'}
+SCHEMAS: dict[str, t.Any] = {'marshmallow': ItemIn, 'pydantic': ItemInModel}
+OUTPUT_SCHEMAS: dict[str, t.Any] = {'marshmallow': ItemOut, 'pydantic': ItemOutModel}
+
+
+def make_items(count: int) -> list[dict[str, t.Any]]:
+    return [
+        {
+            'id': index,
+            'name': f'item-{index}',
+            'category': CATEGORIES[index % 3],
+            'quantity': index % 1000,
+            'price': index * 0.5,
+        }
+        for index in range(count)
+    ]
+
+
+def make_request(
+    app: APIFlask,
+    path: str,
+    method: str = 'GET',
+    status_code: int = 200,
+    **kwargs: t.Any,
+) -> t.Callable[[], t.Any]:
+    """Check the response of the request once and return a callable to send it.
+
+    The cookie jar of the test client is disabled, the cookies are sent with
+    the `Cookie` header.
+    """
+    client = app.test_client(use_cookies=False)
+    response = client.open(path, method=method, **kwargs)
+    if response.status_code != status_code:
+        raise AssertionError(
+            f'{method} {path} returned {response.status_code}, expected {status_code}: '
+            f'{response.get_data(as_text=True)[:200]}'
+        )
+
+    def run() -> t.Any:
+        return client.open(path, method=method, **kwargs)
+
+    return run
+
+
+def bare_route() -> t.Callable[[], t.Any]:
+    app = APIFlask(__name__)
+
+    @app.get('/')
+    def index():
+        return {'message': 'Hello!'}
+
+    return make_request(app, '/')
+
+
+register('bare-route', 'baseline', bare_route)
+
+
+def make_input_setup(location: str, schema_type: str) -> SetupType:
+    def setup() -> t.Callable[[], t.Any]:
+        app = APIFlask(__name__)
+        schema = SCHEMAS[schema_type]
+        rule = '/items/<name>/<category>/<int:quantity>' if location == 'path' else '/items'
+
+        @app.post(rule)
+        @app.input(schema, location=location, arg_name='item')
+        def create_item(item, **kwargs):
+            return {'message': 'Created.'}
+
+        path = '/items'
+        kwargs: dict[str, t.Any] = {}
+        if location == 'json':
+            kwargs['json'] = ITEM
+        elif location == 'form':
+            kwargs['data'] = ITEM
+        elif location == 'query':
+            kwargs['query_string'] = ITEM
+        elif location == 'headers':
+            kwargs['headers'] = ITEM
+        elif location == 'cookies':
+            kwargs['headers'] = {
+                'Cookie': '; '.join(f'{key}={value}' for key, value in ITEM.items())
+            }
+        else:
+            path = '/items/{name}/{category}/{quantity}'.format(**ITEM)
+        return make_request(app, path, 'POST', **kwargs)
+
+    return setup
+
+
+for _location in INPUT_LOCATIONS:
+    for _schema_type in SCHEMAS:
+        register(
+            f'input-{_location}-{_schema_type}',
+            'input',
+            make_input_setup(_location, _schema_type),
+        )
+
+
+def make_output_setup(
+    schema_type: str, count: int, config: dict[str, t.Any] | None = None
+) -> SetupType:
+    def setup() -> t.Callable[[], t.Any]:
+        app = APIFlask(__name__)
+        app.config.update(config or {})
+        items = make_items(count)
+        schema = ItemOut(many=True) if schema_type == 'marshmallow' else list[ItemOutModel]
+
+        @app.get('/items')
+        @app.output(schema)
+        def get_items():
+            return items
+
+        return make_request(app, '/items')
+
+    return setup
+
+
+for _count in OUTPUT_SIZES:
+    for _schema_type in OUTPUT_SCHEMAS:
+        register(
+            f'output-many-{_schema_type}-{_count}',
+            'output',
+            make_output_setup(_schema_type, _count),
+        )
+    register(
+        f'output-many-marshmallow-compiled-{_count}',
+        'output',
+        make_output_setup('marshmallow', _count, {'COMPILE_OUTPUT_SCHEMAS': True}),
+    )
+    register(
+        f'output-many-pydantic-trusted-{_count}',
+        'output',
+        make_output_setup('pydantic', _count, {'VALIDATE_OUTPUT': False}),
+    )
+
+
+def base_response() -> t.Callable[[], t.Any]:
+    app = APIFlask(__name__)
+    app.config['BASE_RESPONSE_SCHEMA'] = BaseResponse
+    items = make_items(10)
+
+    @app.get('/items')
+    @app.output(ItemOut(many=True))
+    def get_items():
+        return {'message': 'Success.', 'code': 200, 'data': items}
+
+    return make_request(app, '/items')
+
+
+register('base-response', 'output', base_response)
+
+
+def make_auth_setup(auth_type: str) -> SetupType:
+    def setup() -> t.Callable[[], t.Any]:
+        app = APIFlask(__name__)
+        kwargs: dict[str, t.Any] = {}
+        path = '/secret'
+        auth: t.Any
+        if auth_type == 'basic':
+            auth = HTTPBasicAuth()
+
+            @auth.verify_password
+            def verify_password(username, password):
+                return username if password == 'secret' else None
+
+            kwargs['auth'] = ('foo', 'secret')
+        else:
+            if auth_type == 'token':
+                token_auths = [HTTPTokenAuth()]
+                kwargs['headers'] = {'Authorization': 'Bearer secret'}
+            elif auth_type == 'apikey-header':
+                token_auths = [APIKeyHeaderAuth()]
+                kwargs['headers'] = {'X-API-Key': 'secret'}
+            elif auth_type == 'apikey-cookie':
+                token_auths = [APIKeyCookieAuth()]
+                kwargs['headers'] = {'Cookie': 'X-API-Key=secret'}
+            elif auth_type == 'apikey-query':
+                token_auths = [APIKeyQueryAuth()]
+                path = '/secret?X-API-Key=secret'
+            else:
+                # the last auth of the multi auth matches the request
+                token_auths = [HTTPTokenAuth(), APIKeyHeaderAuth()]
+                kwargs['headers'] = {'X-API-Key': 'secret'}
+
+            for token_auth in token_auths:
+
+                @token_auth.verify_token
+                def verify_token(token):
+                    return 'foo' if token == 'secret' else None
+
+            auth = token_auths[0] if len(token_auths) == 1 else MultiAuth(*token_auths)
+
+        @app.get('/secret')
+        @app.auth_required(auth)
+        def secret():
+            return {'message': 'Hello!'}
+
+        return make_request(app, path, **kwargs)
+
+    return setup
+
+
+for _auth_type in ('basic', 'token', 'apikey-header', 'apikey-cookie', 'apikey-query', 'multi'):
+    register(f'auth-{_auth_type}', 'auth', make_auth_setup(_auth_type))
+
+
+def make_error_setup(error_type: str) -> SetupType:
+    def setup() -> t.Callable[[], t.Any]:
+        app = APIFlask(__name__)
+        auth = HTTPTokenAuth()
+
+        @auth.verify_token
+        def verify_token(token):
+            return None
+
+        @app.post('/marshmallow')
+        @app.input(ItemIn)
+        def marshmallow_input(json_data):
+            return {}
+
+        @app.post('/pydantic')
+        @app.input(ItemInModel)
+        def pydantic_input(json_data):
+            return {}
+
+        @app.get('/abort')
+        def abort_view():
+            abort(404)
+
+        @app.get('/secret')
+        @app.auth_required(auth)
+        def secret():
+            return {}
+
+        invalid_item = {'name': '', 'category': 'car', 'quantity': -1}
+        if error_type == 'validation-marshmallow':
+            return make_request(app, '/marshmallow', 'POST', 422, json=invalid_item)
+        if error_type == 'validation-pydantic':
+            return make_request(app, '/pydantic', 'POST', 422, json=invalid_item)
+        if error_type == 'abort':
+            return make_request(app, '/abort', status_code=404)
+        if error_type == 'auth':
+            return make_request(app, '/secret', status_code=401)
+        return make_request(app, '/not-found', status_code=404)
+
+    return setup
+
+
+for _error_type in ('validation-marshmallow', 'validation-pydantic', 'abort', 'auth', 'not-found'):
+    register(f'error-{_error_type}', 'error', make_error_setup(_error_type))
+
+
+def make_spec_setup(route_count: int) -> SetupType:
+    def setup() -> t.Callable[[], t.Any]:
+        app = APIFlask(__name__)
+        auth = HTTPTokenAuth()
+        for index in range(route_count):
+
+            @app.input(ItemIn)
+            @app.output(ItemOut, status_code=201)
+            @app.auth_required(auth)
+            def create_item(json_data):
+                return json_data
+
+            @app.input(ItemInModel, location='query')
+            @app.output(list[ItemOutModel])
+            def get_items(query_data):
+                return []
+
+            # spread the routes across the two schema libraries
+            view = create_item if index % 2 else get_items
+            method = 'POST' if index % 2 else 'GET'
+            app.add_url_rule(f'/items{index}', f'items{index}', view, methods=[method])
+
+        with app.app_context():
+            paths = app._generate_spec().to_dict()['paths']
+        if len(paths) != route_count:
+            raise AssertionError(f'Expected {route_count} paths, got {len(paths)}.')
+
+        def run() -> t.Any:
+            with app.app_context():
+                return app._generate_spec()
+
+        return run
+
+    return setup
+
+
+for _route_count in SPEC_ROUTES:
+    register(f'spec-generation-{_route_count}', 'spec', make_spec_setup(_route_count))
@@ -0,0 +1,14 @@
+"""Run the benchmark scenarios with pytest-benchmark (`pytest benchmarks --no-cov`)."""
+
+import pytest
+
+from .scenarios import SCENARIOS
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('name', list(SCENARIOS))
+def test_benchmark(benchmark, name):
+    scenario = SCENARIOS[name]
+    benchmark.group = scenario.group
+    benchmark(scenario.setup())
@@ -6,6 +6,8 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.semconv.resource import ResourceAttributes
 
 app = APIFlask(__name__, title='apiflask-otel', version='1.0.0')
+# trace the apiflask phases (auth, input, view, output) as child spans (APIFlask >= 3.2)
+app.config['TRACING'] = True
 
 
 def configure_trace(app: APIFlask):
@@ -1,19 +1,66 @@
-from . import fields as fields
-from . import validators as validators
-from .app import APIFlask as APIFlask
-from .blueprint import APIBlueprint as APIBlueprint
-from .exceptions import abort as abort
-from .exceptions import HTTPError as HTTPError
-from .helpers import get_reason_phrase as get_reason_phrase
-from .helpers import pagination_builder as pagination_builder
-from .schemas import EmptySchema as EmptySchema
-from .schemas import FileSchema as FileSchema
-from .schemas import PaginationModel as PaginationModel
-from .schemas import PaginationSchema as PaginationSchema
-from .schemas import Schema as Schema
-from .security import APIKeyCookieAuth as APIKeyCookieAuth
-from .security import APIKeyHeaderAuth as APIKeyHeaderAuth
-from .security import APIKeyQueryAuth as APIKeyQueryAuth
-from .security import HTTPBasicAuth as HTTPBasicAuth
-from .security import HTTPTokenAuth as HTTPTokenAuth
-from .security import MultiAuth as MultiAuth
+import typing as t
+from importlib import import_module
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from . import fields as fields
+    from . import validators as validators
+    from .app import APIFlask as APIFlask
+    from .blueprint import APIBlueprint as APIBlueprint
+    from .exceptions import abort as abort
+    from .exceptions import HTTPError as HTTPError
+    from .helpers import get_reason_phrase as get_reason_phrase
+    from .helpers import pagination_builder as pagination_builder
+    from .schemas import EmptySchema as EmptySchema
+    from .schemas import FileSchema as FileSchema
+    from .schemas import PaginationModel as PaginationModel
+    from .schemas import PaginationSchema as PaginationSchema
+    from .schemas import Schema as Schema
+    from .security import APIKeyCookieAuth as APIKeyCookieAuth
+    from .security import APIKeyHeaderAuth as APIKeyHeaderAuth
+    from .security import APIKeyQueryAuth as APIKeyQueryAuth
+    from .security import HTTPBasicAuth as HTTPBasicAuth
+    from .security import HTTPTokenAuth as HTTPTokenAuth
+    from .security import MultiAuth as MultiAuth
+
+# the public names and their modules, the modules are imported on the first access
+# so `import apiflask` doesn't pay for the subsystems that are never used
+_lazy_imports: t.Dict[str, str] = {
+    'fields': '',
+    'validators': '',
+    'APIFlask': 'app',
+    'APIBlueprint': 'blueprint',
+    'abort': 'exceptions',
+    'HTTPError': 'exceptions',
+    'get_reason_phrase': 'helpers',
+    'pagination_builder': 'helpers',
+    'EmptySchema': 'schemas',
+    'FileSchema': 'schemas',
+    'PaginationModel': 'schemas',
+    'PaginationSchema': 'schemas',
+    'Schema': 'schemas',
+    'APIKeyCookieAuth': 'security',
+    'APIKeyHeaderAuth': 'security',
+    'APIKeyQueryAuth': 'security',
+    'HTTPBasicAuth': 'security',
+    'HTTPTokenAuth': 'security',
+    'MultiAuth': 'security',
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    if not module_name:
+        value = import_module(f'{__name__}.{name}')
+    else:
+        value = getattr(import_module(f'{__name__}.{module_name}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(__all__))
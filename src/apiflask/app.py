@@ -1,43 +1,55 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import inspect
+import os
 import re
+import sys
+import threading
 import typing as t
 import warnings
 from functools import wraps
 
-from apispec import APISpec
-from apispec import BasePlugin
-from apispec.ext.marshmallow import MarshmallowPlugin
 from flask import Blueprint
 from flask import Flask
 from flask import has_request_context
-from flask import json
 from flask import jsonify
-from flask import render_template_string
+from flask import render_template
 from flask import request
 from flask import url_for
 from flask.config import ConfigAttribute
 from flask.wrappers import Response
-
-with warnings.catch_warnings():
-    warnings.simplefilter('ignore')
-    from flask_marshmallow import fields
-
-    try:
-        from flask_marshmallow import sqla
-    except ImportError:
-        sqla = None  # type: ignore
-
 from werkzeug.exceptions import HTTPException as WerkzeugHTTPException
+from werkzeug.sansio.utils import host_is_trusted
 
+from .caching import CacheBackend
+from .compress import compress_response
+from .docs_assets import get_docs_asset_urls
+from .docs_assets import send_docs_asset
 from .exceptions import HTTPError
 from .exceptions import _bad_schema_message
+from .exceptions import _ValidationError
+from .helpers import _BoundedCache
+from .helpers import _PAGE_URL_TEMPLATES_MAXSIZE
 from .helpers import get_reason_phrase
+from .metrics import MetricsRegistry
+from .metrics import PROMETHEUS_CONTENT_TYPE
+from .metrics import get_metrics_registry
+from .metrics import mark_request_failure
+from .metrics import record_request_metrics
+from .metrics import reset_request_metrics
+from .metrics import start_request_metrics
+from .profiling import finish_request_profiling
+from .profiling import reset_request_profiling
+from .profiling import start_request_profiling
 from .route import route_patch
-from .schemas import Schema
-from .schemas import FileSchema
-from .schemas import EmptySchema
+from .timing import finish_request_timing
+from .timing import reset_request_timing
+from .timing import start_request_timing
+from .tracing import reset_request_tracing
+from .tracing import start_request_tracing
+from .schemas import _is_schema_instance
 from .schema_adapters import registry
 from .security import MultiAuth
 from .security import _AuthBase
@@ -46,6 +58,7 @@ from .types import ResponseReturnValueType, ResponsesType
 from .types import ViewFuncType
 from .types import ErrorCallbackType
 from .types import SpecCallbackType
+from .types import RequestTimingsCallbackType
 from .types import SchemaType
 from .types import HTTPAuthType
 from .types import TagsType
@@ -57,12 +70,40 @@ from .openapi import get_operation_tags
 from .openapi import get_path_summary
 from .openapi import get_argument
 from .openapi import get_security_and_security_schemes
-from .openapi_adapters import get_unique_schema_name
+from .openapi_adapters import SchemaNameIndex
 from .openapi_adapters import openapi_helper
 from .openapi_adapters import extract_pydantic_defs
-from .ui_templates import ui_templates
-from .ui_templates import swagger_ui_oauth2_redirect_template
+from .openapi_adapters import compute_schema_conversions
+from .openapi_adapters import use_schema_cache
+from .openapi_adapters import use_schema_conversions
 from .scaffold import APIScaffold
+from .spec_profile import finish_spec_operation
+from .spec_profile import get_spec_profile
+from .spec_profile import profiled
+from .spec_profile import spec_phase
+from .spec_profile import start_spec_operation
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from apispec import APISpec
+    from apispec import BasePlugin
+    from apispec.ext.marshmallow import MarshmallowPlugin
+
+    from flask.wrappers import Request
+    from jinja2 import Template
+    from werkzeug.routing import MapAdapter
+
+    from .schemas import Schema
+
+
+def _insert_servers(spec: dict, url_root: str) -> dict:
+    """Copy the spec with the `servers` field, at the same position as apispec does."""
+    patched = {}
+    for key, value in spec.items():
+        if key == 'paths':
+            patched['servers'] = [{'url': url_root}]
+        patched[key] = value
+    patched.setdefault('servers', [{'url': url_root}])
+    return patched
 
 
 @route_patch
@@ -245,6 +286,28 @@ class APIFlask(APIScaffold, Flask):
             app.schema_name_resolver = schema_name_resolver
             ```
 
+        metrics_registry: The [`MetricsRegistry`][apiflask.metrics.MetricsRegistry] that
+            stores the request metrics. It will be created with the `METRICS_*` config when
+            first used.
+        tracer_provider: The OpenTelemetry tracer provider used to trace the apiflask
+            phases when the `TRACING` config is `True`. Defaults to `None` (use the
+            global tracer provider).
+        cache_backend: The backend used by [`cache`][apiflask.scaffold.APIScaffold.cache]
+            decorator, an instance of [`CacheBackend`][apiflask.caching.CacheBackend].
+            If not set, an in-process
+            [`MemoryCacheBackend`][apiflask.caching.MemoryCacheBackend] will be created
+            with the `RESPONSE_CACHE_MAX_ENTRIES` and `RESPONSE_CACHE_MAX_BYTES` config
+            when first used.
+        request_timings_callback: It stores the function object registered by
+            [`request_timings`][apiflask.APIFlask.request_timings].
+
+    *Version changed: 3.2.0*
+
+    - Add instance attribute `cache_backend`.
+    - Add instance attribute `request_timings_callback`.
+    - Add instance attribute `metrics_registry`.
+    - Add instance attribute `tracer_provider`.
+
     *Version changed: 1.0*
 
     - Add instance attribute `security_schemes` as an alias of config `SECURITY_SCHEMES`.
@@ -279,6 +342,7 @@ class APIFlask(APIScaffold, Flask):
         json_errors: bool = True,
         enable_openapi: bool = True,
         spec_plugins: list[BasePlugin] | None = None,
+        metrics_path: str | None = None,
         static_url_path: str | None = None,
         static_folder: str = 'static',
         static_host: str | None = None,
@@ -315,9 +379,16 @@ class APIFlask(APIScaffold, Flask):
             spec_plugins: List of apispec-compatible plugins (subclasses of `apispec.BasePlugin`),
                 defaults to `None`. The `MarshmallowPlugin` for apispec is already included
                 by default, so it doesn't need to be provided here.
+            metrics_path: The path to the metrics endpoint that returns the metrics in
+                Prometheus text format, defaults to `None` (disabled). The metrics are
+                collected when the `METRICS` config is `True`.
 
         Other keyword arguments are directly passed to `flask.Flask`.
 
+        *Version changed: 3.2.0*
+
+        - Add `metrics_path` parameter.
+
         *Version changed: 2.0.0*
 
         - Remove the deprecated `redoc_path` parameter.
@@ -360,18 +431,63 @@ class APIFlask(APIScaffold, Flask):
         self.openapi_blueprint_url_prefix = openapi_blueprint_url_prefix
         self.enable_openapi = enable_openapi
         self.json_errors = json_errors
+        self.metrics_path = metrics_path
 
         self.spec_callback: SpecCallbackType | None = None
         self.error_callback: ErrorCallbackType = self._error_handler
+        self.request_timings_callback: RequestTimingsCallbackType | None = None
         self.schema_name_resolver = self._schema_name_resolver
 
         self.spec_plugins: list[BasePlugin] = spec_plugins or []
         self._spec: dict | str | None = None
+        # the cached spec in dict, and the spec with the servers of each host
+        self._spec_dict: dict | None = None
+        self._auto_servers_cache: _BoundedCache[tuple[str, str, str], dict | str]
+        self._auto_servers_cache = _BoundedCache(32)
+        # the spec before the spec processor changes it, for the servers of each host
+        self._raw_spec_dict: dict | None = None
+        # the sub specs of the tags and blueprints in different formats
+        self._sub_spec_cache: dict[tuple[str, str], dict | str] = {}
+        # the spec loaded from the spec file in different formats
+        self._spec_file_cache: dict[str, dict | str] = {}
+        # the last spec and the hash of the content written by SYNC_LOCAL_SPEC
+        self._synced_spec: dict | str | None = None
+        self._synced_spec_digest: bytes | None = None
+        self._spec_sync_lock = threading.Lock()
+        self._spec_sync_thread: threading.Thread | None = None
+        # the compiled templates of the API docs pages and the config names they use
+        self._docs_templates: dict[str, tuple[Template, list[str]]] = {}
+        # the rendered API docs pages and their ETags
+        self._docs_page_cache: _BoundedCache[str, tuple[str, str]] = _BoundedCache(32)
+        self._pagination_url_templates: _BoundedCache[t.Hashable, str | None] = _BoundedCache(
+            _PAGE_URL_TEMPLATES_MAXSIZE
+        )
+        self.cache_backend: CacheBackend | None = None
+        self.metrics_registry: MetricsRegistry | None = None
+        self.tracer_provider: t.Any | None = None
         self._auth_blueprints: dict[str, t.Dict[str, t.Any]] = {}
         self._auths: set[HTTPAuthType | MultiAuth] = set()
 
+        # the OpenAPI routes of the config are registered with the first app context
+        self._config_routes_registered = False
+        self._config_routes_lock = threading.Lock()
         self._register_openapi_blueprint()
+        self._register_metrics_blueprint()
         self._register_error_handlers()
+        self.before_request(start_request_metrics)
+        self.before_request(start_request_timing)
+        self.before_request(start_request_tracing)
+        self.before_request(start_request_profiling)
+        # the after request functions are called in the reverse order of registration,
+        # so the compression runs first, then the profiling, timing and metrics
+        self.after_request(record_request_metrics)
+        self.after_request(finish_request_timing)
+        self.after_request(finish_request_profiling)
+        self.teardown_request(reset_request_metrics)
+        self.teardown_request(reset_request_timing)
+        self.teardown_request(reset_request_tracing)
+        self.teardown_request(reset_request_profiling)
+        self.after_request(compress_response)
 
     def _register_error_handlers(self) -> None:
         """Register default error handlers for HTTPError and WerkzeugHTTPException.
@@ -383,6 +499,8 @@ class APIFlask(APIScaffold, Flask):
 
         @self.errorhandler(HTTPError)  # type: ignore
         def handle_http_errors(error: HTTPError) -> ResponseReturnValueType:
+            if isinstance(error, _ValidationError):
+                mark_request_failure('validation')
             return self.error_callback(error)
 
         if self.json_errors:
@@ -553,6 +671,9 @@ class APIFlask(APIScaffold, Flask):
                 )
 
         if self.docs_path:
+            from .ui_templates import swagger_ui_oauth2_redirect_template
+            from .ui_templates import ui_templates
+
             if self.docs_ui not in ui_templates:
                 valid_values = list(ui_templates.keys())
                 raise ValueError(
@@ -572,11 +693,26 @@ class APIFlask(APIScaffold, Flask):
                     else:
                         docs_oauth2_redirect_path = self.docs_oauth2_redirect_path
 
-                return render_template_string(
+                # the tag specs, selected with the spec query argument
+                spec_name = spec_url = None
+                sub_specs = []
+                # the sub spec route is registered if the config is set before the first context
+                if self.config['SUB_SPECS'] and 'openapi.sub_spec' in self.view_functions:
+                    sub_specs = self._get_sub_spec_names()
+                    spec_name = request.args.get('spec')
+                    if spec_name:
+                        spec_url = url_for('openapi.sub_spec', name=spec_name)
+
+                return self._render_docs_page(
+                    self.docs_ui,
                     ui_templates[self.docs_ui],
                     title=self.title,
                     version=self.version,
                     oauth2_redirect_path=docs_oauth2_redirect_path,
+                    spec_url=spec_url,
+                    spec_name=spec_name,
+                    sub_specs=sub_specs,
+                    assets=get_docs_asset_urls(),
                 )
 
             if self.docs_ui == 'swagger-ui':
@@ -584,12 +720,136 @@ class APIFlask(APIScaffold, Flask):
 
                     @bp.route(self.docs_oauth2_redirect_path)
                     @self._apply_decorators(config_name='SWAGGER_UI_OAUTH_REDIRECT_DECORATORS')
-                    def swagger_ui_oauth_redirect() -> str:
-                        return render_template_string(swagger_ui_oauth2_redirect_template)
+                    def swagger_ui_oauth_redirect() -> Response:
+                        return self._render_docs_page(
+                            'swagger-ui-oauth2-redirect', swagger_ui_oauth2_redirect_template
+                        )
 
         if self.enable_openapi and (self.spec_path or self.docs_path):
             self.register_blueprint(bp)
 
+    def _render_docs_page(self, name: str, source: str, **context: t.Any) -> Response:
+        """Render the API docs page with the template source, or get it from the cache.
+
+        The template is compiled on the first call. The rendered page is cached with
+        the context, the config values used by the template, and the script root of the
+        request, so the page is rendered again when any of them changes. The response
+        has an ETag and the `Cache-Control` header of the `DOCS_CACHE_CONTROL` config,
+        and it's a 304 response if the ETag matches the `If-None-Match` header.
+
+        *Version added: 3.2.0*
+        """
+        if name not in self._docs_templates:
+            config_names = sorted(set(re.findall(r'config\.([A-Z_]+)', source)))
+            self._docs_templates[name] = (self.jinja_env.from_string(source), config_names)
+        template, config_names = self._docs_templates[name]
+        key = repr(
+            [
+                name,
+                request.script_root,
+                sorted(context.items()),
+                [self.config.get(config_name) for config_name in config_names],
+            ]
+        )
+        cached = self._docs_page_cache.get(key)
+        if cached is None:
+            page = render_template(template, **context)
+            etag = hashlib.sha256(page.encode()).hexdigest()
+            self._docs_page_cache.set(key, (page, etag))
+        else:
+            page, etag = cached
+        response = self.response_class(page, mimetype='text/html')
+        response.set_etag(etag)
+        cache_control = self.config['DOCS_CACHE_CONTROL']
+        if cache_control:
+            response.headers['Cache-Control'] = cache_control
+        response.make_conditional(request)
+        return response
+
+    def _register_config_routes(self) -> None:
+        """Register the OpenAPI routes enabled by the `SUB_SPECS` and `DOCS_ASSETS_FOLDER` config.
+
+        The config is usually set after the app is created, so these routes are
+        registered when the first application context or request context is pushed
+        (e.g., the first request, the `flask routes` and `flask spec` commands, or
+        `app.app_context()`) instead of in `_register_openapi_blueprint`.
+
+        *Version added: 3.2.0*
+        """
+        if not self.enable_openapi:
+            return
+        prefix = self.openapi_blueprint_url_prefix
+
+        def add_url_rule(rule: str, view_func: t.Callable) -> None:
+            if prefix is not None:
+                rule = '/'.join((prefix.rstrip('/'), rule.lstrip('/')))
+            self.add_url_rule(rule, f'openapi.{view_func.__name__}', view_func)
+
+        if self.spec_path and self.config['SUB_SPECS']:
+
+            @self._apply_decorators(config_name='SPEC_DECORATORS')
+            def sub_spec(name: str):
+                if not self.config['SUB_SPECS']:
+                    raise HTTPError(404)
+                spec_format = self.config['SPEC_FORMAT']
+                sub_spec = self._get_sub_spec(name, spec_format)
+                if sub_spec is None:
+                    raise HTTPError(404)
+                if spec_format == 'json':
+                    response = jsonify(sub_spec)
+                    response.mimetype = self.config['JSON_SPEC_MIMETYPE']
+                    return response
+                return sub_spec, 200, {'Content-Type': self.config['YAML_SPEC_MIMETYPE']}
+
+            spec_path_base, spec_path_extension = os.path.splitext(self.spec_path)
+            add_url_rule(f'{spec_path_base}/<name>{spec_path_extension}', sub_spec)
+
+        if self.docs_path and self.config['DOCS_ASSETS_FOLDER'] is not None:
+
+            @self._apply_decorators(config_name='DOCS_DECORATORS')
+            def docs_asset(digest: str, filename: str) -> Response:
+                return send_docs_asset(digest, filename)
+
+            add_url_rule(f'{self.docs_path.rstrip("/")}/assets/<digest>/<filename>', docs_asset)
+
+    def create_url_adapter(self, request: Request | None) -> MapAdapter | None:
+        """Register the routes enabled by the config before the first URL adapter is
+        created, so they are available to the first request, `url_for`, and the
+        `flask routes` and `flask spec` commands.
+
+        *Version added: 3.2.0*
+        """
+        if not self._config_routes_registered:
+            with self._config_routes_lock:
+                if not self._config_routes_registered:
+                    self._config_routes_registered = True
+                    self._register_config_routes()
+        return super().create_url_adapter(request)
+
+    def _register_metrics_blueprint(self) -> None:
+        """Register a blueprint for the metrics endpoint.
+
+        The name of the blueprint is "metrics". The endpoint returns the request metrics
+        in Prometheus text format.
+
+        *Version added: 3.2.0*
+        """
+        if not self.metrics_path:
+            return
+
+        bp = Blueprint('metrics', __name__)
+
+        @bp.route(self.metrics_path)
+        @self._apply_decorators(config_name='METRICS_DECORATORS')
+        def metrics():
+            return (
+                get_metrics_registry().to_prometheus(),
+                200,
+                {'Content-Type': PROMETHEUS_CONTENT_TYPE},
+            )
+
+        self.register_blueprint(bp)
+
     def _get_spec(self, spec_format: str | None = None, force_update: bool = False) -> dict | str:
         """Get the current OAS document file.
 
@@ -600,7 +860,9 @@ class APIFlask(APIScaffold, Flask):
 
         If the config `SYNC_LOCAL_SPEC` is `True`, the local spec
         specified in config `LOCAL_SPEC_PATH` will be automatically updated
-        when the spec changes.
+        when the spec changes. The file is only written when the content changed,
+        atomically and with a lock shared by the processes, in a background thread
+        if the config `SYNC_LOCAL_SPEC_BACKGROUND` is `True`.
 
         Arguments:
             spec_format: The format of the spec file, one of `'json'`, `'yaml'`
@@ -622,37 +884,290 @@ class APIFlask(APIScaffold, Flask):
 
         - Add the `SPEC_PROCESSOR_PASS_OBJECT` config to control the argument type
           when calling the spec processor.
+
+        *Version changed: 3.2.0*
+
+        - Return the spec loaded from the `LOCAL_SPEC_PATH` file if the `SPEC_SOURCE`
+          config is `'file'` and `force_update` is not set.
+        - Only write the local spec file when the content changed, and write it atomically.
+        - The cached spec is shared by all the hosts, the `servers` field of the
+          `AUTO_SERVERS` config is added for the host of the current request.
+          The spec processor is called with the `servers` field of each host of the
+          `SERVER_NAME` and `AUTO_SERVERS_HOSTS` config.
         """
         if spec_format is None:
             spec_format = self.config['SPEC_FORMAT']
+        spec_source = self.config['SPEC_SOURCE']
+        if spec_source not in ('app', 'file'):
+            raise ValueError(
+                f"The SPEC_SOURCE config should be one of 'app' and 'file', got {spec_source!r}."
+            )
+        if spec_source == 'file' and not force_update:
+            spec = self._get_spec_from_file(spec_format)
+            return self._add_auto_servers(spec, self._spec_file_cache['json'])  # type: ignore
         if self._spec is None or force_update:
             spec_object: APISpec = self._generate_spec()
+            self._raw_spec_dict = None
+            self._auto_servers_cache.clear()
+            self._sub_spec_cache.clear()
             if self.spec_callback:
-                if self.config['SPEC_PROCESSOR_PASS_OBJECT']:
-                    self._spec = self.spec_callback(
-                        spec_object  # type: ignore
-                    ).to_dict()
-                else:
-                    self._spec = self.spec_callback(spec_object.to_dict())
+                url_root = self._get_auto_servers_url()
+                if url_root is not None and not self._is_auto_servers_host():
+                    url_root = None
+                self._spec = self._process_spec(spec_object, url_root)
+                if url_root is not None:
+                    # the spec of the host, the cached spec is shared by all the hosts
+                    self._auto_servers_cache.set(('', url_root, 'json'), self._spec)
+                    self._spec = {k: v for k, v in self._spec.items() if k != 'servers'}
             else:
                 self._spec = spec_object.to_dict()
+            self._spec_dict = self._spec  # type: ignore
+            spec_profile = get_spec_profile()
+            if spec_profile is not None:
+                spec_profile.add_components(self._spec_dict)  # type: ignore
             if spec_format in ['yml', 'yaml']:
                 from apispec.yaml_utils import dict_to_yaml
 
                 self._spec = dict_to_yaml(self._spec)  # type: ignore
-        # sync local spec
-        if self.config['SYNC_LOCAL_SPEC']:
+        # sync local spec, the spec file is a build artifact if the spec source is file
+        if self.config['SYNC_LOCAL_SPEC'] and spec_source == 'app':
             spec_path = self.config['LOCAL_SPEC_PATH']
             if spec_path is None:
                 raise TypeError('The spec path (LOCAL_SPEC_PATH) should be a valid path string.')
-            spec: str
+            # skip the cached spec that was already synced
+            if self._synced_spec is not self._spec:
+                self._synced_spec = self._spec
+                args = (self._spec, spec_path, spec_format)
+                if self.config['SYNC_LOCAL_SPEC_BACKGROUND']:
+                    self._spec_sync_thread = threading.Thread(
+                        target=self._sync_local_spec, args=args, daemon=True
+                    )
+                    self._spec_sync_thread.start()
+                else:
+                    self._sync_local_spec(*args)
+        return self._add_auto_servers(self._spec, self._spec_dict)  # type: ignore
+
+    def _get_auto_servers_url(self) -> str | None:
+        """Get the URL of the `servers` field added by the `AUTO_SERVERS` config."""
+        if self.servers or not self.config['AUTO_SERVERS'] or not has_request_context():
+            return None
+        return request.url_root
+
+    def _is_auto_servers_host(self) -> bool:
+        """Check if the spec of the current host can be processed and cached.
+
+        The host comes from the request, so only the host of the `SERVER_NAME`
+        config and the hosts of the `AUTO_SERVERS_HOSTS` config are cached, to
+        keep the cache from being filled with arbitrary `Host` headers.
+        """
+        hosts = list(self.config['AUTO_SERVERS_HOSTS'] or [])
+        if self.config['SERVER_NAME']:
+            hosts.append(self.config['SERVER_NAME'])
+        return bool(hosts) and host_is_trusted(request.host, hosts)
+
+    def _process_spec(self, spec_object: APISpec | None, url_root: str | None) -> dict:
+        """Call the spec processor, with the `servers` field of the `url_root` if set.
+
+        The spec before the processor is kept in dict for the `AUTO_SERVERS` config,
+        so the spec of another host is processed without generating the spec again.
+        """
+        assert self.spec_callback is not None
+        if self.config['SPEC_PROCESSOR_PASS_OBJECT']:
+            if spec_object is None:
+                spec_object = self._generate_spec()
+            if url_root is not None:
+                spec_object.options['servers'] = [{'url': url_root}]
+            return profiled(  # type: ignore
+                'spec_processor', None, self.spec_callback, spec_object
+            ).to_dict()
+        if spec_object is None and self._raw_spec_dict is None:
+            # the spec was generated without the AUTO_SERVERS config
+            spec_object = self._generate_spec()
+        spec: dict
+        if spec_object is not None:
+            spec = spec_object.to_dict()
+            if not self.servers and self.config['AUTO_SERVERS']:
+                self._raw_spec_dict = copy.deepcopy(spec)
+        else:
+            spec = copy.deepcopy(self._raw_spec_dict)  # type: ignore
+        if url_root is not None:
+            spec = _insert_servers(spec, url_root)
+        return profiled('spec_processor', None, self.spec_callback, spec)  # type: ignore
+
+    def _add_auto_servers(
+        self, spec: dict | str, spec_dict: dict, spec_name: str = ''
+    ) -> dict | str:
+        """Add the `servers` field for the host of the current request.
+
+        The spec is cached without the `servers` field of the `AUTO_SERVERS` config,
+        so it's generated once for all the hosts. The JSON spec is a shallow copy
+        with the `servers` field, and the YAML spec of each host is cached.
+        The `spec_name` is the name of the sub spec, empty for the main spec.
+
+        The spec processor is called with the `servers` field of each host, and
+        the processed spec of each host is cached. For the hosts that don't match
+        the `SERVER_NAME` or `AUTO_SERVERS_HOSTS` config, the YAML spec and the
+        processed spec are returned without the `servers` field instead.
+        """
+        url_root = self._get_auto_servers_url()
+        if url_root is None:
+            return spec
+        spec_format = 'json' if isinstance(spec, dict) else 'yaml'
+        processed = not spec_name and self.spec_callback and self.config['SPEC_SOURCE'] == 'app'
+        if not processed:
+            # the servers added by the spec processor
+            if 'servers' in spec_dict:
+                return spec
             if spec_format == 'json':
-                spec = json.dumps(self._spec, indent=self.config['LOCAL_SPEC_JSON_INDENT'])
-            else:
-                spec = str(self._spec)
-            with open(spec_path, 'w') as f:
-                f.write(spec)
-        return self._spec  # type: ignore
+                return _insert_servers(spec_dict, url_root)
+        if not self._is_auto_servers_host():
+            # the cached spec without the servers of the host
+            return spec
+        key = (spec_name, url_root, spec_format)
+        cached = self._auto_servers_cache.get(key)
+        if cached is not None:
+            return cached
+        host_spec: dict | str
+        if spec_format == 'yaml':
+            from apispec.yaml_utils import dict_to_yaml
+
+            json_spec = self._add_auto_servers(spec_dict, spec_dict, spec_name)
+            host_spec = dict_to_yaml(json_spec)  # type: ignore
+        else:
+            host_spec = self._process_spec(None, url_root)
+        self._auto_servers_cache.set(key, host_spec)
+        return host_spec
+
+    def _get_sub_spec(self, name: str, spec_format: str) -> dict | str | None:
+        """Get the spec of a tag or a blueprint.
+
+        The sub spec only contains the operations of the tag (or the blueprint if
+        no tag matches the name) and the components they reference. It's built from
+        the main spec on the first call and cached until the main spec is regenerated.
+
+        Returns `None` if no tag or blueprint matches the name.
+
+        *Version added: 3.2.0*
+        """
+        spec_dict = self._get_spec_dict()
+        sub_spec_dict: dict | None = self._sub_spec_cache.get((name, 'json'))  # type: ignore
+        if sub_spec_dict is None:
+            sub_spec_dict = self._make_sub_spec(spec_dict, name)
+            if sub_spec_dict is None:
+                return None
+            self._sub_spec_cache[(name, 'json')] = sub_spec_dict
+        sub_spec: dict | str = sub_spec_dict
+        if spec_format != 'json':
+            if (name, 'yaml') not in self._sub_spec_cache:
+                from apispec.yaml_utils import dict_to_yaml
+
+                self._sub_spec_cache[(name, 'yaml')] = dict_to_yaml(sub_spec_dict)
+            sub_spec = self._sub_spec_cache[(name, 'yaml')]
+        return self._add_auto_servers(sub_spec, sub_spec_dict, spec_name=name)
+
+    def _make_sub_spec(self, spec: dict, name: str) -> dict | None:
+        from .openapi import get_spec_tags
+        from .openapi import get_sub_spec
+
+        if name in get_spec_tags(spec):
+            return get_sub_spec(
+                spec, lambda path, method, operation: name in operation.get('tags', ())
+            )
+
+        blueprint = self.blueprints.get(name)
+        if (
+            blueprint is None
+            or name in ('openapi', 'metrics')
+            or not getattr(blueprint, 'enable_openapi', True)
+        ):
+            return None
+        # the operations of the blueprint endpoints
+        blueprint_operations = set()
+        for rule in self.url_map.iter_rules():
+            if rule.endpoint.rsplit('.', 1)[0] == name:
+                path = re.sub(r'<([^<:]+:)?', '{', rule.rule).replace('>', '}')
+                for method in rule.methods or ():
+                    blueprint_operations.add((path, method.lower()))
+        return get_sub_spec(
+            spec, lambda path, method, operation: (path, method) in blueprint_operations
+        )
+
+    def _get_sub_spec_names(self) -> list[str]:
+        """Get the names of the sub specs for the docs UI selector (the tag names)."""
+        from .openapi import get_spec_tags
+
+        return get_spec_tags(self._get_spec_dict())
+
+    def _get_spec_dict(self) -> dict:
+        """Get the cached main spec in dict, without the servers of `AUTO_SERVERS`."""
+        # generate or load the main spec
+        self._get_spec('json')
+        if self.config['SPEC_SOURCE'] == 'file':
+            return self._spec_file_cache['json']  # type: ignore
+        return self._spec_dict  # type: ignore
+
+    def _sync_local_spec(self, spec: dict | str, spec_path: str, spec_format: str) -> None:
+        """Write the spec to the local spec file if the content changed."""
+        from .spec_file import write_spec_file
+
+        content: str
+        if spec_format == 'json':
+            content = self.json.dumps(spec, indent=self.config['LOCAL_SPEC_JSON_INDENT'])
+        else:
+            content = str(spec)
+        data = content.encode()
+        digest = hashlib.sha256(data).digest()
+        with self._spec_sync_lock:
+            if digest == self._synced_spec_digest:
+                return
+            write_spec_file(spec_path, data)
+            self._synced_spec_digest = digest
+
+    def _get_spec_from_file(self, spec_format: str) -> dict | str:
+        if not self._spec_file_cache:
+            self.load_spec_file()
+        if spec_format not in self._spec_file_cache:
+            from apispec.yaml_utils import dict_to_yaml
+
+            self._spec_file_cache[spec_format] = dict_to_yaml(
+                self._spec_file_cache['json']  # type: ignore
+            )
+        return self._spec_file_cache[spec_format]
+
+    def load_spec_file(self) -> dict:
+        """Load the prebuilt spec from the `LOCAL_SPEC_PATH` file.
+
+        When the `SPEC_SOURCE` config is `'file'`, the spec file is loaded once on the
+        first spec request and served instead of the spec generated from the app. The
+        fingerprint saved in the file is compared with the routes and schemas of the
+        app, see the `SPEC_FINGERPRINT_MISMATCH` config for the handling of the mismatch.
+
+        Call this method after all the routes are registered (e.g., at the end of the
+        application factory) to check the spec file when the application starts:
+
+        ```python
+        app.config['SPEC_SOURCE'] = 'file'
+        app.config['LOCAL_SPEC_PATH'] = 'openapi.json'
+        # register the routes and blueprints...
+        app.load_spec_file()
+        ```
+
+        *Version added: 3.2.0*
+        """
+        from .spec_file import FINGERPRINT_KEY
+        from .spec_file import check_spec_fingerprint
+        from .spec_file import load_spec_file
+
+        spec_path = self.config['LOCAL_SPEC_PATH']
+        if spec_path is None:
+            raise TypeError('The spec path (LOCAL_SPEC_PATH) should be a valid path string.')
+        spec = load_spec_file(spec_path)
+        fingerprint = spec.pop(FINGERPRINT_KEY, None)
+        check_spec_fingerprint(self, fingerprint, spec_path)
+        self._spec_file_cache = {'json': spec}
+        self._auto_servers_cache.clear()
+        self._sub_spec_cache.clear()
+        return spec
 
     def spec_processor(self, f: SpecCallbackType) -> SpecCallbackType:
         """A decorator to register a spec handler callback function.
@@ -683,6 +1198,27 @@ class APIFlask(APIScaffold, Flask):
         self.spec_callback = self.ensure_sync(f)
         return f
 
+    def request_timings(self, f: RequestTimingsCallbackType) -> RequestTimingsCallbackType:
+        """A decorator to register a callback function for the request timings.
+
+        The callback function will be called at the end of each request when the
+        `REQUEST_TIMING` config is `True`. It should accept a dict that maps the phase
+        names to the durations in milliseconds. The phases are `auth`,
+        `input-<location>` (e.g., `input-json`), `view`, `output`, and `total`.
+
+        Examples:
+
+        ```python
+        @app.request_timings
+        def log_timings(timings):
+            app.logger.info('%s %s', request.endpoint, timings)
+        ```
+
+        *Version added: 3.2.0*
+        """
+        self.request_timings_callback = f
+        return f
+
     @property
     def spec(self) -> dict | str:
         """Get the current OAS document file.
@@ -753,8 +1289,7 @@ class APIFlask(APIScaffold, Flask):
 
             if auth.name in auth_names:
                 warnings.warn(
-                    f"The auth scheme name '{auth.name}' has existed, "
-                    'so it will be overwritten.',
+                    f"The auth scheme name '{auth.name}' has existed, so it will be overwritten.",
                     stacklevel=2,
                 )
 
@@ -807,6 +1342,12 @@ class APIFlask(APIScaffold, Flask):
     def _generate_spec(self) -> APISpec:
         """Generate the spec, return an instance of `apispec.APISpec`.
 
+        *Version changed: 3.2.0*
+
+        - Compute the schema conversions in a thread or process pool
+          when the `SPEC_PARALLEL` config is set.
+        - Reuse the schema conversions saved in the `SCHEMA_CACHE_PATH` directory.
+
         *Version changed: 1.3.0*
 
         - Support setting custom response content type.
@@ -828,29 +1369,96 @@ class APIFlask(APIScaffold, Flask):
 
         - Add automatic 404 response support.
         """
-        # Track registered schema classes to avoid duplicates
-        # Maps schema class id to registered name
-        registered_schema_classes: dict[int, str] = {}
+        cache = None
+        if self.config['SCHEMA_CACHE_PATH'] is not None:
+            from .schema_cache import SchemaCache
+
+            cache = SchemaCache(
+                self.config['SCHEMA_CACHE_PATH'], self.config['SCHEMA_CACHE_MAX_SIZE']
+            )
+        conversions = None
+        if self.config['SPEC_PARALLEL'] is not None:
+            conversions = compute_schema_conversions(
+                [
+                    conversion
+                    for conversion in self._collect_schema_conversions()
+                    if cache is None or not cache.has(*conversion)
+                ],
+                self.config['SPEC_PARALLEL'],
+                self.config['SPEC_PARALLEL_WORKERS'],
+            )
+        # the components are still registered in the order of the rules, so the schema
+        # names are the same as the names of the sequential generation
+        with use_schema_cache(cache), use_schema_conversions(conversions):
+            spec = self._build_spec()
+        if cache is not None:
+            cache.prune()
+        return spec
+
+    def _collect_schema_conversions(self) -> list[tuple[str, t.Any, str | None]]:
+        """Collect the schema conversions of the view functions for the `SPEC_PARALLEL` config.
+
+        *Version added: 3.2.0*
+        """
+        conversions: list[tuple[str, t.Any, str | None]] = []
+        base_schema = self.config['BASE_RESPONSE_SCHEMA']
+        if isinstance(base_schema, type):
+            conversions.append(('json_schema', base_schema, None))
+        for rule in self.url_map.iter_rules():
+            if rule.endpoint in default_bypassed_endpoints:
+                continue
+            view_func = self.view_functions[rule.endpoint]
+            view_specs = list(getattr(view_func, '_method_spec', {}).values())
+            if hasattr(view_func, '_spec'):
+                view_specs.append(view_func._spec)  # type: ignore
+            for view_spec in view_specs:
+                for schema, location in view_spec.get('args', []):
+                    conversions.append(('parameters', schema, location))
+                response = view_spec.get('response') or {}
+                if response.get('headers'):
+                    conversions.append(('parameters', response['headers'], 'headers'))
+                # the marshmallow schemas are converted by the marshmallow plugin of the spec
+                for schema in (view_spec.get('body'), response.get('schema')):
+                    if schema is None or isinstance(schema, dict):
+                        continue
+                    try:
+                        schema_type = registry.detect_schema_type(schema)
+                    except ValueError:
+                        continue
+                    if schema_type != 'marshmallow':
+                        conversions.append(('json_schema', schema, None))
+        return conversions
+
+    def _build_spec(self) -> APISpec:
+        """Build the spec with the routes, the schemas, and the configuration."""
+        # Track registered schemas to avoid duplicates
+        schema_names = SchemaNameIndex()
 
         kwargs: dict = {}
+        # the servers of the AUTO_SERVERS config are added for each request in `_get_spec`
         if self.servers:
             kwargs['servers'] = self.servers
-        else:
-            if self.config['AUTO_SERVERS'] and has_request_context():
-                kwargs['servers'] = [{'url': request.url_root}]
         if self.external_docs:
             kwargs['externalDocs'] = self.external_docs
 
-        # Keep marshmallow plugin for backwards compatibility
-        try:
-            self._ma_plugin: MarshmallowPlugin = MarshmallowPlugin(
-                schema_name_resolver=self.schema_name_resolver  # type: ignore
-            )
-            spec_plugins: list[BasePlugin] = [self._ma_plugin, *self.spec_plugins]
-        except ImportError:
-            # If marshmallow is not available, just use custom plugins
-            self._ma_plugin = None  # type: ignore
-            spec_plugins = self.spec_plugins
+        # apispec is imported here so the apps that never generate the spec don't pay for it
+        from apispec import APISpec
+
+        # Keep marshmallow plugin for backwards compatibility, the app can't use
+        # marshmallow schemas if marshmallow was never imported (e.g., a Pydantic-only app)
+        self._ma_plugin: MarshmallowPlugin | None = None
+        spec_plugins: list[BasePlugin] = self.spec_plugins
+        if 'marshmallow' in sys.modules:
+            try:
+                from apispec.ext.marshmallow import MarshmallowPlugin
+
+                self._ma_plugin = MarshmallowPlugin(
+                    schema_name_resolver=self.schema_name_resolver  # type: ignore
+                )
+                spec_plugins = [self._ma_plugin, *self.spec_plugins]
+            except ImportError:  # pragma: no cover
+                # If marshmallow is not available, just use custom plugins
+                pass
 
         spec: APISpec = APISpec(
             title=self.title,
@@ -862,9 +1470,11 @@ class APIFlask(APIScaffold, Flask):
             **kwargs,
         )
 
-        # configure flask-marshmallow URL types if marshmallow plugin is available
-        if self._ma_plugin is not None:
-            # configure flask-marshmallow URL types
+        # configure flask-marshmallow URL types if marshmallow plugin is available,
+        # the schemas can't use these fields if flask-marshmallow was never imported
+        fields = sys.modules.get('flask_marshmallow.fields')
+        sqla = sys.modules.get('flask_marshmallow.sqla')
+        if self._ma_plugin is not None and fields is not None:
             self._ma_plugin.converter.field_mapping[fields.URLFor] = ('string', 'url')  # type: ignore
             self._ma_plugin.converter.field_mapping[fields.AbsoluteURLFor] = (  # type: ignore
                 'string',
@@ -976,14 +1586,20 @@ class APIFlask(APIScaffold, Flask):
                             blueprint = self.blueprints[blueprint_name]
                             operation_tags = get_operation_tags(blueprint, blueprint_name)  # type: ignore
 
+                start_spec_operation(f'{method} {rule.rule}')
+
                 # operation parameters
                 # Process parameters using schema adapters to handle both marshmallow and Pydantic
                 parameters = []
                 for schema, location in view_func._spec.get('args', []):
                     try:
                         # Use schema_to_parameters for proper handling of different schema types
-                        schema_params = openapi_helper.schema_to_parameters(
-                            schema, location=location
+                        schema_params = profiled(
+                            'parameters',
+                            schema,
+                            openapi_helper.schema_to_parameters,
+                            schema,
+                            location=location,
                         )
                         parameters.extend(schema_params)
                     except Exception:
@@ -1027,7 +1643,7 @@ class APIFlask(APIScaffold, Flask):
                 if operation_id is None:
                     if self.config['AUTO_OPERATION_ID']:
                         operation['operationId'] = (
-                            f"{method.lower()}_{rule.endpoint.replace('.', '_')}"
+                            f'{method.lower()}_{rule.endpoint.replace(".", "_")}'
                         )
                 else:
                     operation['operationId'] = operation_id
@@ -1052,7 +1668,7 @@ class APIFlask(APIScaffold, Flask):
                     headers = view_func._spec.get('response')['headers']
                     self._add_response(
                         spec,
-                        registered_schema_classes,
+                        schema_names,
                         operation,
                         status_code,
                         schema,
@@ -1070,13 +1686,23 @@ class APIFlask(APIScaffold, Flask):
                     if not view_func._spec.get('responses') and self.config['AUTO_200_RESPONSE']:
                         self._add_response(
                             spec,
-                            registered_schema_classes,
+                            schema_names,
                             operation,
                             '200',
                             {},
                             self.config['SUCCESS_DESCRIPTION'],
                         )
 
+                # add conditional request responses
+                response_info = view_func._spec.get('response')
+                if response_info and response_info.get('etag'):
+                    self._add_etag_responses(spec, schema_names, operation, method, response_info)
+
+                # document the cache headers
+                cache_info = view_func._spec.get('cache')
+                if cache_info:
+                    self._add_cache_headers(operation, cache_info, 'auth' in view_func._spec)
+
                 # add validation error response
                 if self.config['AUTO_VALIDATION_ERROR_RESPONSE'] and (
                     view_func._spec.get('body') or view_func._spec.get('args')
@@ -1090,7 +1716,7 @@ class APIFlask(APIScaffold, Flask):
                     schema: SchemaType = self.config['VALIDATION_ERROR_SCHEMA']  # type: ignore
                     self._add_response_with_schema(
                         spec,
-                        registered_schema_classes,
+                        schema_names,
                         operation,
                         status_code,
                         schema,
@@ -1115,7 +1741,7 @@ class APIFlask(APIScaffold, Flask):
                     schema: SchemaType = self.config['HTTP_ERROR_SCHEMA']  # type: ignore
                     self._add_response_with_schema(
                         spec,
-                        registered_schema_classes,
+                        schema_names,
                         operation,
                         status_code,
                         schema,
@@ -1129,7 +1755,7 @@ class APIFlask(APIScaffold, Flask):
                     schema: SchemaType = self.config['HTTP_ERROR_SCHEMA']  # type: ignore
                     self._add_response_with_schema(
                         spec,
-                        registered_schema_classes,
+                        schema_names,
                         operation,
                         '404',
                         schema,
@@ -1170,7 +1796,7 @@ class APIFlask(APIScaffold, Flask):
                             schema: SchemaType = self.config['HTTP_ERROR_SCHEMA']  # type: ignore
                             self._add_response_with_schema(
                                 spec,
-                                registered_schema_classes,
+                                schema_names,
                                 operation,
                                 status_code,
                                 schema,
@@ -1180,7 +1806,7 @@ class APIFlask(APIScaffold, Flask):
                         else:  # add default response for other responses
                             self._add_response(
                                 spec,
-                                registered_schema_classes,
+                                schema_names,
                                 operation,
                                 status_code,
                                 {},
@@ -1210,8 +1836,13 @@ class APIFlask(APIScaffold, Flask):
                                 body_schema = body_schema_obj
                             elif is_schema_obj:
                                 # Register schema and get reference
-                                body_schema = self._register_schema_and_get_ref(
-                                    spec, registered_schema_classes, body_schema_obj
+                                body_schema = profiled(
+                                    'schemas',
+                                    body_schema_obj,
+                                    self._register_schema_and_get_ref,
+                                    spec,
+                                    schema_names,
+                                    body_schema_obj,
                                 )
                             else:
                                 # Fallback to inline schema for plain dicts or other types
@@ -1269,6 +1900,7 @@ class APIFlask(APIScaffold, Flask):
                 if operation_extensions:
                     for extension, value in operation_extensions.items():
                         operation[extension] = value
+                finish_spec_operation()
 
             # parameters
             path_arguments: t.Iterable = re.findall(r'<(([^<:]+:)?([^>]+))>', rule.rule)
@@ -1324,38 +1956,28 @@ class APIFlask(APIScaffold, Flask):
     def _register_schema_and_get_ref(
         self,
         spec: APISpec,
-        registered_schema_classes: dict[int, str],
+        schema_names: SchemaNameIndex,
         schema_obj: t.Any,
     ) -> dict[str, str]:
         """Register a schema and return its reference.
 
         Arguments:
             spec: The APISpec object
-            registered_schema_classes: Dictionary tracking registered schema classes
+            schema_names: The index of the registered schema names
             schema_obj: The schema object to register
 
         Returns:
             A dictionary with $ref key pointing to the registered schema
         """
-        # For classes (like Pydantic models), use the class itself
-        # For instances (like Marshmallow schemas), use the class
-        if isinstance(schema_obj, type):
-            schema_class_id = id(schema_obj)
-        else:
-            schema_class_id = id(schema_obj.__class__)
-
-        if schema_class_id in registered_schema_classes and not (
-            hasattr(schema_obj, 'partial') and schema_obj.partial
-        ):  # type: ignore
-            # Reuse the name from the first registration
-            schema_name = registered_schema_classes[schema_class_id]
-        else:
+        # Reuse the name from the first registration of the same schema
+        schema_name = schema_names.get(schema_obj)
+        if schema_name is None:
             # Get the schema name for registration
             schema_name = self.schema_name_resolver(schema_obj)
 
             # Handle name conflicts with different schema classes
             if schema_name in spec.components.schemas:
-                schema_name = get_unique_schema_name(spec, schema_name)
+                schema_name = schema_names.get_unique_name(spec, schema_name)
 
             # Register schema - convert to OpenAPI dict for non-marshmallow schemas
             try:
@@ -1380,16 +2002,17 @@ class APIFlask(APIScaffold, Flask):
                 # Fallback: try to register as-is
                 spec.components.schema(schema_name, schema=schema_obj)
 
-            # Track this schema class
-            registered_schema_classes[schema_class_id] = schema_name
+            # Track this schema
+            schema_names.add(schema_obj, schema_name)
 
         # Return reference
         return {'$ref': f'#/components/schemas/{schema_name}'}
 
+    @spec_phase('responses')
     def _add_response(
         self,
         spec: APISpec,
-        registered_schema_classes: dict[int, str],
+        schema_names: SchemaNameIndex,
         operation: dict,
         status_code: str,
         schema: SchemaType | dict,
@@ -1421,13 +2044,16 @@ class APIFlask(APIScaffold, Flask):
                 hasattr(schema, '__class__')
                 and hasattr(schema.__class__, '__name__')
                 and schema.__class__.__name__ != 'dict'
-                and not isinstance(schema, (FileSchema, EmptySchema))
+                and not _is_schema_instance(schema, 'FileSchema')
+                and not _is_schema_instance(schema, 'EmptySchema')
                 and not (isinstance(schema, dict) and '$ref' in schema)
             )
 
             if is_schema_obj:
                 # Register schema and get reference
-                schema = self._register_schema_and_get_ref(spec, registered_schema_classes, schema)
+                schema = profiled(
+                    'schemas', schema, self._register_schema_and_get_ref, spec, schema_names, schema
+                )
 
             # Wrap schema in array type if many=True
             if schema_adapter_many and isinstance(schema, dict) and '$ref' in schema:
@@ -1454,9 +2080,9 @@ class APIFlask(APIScaffold, Flask):
 
         operation['responses'][status_code] = {}
         if status_code != '204':
-            if isinstance(schema, FileSchema):
-                schema = {'type': schema.type, 'format': schema.format}
-            elif isinstance(schema, EmptySchema):
+            if _is_schema_instance(schema, 'FileSchema'):
+                schema = {'type': schema.type, 'format': schema.format}  # type: ignore
+            elif _is_schema_instance(schema, 'EmptySchema'):
                 schema = {}
             operation['responses'][status_code]['content'] = {content_type: {'schema': schema}}
         operation['responses'][status_code]['description'] = description
@@ -1468,17 +2094,83 @@ class APIFlask(APIScaffold, Flask):
             operation['responses'][status_code]['links'] = links
         if headers_schema is not None:
             # Use openapi_helper to convert headers schema to parameters
-            header_params = openapi_helper.schema_to_parameters(headers_schema, location='headers')
+            header_params = profiled(
+                'parameters',
+                headers_schema,
+                openapi_helper.schema_to_parameters,
+                headers_schema,
+                location='headers',
+            )
             headers = {header['name']: header for header in header_params}
             for header in headers.values():
                 header.pop('in', None)
                 header.pop('name', None)
             operation['responses'][status_code]['headers'] = headers
 
+    def _add_etag_responses(
+        self,
+        spec: APISpec,
+        schema_names: SchemaNameIndex,
+        operation: dict,
+        method: str,
+        response_info: dict[str, t.Any],
+    ) -> None:
+        """Add the `ETag` header and the conditional request responses to the operation.
+
+        *Version added: 3.2.0*
+        """
+        success_response = operation['responses'].get(str(response_info['status_code']))
+        if success_response is not None:
+            success_response.setdefault('headers', {})['ETag'] = {
+                'description': 'The entity tag of the response.',
+                'schema': {'type': 'string'},
+            }
+        if method == 'GET':
+            operation['responses']['304'] = {'description': get_reason_phrase(304)}
+        elif response_info['etag'] == 'version':
+            self._add_response_with_schema(
+                spec,
+                schema_names,
+                operation,
+                '412',
+                self.config['HTTP_ERROR_SCHEMA'],
+                'HTTPError',
+                get_reason_phrase(412),
+            )
+
+    def _add_cache_headers(
+        self, operation: dict, cache_info: dict[str, t.Any], auth_required: bool
+    ) -> None:
+        """Add the cache headers to the successful responses of the operation.
+
+        *Version added: 3.2.0*
+        """
+        vary = [
+            item if isinstance(item, str) else getattr(item, '__name__', repr(item))
+            for item in cache_info['vary']
+        ]
+        if auth_required and 'user' not in vary:
+            vary.append('user')
+        private = 'user' in vary
+        cache_control = f'{"private" if private else "public"}, max-age={cache_info["ttl"]}'
+        for status_code, response in operation['responses'].items():
+            if status_code != '200':
+                continue
+            headers = response.setdefault('headers', {})
+            headers['Cache-Control'] = {
+                'description': f'The response is cached for {cache_info["ttl"]} seconds, '
+                f'varies on: {", ".join(vary) or "nothing"}.',
+                'schema': {'type': 'string', 'example': cache_control},
+            }
+            headers['Age'] = {
+                'description': 'The age of the cached response in seconds.',
+                'schema': {'type': 'integer'},
+            }
+
     def _add_response_with_schema(
         self,
         spec: APISpec,
-        registered_schema_classes: dict[int, str],
+        schema_names: SchemaNameIndex,
         operation: dict,
         status_code: str,
         schema: OpenAPISchemaType,
@@ -1488,15 +2180,11 @@ class APIFlask(APIScaffold, Flask):
         """Add response with given schema to operation."""
         if isinstance(schema, type):
             schema = schema()
-            self._add_response(
-                spec, registered_schema_classes, operation, status_code, schema, description
-            )
+            self._add_response(spec, schema_names, operation, status_code, schema, description)
         elif isinstance(schema, dict):
             if schema_name not in spec.components.schemas:
                 spec.components.schema(schema_name, schema)
             schema_ref = {'$ref': f'#/components/schemas/{schema_name}'}
-            self._add_response(
-                spec, registered_schema_classes, operation, status_code, schema_ref, description
-            )
+            self._add_response(spec, schema_names, operation, status_code, schema_ref, description)
         else:
             raise TypeError(_bad_schema_message)
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import re
+import threading
+import typing as t
+from collections import Counter
+from io import BytesIO
+from time import perf_counter
+from urllib.parse import urlencode
+
+from flask import json
+from werkzeug.datastructures import FileStorage
+
+from .openapi import default_bypassed_endpoints
+from .openapi import get_argument
+from .testing import generate_example
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from flask.testing import FlaskClient
+    from werkzeug.routing import Rule
+
+    from .app import APIFlask
+
+BENCH_METHODS = ['GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE']
+# the methods benchmarked by default, others may change the data of the app
+SAFE_BENCH_METHODS = ['GET', 'HEAD']
+
+
+class BenchRequest:
+    """A request to benchmark, synthesized from the OpenAPI operation of a route.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        rule: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: t.Any = None,
+        content_type: str | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.method = method
+        self.rule = rule
+        self.url = url
+        self.headers = headers or {}
+        self.body = body
+        self.content_type = content_type
+
+    def __repr__(self) -> str:
+        return f'<BenchRequest {self.method} {self.url}>'
+
+    def open(self, client: FlaskClient) -> t.Any:
+        """Send the request with the test client and return the response."""
+        kwargs: dict[str, t.Any] = {'method': self.method, 'headers': self.headers}
+        if self.content_type == 'application/json':
+            kwargs['json'] = self.body
+        elif self.content_type in ('application/x-www-form-urlencoded', 'multipart/form-data'):
+            kwargs['data'] = _make_form_data(self.body)
+            kwargs['content_type'] = self.content_type
+        elif self.content_type is not None:
+            kwargs['data'] = json.dumps(self.body)
+            kwargs['content_type'] = self.content_type
+        return client.open(self.url, **kwargs)
+
+
+class BenchResult:
+    """The benchmark result of a request.
+
+    The durations are in seconds.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(
+        self,
+        request: BenchRequest,
+        latencies: list[float],
+        duration: float,
+        status_codes: Counter[str],
+    ) -> None:
+        self.request = request
+        self.latencies = sorted(latencies)
+        self.duration = duration
+        self.status_codes = status_codes
+
+    @property
+    def throughput(self) -> float:
+        """The requests per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    @property
+    def mean(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Get the latency percentile with the nearest-rank method."""
+        if not self.latencies:
+            return 0.0
+        rank = max(int(-(-percent * len(self.latencies) // 100)), 1)
+        return self.latencies[rank - 1]
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            'endpoint': self.request.endpoint,
+            'method': self.request.method,
+            'rule': self.request.rule,
+            'requests': len(self.latencies),
+            'throughput': self.throughput,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.latencies[-1] if self.latencies else 0.0,
+            'status_codes': dict(self.status_codes),
+        }
+
+
+def build_bench_requests(
+    app: APIFlask,
+    endpoints: list[str] | None = None,
+    headers: dict[str, str] | None = None,
+    methods: list[str] | None = None,
+) -> list[BenchRequest]:
+    """Synthesize a valid request for each route and method of the app.
+
+    The path, query, header, cookie parameters, and the request body are generated
+    from the schemas in the OpenAPI spec of the app (i.e., the input schemas of the
+    views). The values are deterministic: the examples, the default values, or the
+    simplest values that satisfy the constraints (e.g., `enum`, `minimum`, and
+    `minLength`).
+
+    Arguments:
+        app: The application instance.
+        endpoints: Only build the requests of the endpoints matching these glob patterns.
+        headers: The extra headers sent with all the requests (e.g., `Authorization`).
+        methods: The HTTP methods to benchmark, defaults to `GET` and `HEAD`. The
+            requests are handled by the real view functions, so only pass the other
+            methods (e.g., `POST`) when the data of the app can be changed. The
+            automatic `HEAD` method of the `GET` routes is skipped when `GET` is
+            benchmarked too.
+
+    *Version added: 3.2.0*
+    """
+    from fnmatch import fnmatchcase
+
+    selected_methods = [method.upper() for method in methods or SAFE_BENCH_METHODS]
+
+    spec: dict[str, t.Any] = app._get_spec('json')  # type: ignore
+    components = spec.get('components', {}).get('schemas', {})
+    bench_requests = []
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint in default_bypassed_endpoints or rule.endpoint.endswith('.static'):
+            continue
+        if endpoints and not any(fnmatchcase(rule.endpoint, pattern) for pattern in endpoints):
+            continue
+        path = re.sub(r'<([^<:]+:)?', '{', rule.rule).replace('>', '}')
+        rule_methods = rule.methods or set()
+        for method in BENCH_METHODS:
+            if method not in selected_methods or method not in rule_methods:
+                continue
+            operations = spec['paths'].get(path, {})
+            if method == 'HEAD':
+                if 'GET' in rule_methods and 'GET' in selected_methods:
+                    continue
+                # the HEAD requests are handled by the GET view
+                operation = operations.get('head', operations.get('get', {}))
+            else:
+                operation = operations.get(method.lower(), {})
+            bench_request = _build_request(rule, method, operation, components, headers or {})
+            if bench_request is not None:
+                bench_requests.append(bench_request)
+    return bench_requests
+
+
+def _build_request(
+    rule: Rule,
+    method: str,
+    operation: dict[str, t.Any],
+    components: dict[str, t.Any],
+    extra_headers: dict[str, str],
+) -> BenchRequest | None:
+    path_values: dict[str, t.Any] = {}
+    query: dict[str, t.Any] = {}
+    headers: dict[str, str] = {}
+    cookies: dict[str, str] = {}
+    parameters = {
+        (parameter['in'], parameter['name']): parameter
+        for parameter in operation.get('parameters', [])
+    }
+    for _, argument_type, argument_name in re.findall(r'<(([^<:]+:)?([^>]+))>', rule.rule):
+        key = ('path', argument_name)
+        parameters.setdefault(key, get_argument(argument_type, argument_name))
+        # the converters that are documented as plain strings
+        if argument_type.startswith('uuid'):
+            parameters[key] = {**parameters[key], 'schema': {'type': 'string', 'format': 'uuid'}}
+        elif argument_type.startswith('any('):
+            options = argument_type[4:].split(')')[0].split(',')
+            parameters[key] = {
+                **parameters[key],
+                'schema': {'enum': [option.strip().strip('\'"') for option in options]},
+            }
+
+    for (location, name), parameter in parameters.items():
+        # the optional parameters are omitted
+        if location != 'path' and not parameter.get('required'):
+            continue
+        value = generate_example(parameter.get('schema', {}), components)
+        if location == 'path':
+            path_values[name] = value
+        elif location == 'query':
+            query[name] = value
+        elif location == 'header':
+            headers[name] = _to_string(value)
+        elif location == 'cookie':
+            cookies[name] = _to_string(value)
+
+    try:
+        url = rule.build(path_values, append_unknown=False)
+    except Exception:  # pragma: no cover
+        url = None
+    if url is None:  # pragma: no cover
+        return None
+    url = url[1]
+    if query:
+        url += '?' + urlencode(
+            [
+                (name, _to_string(item))
+                for name, value in query.items()
+                for item in (value if isinstance(value, list) else [value])
+            ]
+        )
+    if cookies:
+        headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in cookies.items())
+    headers.update(extra_headers)
+
+    body = None
+    content_type = None
+    content = operation.get('requestBody', {}).get('content', {})
+    if content:
+        for content_type in (
+            'application/json',
+            'application/x-www-form-urlencoded',
+            'multipart/form-data',
+            *content,
+        ):
+            if content_type in content:
+                break
+        body = generate_example(content[content_type].get('schema', {}), components)
+    return BenchRequest(rule.endpoint, method, rule.rule, url, headers, body, content_type)
+
+
+def _to_string(value: t.Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _make_form_data(body: t.Any) -> t.Any:
+    """Replace the generated files with new file objects for each request."""
+    if not isinstance(body, dict):
+        return body
+    data: dict[str, t.Any] = {}
+    for name, value in body.items():
+        if isinstance(value, FileStorage):
+            data[name] = _copy_file(value)
+        elif isinstance(value, list):
+            data[name] = [
+                _copy_file(item) if isinstance(item, FileStorage) else _to_string(item)
+                for item in value
+            ]
+        elif value is not None:
+            data[name] = _to_string(value)
+    return data
+
+
+def _copy_file(file: FileStorage) -> tuple[BytesIO, str | None, str | None]:
+    # the generated files are BytesIO objects shared by the threads, so don't read them
+    stream = BytesIO(t.cast(BytesIO, file.stream).getvalue())
+    return stream, file.filename, file.content_type
+
+
+def run_bench(
+    app: APIFlask,
+    bench_requests: list[BenchRequest],
+    requests: int = 100,
+    threads: int = 1,
+    warmup: int = 5,
+) -> list[BenchResult]:
+    """Send the requests to the app with the test client and measure the latencies.
+
+    Each request is sent `requests` times, spread across the threads; each thread
+    uses its own test client.
+
+    Arguments:
+        app: The application instance.
+        bench_requests: The requests built with `build_bench_requests`.
+        requests: The number of times to send each request.
+        threads: The number of threads to send the requests concurrently.
+        warmup: The number of requests sent before measuring.
+
+    *Version added: 3.2.0*
+    """
+    return [_run_request(app, request, requests, threads, warmup) for request in bench_requests]
+
+
+def _run_request(
+    app: APIFlask, bench_request: BenchRequest, requests: int, threads: int, warmup: int
+) -> BenchResult:
+    client = app.test_client(use_cookies=False)
+    for _ in range(warmup):
+        bench_request.open(client)
+
+    thread_count = max(min(threads, requests), 1)
+    latencies: list[list[float]] = [[] for _ in range(thread_count)]
+    status_codes: list[Counter[str]] = [Counter() for _ in range(thread_count)]
+    barrier = threading.Barrier(thread_count)
+
+    def worker(index: int, count: int) -> None:
+        client = app.test_client(use_cookies=False)
+        thread_latencies = latencies[index]
+        thread_status_codes = status_codes[index]
+        barrier.wait()
+        for _ in range(count):
+            start = perf_counter()
+            try:
+                status_code = str(bench_request.open(client).status_code)
+            except Exception as error:
+                status_code = type(error).__name__
+            thread_latencies.append(perf_counter() - start)
+            thread_status_codes[status_code] += 1
+
+    counts = [
+        requests // thread_count + (1 if index < requests % thread_count else 0)
+        for index in range(thread_count)
+    ]
+    started_at = perf_counter()
+    if thread_count == 1:
+        worker(0, counts[0])
+    else:
+        workers = [
+            threading.Thread(target=worker, args=(index, count))
+            for index, count in enumerate(counts)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    duration = perf_counter() - started_at
+    return BenchResult(
+        bench_request,
+        [latency for thread_latencies in latencies for latency in thread_latencies],
+        duration,
+        sum(status_codes, Counter()),
+    )
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import typing as t
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+
+from flask import current_app
+from flask import g
+from flask import json
+from flask import request
+from pydantic import BaseModel
+
+
+class CacheEntry(t.NamedTuple):
+    """A cached response.
+
+    *Version added: 3.2.0*
+    """
+
+    body: bytes
+    status_code: int
+    headers: list[tuple[str, str]]
+    created_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        """The approximate size of this entry in bytes."""
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers)
+
+
+class CacheBackend(ABC):
+    """Base class for response cache backends used by
+    [`@app.cache`][apiflask.scaffold.APIScaffold.cache].
+
+    Implement this interface to store the cached responses somewhere else
+    (e.g., a stand-in for tests or a shared store).
+
+    *Version added: 3.2.0*
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for the given key, or `None` if it's missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store the entry for the given key."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for the given key if it exists."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the entries."""
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """An in-process LRU cache backend with TTL and byte-size eviction.
+
+    The least recently used entries are evicted when the number of entries
+    exceeds `max_entries` or the total size exceeds `max_bytes`.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Arguments:
+            max_entries: The maximum number of entries.
+            max_bytes: The maximum total size of the cached entries in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+
+
+_location_aliases: dict[str, str] = {
+    'querystring': 'query',
+    'view_args': 'path',
+}
+
+
+def _normalize_cache_data(data: t.Any) -> t.Any:
+    """Turn the validated input data into JSON-serializable data."""
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode='json')
+    return data
+
+
+VaryType = t.Union[str, t.Callable[[], t.Any]]
+
+
+def _get_user_key(user: t.Any, vary: t.Sequence[VaryType]) -> t.Any:
+    """Get a stable identity of the authenticated user for the cache key."""
+    if user is None or isinstance(user, (str, int, float, bool)):
+        return user
+    user_id = getattr(user, 'id', None)
+    if user_id is not None:
+        return user_id
+    # the callables of `vary` identify the user
+    if any(callable(item) for item in vary):
+        return None
+    raise ValueError(
+        f'The current user ({type(user).__name__!r}) has no stable identity for the cache '
+        "key, add an 'id' attribute or pass a callable to 'vary' that returns the identity."
+    )
+
+
+def make_cache_key(
+    vary: t.Sequence[VaryType], input_data: dict[str, t.Any], prefix: str | None = None
+) -> str:
+    """Make the cache key for the current request.
+
+    The validated input data of the given locations is used when it's available,
+    so the equivalent requests (e.g., `?page=1&per_page=10` and `?per_page=10&page=01`)
+    share the same cache entry. Otherwise, the raw request data will be used. The key
+    always includes the host URL of the request since the response may contain
+    absolute URLs.
+
+    Arguments:
+        vary: The request data that the response varies on, a list of `'query'`,
+            `'path'`, `'json'`, `'form'`, `'headers'`, `'cookies'`, and `'user'`,
+            or the callables that return a value for the key (e.g., the tenant).
+        input_data: The validated input data, keyed by location.
+        prefix: The key prefix, defaults to the request endpoint.
+
+    *Version added: 3.2.0*
+    """
+    input_data = {_location_aliases.get(key, key): value for key, value in input_data.items()}
+    parts: dict[str, t.Any] = {'host': request.host_url}
+    for index, location in enumerate(vary):
+        if callable(location):
+            parts[f'vary:{index}'] = location()
+            continue
+        location = _location_aliases.get(location, location)
+        if location == 'user':
+            parts['user'] = _get_user_key(g.get('flask_httpauth_user'), vary)
+        elif location in input_data:
+            parts[location] = _normalize_cache_data(input_data[location])
+        elif location == 'query':
+            parts['query'] = sorted(request.args.items(multi=True))
+        elif location == 'path':
+            parts['path'] = request.view_args
+        elif location == 'json':
+            parts['json'] = request.get_json(silent=True)
+        elif location == 'form':
+            parts['form'] = sorted(request.form.items(multi=True))
+        elif location == 'headers':
+            parts['headers'] = sorted(request.headers.items())
+        elif location == 'cookies':
+            parts['cookies'] = sorted(request.cookies.items(multi=True))
+        else:
+            raise ValueError(f'Unsupported cache vary value: {location!r}.')
+    raw_key = json.dumps(parts, sort_keys=True, default=str)
+    digest = hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+    return f'{prefix or request.endpoint}:{digest}'
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the cache backend of the current app.
+
+    An in-process [`MemoryCacheBackend`][apiflask.caching.MemoryCacheBackend] will
+    be created with the `RESPONSE_CACHE_MAX_ENTRIES` and `RESPONSE_CACHE_MAX_BYTES`
+    config if `app.cache_backend` is not set.
+
+    *Version added: 3.2.0*
+    """
+    app = current_app._get_current_object()  # type: ignore
+    backend: CacheBackend | None = getattr(app, 'cache_backend', None)
+    if backend is None:
+        backend = MemoryCacheBackend(
+            max_entries=app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+            max_bytes=app.config['RESPONSE_CACHE_MAX_BYTES'],
+        )
+        app.cache_backend = backend
+    return backend
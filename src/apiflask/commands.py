@@ -26,16 +26,60 @@ from flask.cli import with_appcontext
 @click.option(
     '--quiet', '-q', type=bool, is_flag=True, help='A flag to suppress printing output to stdout.'
 )
+@click.option(
+    '--profile',
+    is_flag=True,
+    help='Report the time spent on each phase, rule, and schema of the spec generation '
+    'and the size of each component schema to stderr.',
+)
+@click.option(
+    '--profile-top',
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help='The number of the rules, schemas, and components in the profile report.',
+)
 @with_appcontext
-def spec_command(format, output, indent, quiet):
+def spec_command(format, output, indent, quiet, profile, profile_top):
     """Output the OpenAPI spec to stdout or a file.
 
     Check out the docs for the detailed usage:
 
     https://apiflask.com/openapi/#the-flask-spec-command
     """
+    if profile:
+        from .spec_profile import spec_profiling
+
+        with spec_profiling() as spec_profile:
+            spec = _get_spec_for_command(format, profile)
+        _echo_spec_profile(spec_profile.to_dict(), profile_top)
+    else:
+        spec = _get_spec_for_command(format, profile)
+    _output_spec(spec, format, output, indent, quiet)
+
+
+def _get_spec_for_command(format, force_update):
+    spec_format = format or current_app.config['SPEC_FORMAT']
+    if current_app.config['SPEC_SOURCE'] == 'file':
+        # build the spec file from the app, with the fingerprint to check at runtime
+        from .spec_file import FINGERPRINT_KEY
+        from .spec_file import get_spec_fingerprint
+
+        spec = {
+            **current_app._get_spec('json', force_update=True),
+            FINGERPRINT_KEY: get_spec_fingerprint(current_app),
+        }
+        if spec_format != 'json':
+            from apispec.yaml_utils import dict_to_yaml
+
+            spec = dict_to_yaml(spec)
+    else:
+        spec = current_app._get_spec(spec_format, force_update=force_update)
+    return spec
+
+
+def _output_spec(spec, format, output, indent, quiet):
     spec_format = format or current_app.config['SPEC_FORMAT']
-    spec = current_app._get_spec(spec_format)
     output_path = output or current_app.config['LOCAL_SPEC_PATH']
     if indent is None:
         indent = current_app.config['LOCAL_SPEC_JSON_INDENT']
@@ -52,3 +96,292 @@ def spec_command(format, output, indent, quiet):
     if output_path:
         with open(output_path, 'w') as f:
             click.echo(spec, file=f)
+
+
+def _echo_spec_profile(report, top):
+    """Output the report of the spec profile to stderr, the times are in milliseconds."""
+    from .spec_profile import SPEC_PHASES
+
+    def echo_table(rows, align_left):
+        widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+        for row in rows:
+            click.echo(
+                '  '.join(
+                    cell.ljust(widths[index]) if index < align_left else cell.rjust(widths[index])
+                    for index, cell in enumerate(row)
+                ).rstrip(),
+                err=True,
+            )
+
+    phases = [*SPEC_PHASES, 'other']
+    click.echo(f'Spec generation: {report["total"]:.2f} ms', err=True)
+    echo_table(
+        [
+            ['PHASE', 'TIME'],
+            *([phase, f'{report["phases"][phase]:.2f}'] for phase in phases),
+        ],
+        1,
+    )
+    # the spec processor is called for the whole spec, the schemas are only converted
+    for title, key, columns in (
+        ('RULE', 'rules', SPEC_PHASES[:-1]),
+        ('SCHEMA', 'schemas', ['schemas', 'parameters']),
+    ):
+        click.echo(err=True)
+        rows = [[title, 'TOTAL', *(phase.upper() for phase in columns)]]
+        for item in report[key][:top]:
+            rows.append(
+                [
+                    item['name'],
+                    f'{item["total"]:.2f}',
+                    *(f'{item["phases"].get(phase, 0.0):.2f}' for phase in columns),
+                ]
+            )
+        echo_table(rows, 1)
+    click.echo(err=True)
+    echo_table(
+        [
+            ['COMPONENT', 'SIZE'],
+            *([item['name'], str(item['size'])] for item in report['components'][:top]),
+        ],
+        1,
+    )
+
+
+@click.command('bench', short_help='Benchmark the routes with generated requests.')
+@click.option(
+    '--requests',
+    '-n',
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help='The number of requests sent to each route.',
+)
+@click.option(
+    '--threads',
+    '-t',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of threads sending the requests concurrently.',
+)
+@click.option(
+    '--endpoint',
+    '-e',
+    'endpoints',
+    multiple=True,
+    help='Only benchmark the endpoints matching the glob pattern, can be used multiple times.',
+)
+@click.option(
+    '--method',
+    '-m',
+    'methods',
+    multiple=True,
+    type=click.Choice(['GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE'], case_sensitive=False),
+    help='Only benchmark the routes of the HTTP method, can be used multiple times. '
+    'Defaults to GET and HEAD.',
+)
+@click.option(
+    '--unsafe',
+    is_flag=True,
+    help='Allow the methods other than GET and HEAD (e.g., POST), which may change the '
+    'data of the app. All the methods are benchmarked if --method is not given.',
+)
+@click.option(
+    '--header',
+    '-H',
+    'headers',
+    multiple=True,
+    help='An extra header sent with all the requests (e.g., "Authorization: Bearer xxx").',
+)
+@click.option(
+    '--sort',
+    type=click.Choice(['p50', 'p90', 'p99', 'mean', 'throughput', 'route']),
+    default='p50',
+    show_default=True,
+    help='The column to sort the results by, the slowest routes first.',
+)
+@click.option('--json', 'as_json', is_flag=True, help='Output the results in JSON.')
+@with_appcontext
+def bench_command(requests, threads, endpoints, methods, unsafe, headers, sort, as_json):
+    """Benchmark the routes with the requests generated from the input schemas.
+
+    The requests are sent to the app in-process with the test client, the
+    throughput and the latency percentiles (in milliseconds) of each route
+    are reported. Only the GET and HEAD routes are benchmarked unless the
+    --unsafe option is given, since the requests are handled by the real
+    view functions.
+
+    Check out the docs for the detailed usage:
+
+    https://apiflask.com/observability/#the-flask-bench-command
+    """
+    from .bench import BENCH_METHODS
+    from .bench import SAFE_BENCH_METHODS
+    from .bench import build_bench_requests
+    from .bench import run_bench
+
+    selected_methods = [method.upper() for method in methods] or None
+    unsafe_methods = set(selected_methods or ()) - set(SAFE_BENCH_METHODS)
+    if unsafe_methods and not unsafe:
+        raise click.UsageError(
+            f'{", ".join(sorted(unsafe_methods))} may change the data of the app, '
+            'pass --unsafe to benchmark them.'
+        )
+    if unsafe and selected_methods is None:
+        selected_methods = BENCH_METHODS
+
+    extra_headers = {}
+    for header in headers:
+        name, separator, value = header.partition(':')
+        if not separator:
+            raise click.BadParameter(f'{header!r} is not a "Name: value" header.', param_hint='-H')
+        extra_headers[name.strip()] = value.strip()
+
+    app = current_app._get_current_object()
+    bench_requests = build_bench_requests(app, list(endpoints), extra_headers, selected_methods)
+    if not bench_requests:
+        raise click.ClickException('No route to benchmark.')
+    results = run_bench(app, bench_requests, requests=requests, threads=threads)
+
+    if sort == 'route':
+        results.sort(key=lambda result: (result.request.rule, result.request.method))
+    elif sort == 'throughput':
+        results.sort(key=lambda result: result.throughput)
+    elif sort == 'mean':
+        results.sort(key=lambda result: result.mean, reverse=True)
+    else:
+        results.sort(key=lambda result: result.percentile(int(sort[1:])), reverse=True)
+
+    if as_json:
+        click.echo(json.dumps([result.to_dict() for result in results], indent=2))
+        return
+
+    rows = [['METHOD', 'ROUTE', 'STATUS', 'REQ/S', 'MEAN', 'P50', 'P90', 'P99', 'MAX']]
+    for result in results:
+        rows.append(
+            [
+                result.request.method,
+                result.request.rule,
+                ','.join(
+                    f'{status}x{count}' if len(result.status_codes) > 1 else status
+                    for status, count in result.status_codes.most_common()
+                ),
+                f'{result.throughput:.1f}',
+                *(
+                    f'{value * 1000:.2f}'
+                    for value in (
+                        result.mean,
+                        result.percentile(50),
+                        result.percentile(90),
+                        result.percentile(99),
+                        result.latencies[-1],
+                    )
+                ),
+            ]
+        )
+    widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+    for row in rows:
+        click.echo(
+            '  '.join(
+                cell.ljust(widths[index]) if index < 3 else cell.rjust(widths[index])
+                for index, cell in enumerate(row)
+            )
+        )
+
+
+@click.command('profile-report', short_help='Show the report of the route profiles.')
+@click.option(
+    '--dir',
+    '-d',
+    'directory',
+    type=click.Path(file_okay=False),
+    help='The profile directory, defaults to PROFILE_DIR config.',
+)
+@click.option(
+    '--endpoint',
+    '-e',
+    'endpoints',
+    multiple=True,
+    help='Only report the endpoints matching the glob pattern, can be used multiple times.',
+)
+@click.option(
+    '--top',
+    '-n',
+    type=click.IntRange(min=1),
+    default=15,
+    show_default=True,
+    help='The number of the functions reported for each endpoint.',
+)
+@click.option(
+    '--sort',
+    type=click.Choice(['cumulative', 'tottime', 'ncalls']),
+    default='cumulative',
+    show_default=True,
+    help='The column to sort the functions by.',
+)
+@click.option('--json', 'as_json', is_flag=True, help='Output the report in JSON.')
+@with_appcontext
+def profile_report_command(directory, endpoints, top, sort, as_json):
+    """Aggregate the profiles written by the route profiling.
+
+    For each endpoint, the mean durations of the apiflask phases and the most
+    expensive functions are reported, the times are in milliseconds per request.
+
+    Check out the docs for the detailed usage:
+
+    https://apiflask.com/observability/#route-profiling
+    """
+    from .profiling import get_profile_dir
+    from .profiling import load_profiles
+
+    directory = directory or get_profile_dir()
+    profiles = load_profiles(directory, list(endpoints))
+    if not profiles:
+        raise click.ClickException(f'No profile found in {directory}.')
+    profiles.sort(key=lambda profile: profile.phases['total'], reverse=True)
+
+    if as_json:
+        click.echo(
+            json.dumps(
+                [
+                    {
+                        'endpoint': profile.endpoint,
+                        'requests': profile.requests,
+                        'phases': profile.phases,
+                        'functions': profile.top_functions(top, sort),
+                    }
+                    for profile in profiles
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    for profile in profiles:
+        if profile is not profiles[0]:
+            click.echo()
+        phases = profile.phases
+        click.echo(
+            f'{profile.endpoint} ({profile.requests} requests, {phases.pop("total"):.2f} ms)'
+        )
+        click.echo(
+            'PHASES  ' + '  '.join(f'{name} {duration:.2f}' for name, duration in phases.items())
+        )
+        rows = [['NCALLS', 'TOTTIME', 'CUMTIME', 'FUNCTION']]
+        for function in profile.top_functions(top, sort):
+            rows.append(
+                [
+                    f'{function["ncalls"]:g}',
+                    f'{function["tottime"]:.3f}',
+                    f'{function["cumtime"]:.3f}',
+                    function['function'],
+                ]
+            )
+        widths = [max(len(row[index]) for row in rows) for index in range(3)]
+        for row in rows:
+            click.echo(
+                '  '.join(cell.rjust(widths[index]) for index, cell in enumerate(row[:3]))
+                + '  '
+                + row[3]
+            )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gzip
+import typing as t
+import zlib
+
+from flask import current_app
+from flask import request
+from flask.wrappers import Response
+
+try:
+    import brotli  # type: ignore
+
+    HAS_BROTLI = True
+except ImportError:
+    brotli = None
+    HAS_BROTLI = False
+
+try:
+    import zstandard  # type: ignore
+
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+
+class _StreamCompressor(t.Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliStreamCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)  # type: ignore
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)  # type: ignore
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()  # type: ignore
+
+
+def get_available_encodings() -> list[str]:
+    """Get the content encodings supported in the current environment.
+
+    The `gzip` encoding is always available, `br` and `zstd` need the
+    `brotli` and `zstandard` packages.
+
+    *Version added: 3.2.0*
+    """
+    encodings = []
+    if HAS_BROTLI:
+        encodings.append('br')
+    if HAS_ZSTD:
+        encodings.append('zstd')
+    encodings.append('gzip')
+    return encodings
+
+
+def compress_data(encoding: str, data: bytes, level: int) -> bytes:
+    """Compress the data with the given content encoding.
+
+    *Version added: 3.2.0*
+    """
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    elif encoding == 'br':
+        return brotli.compress(data, quality=level)  # type: ignore
+    elif encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress(data)  # type: ignore
+    raise ValueError(f'Unsupported content encoding: {encoding!r}.')
+
+
+def _get_stream_compressor(encoding: str, level: int) -> _StreamCompressor:
+    if encoding == 'gzip':
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+    elif encoding == 'br':
+        return _BrotliStreamCompressor(level)
+    elif encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compressobj()  # type: ignore
+    raise ValueError(f'Unsupported content encoding: {encoding!r}.')
+
+
+def _compress_stream(
+    chunks: t.Iterable[bytes], encoding: str, level: int
+) -> t.Generator[bytes, None, None]:
+    compressor = _get_stream_compressor(encoding, level)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _get_view_compress_option() -> bool | int | dict[str, int] | None:
+    """Get the `compress` option of the `app.output` decorator for the current view."""
+    view_func = current_app.view_functions.get(request.endpoint)  # type: ignore
+    view_class = getattr(view_func, 'view_class', None)
+    if view_class is not None:
+        method = request.method.lower()
+        view_func = getattr(view_class, method, None)
+        if view_func is None and method == 'head':
+            view_func = getattr(view_class, 'get', None)
+    response_info = getattr(view_func, '_spec', {}).get('response') or {}
+    return response_info.get('compress')
+
+
+def compress_response(response: Response) -> Response:
+    """Compress the response body with the best encoding accepted by the client.
+
+    It's registered as an `after_request` function of the app. The compression is
+    controlled by the `COMPRESS_*` config and the `compress` parameter of
+    the `app.output` decorator.
+
+    *Version added: 3.2.0*
+    """
+    option = _get_view_compress_option() if request.endpoint else None
+    if option is False or (option is None and not current_app.config['COMPRESS_RESPONSES']):
+        return response
+    if (
+        request.method == 'HEAD'
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in current_app.config['COMPRESS_MIMETYPES']
+    ):
+        return response
+
+    available = [
+        encoding
+        for encoding in current_app.config['COMPRESS_ALGORITHMS']
+        if encoding in get_available_encodings()
+    ]
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(available)
+    if encoding is None:
+        return response
+
+    levels: dict[str, int] = dict(current_app.config['COMPRESS_LEVELS'])
+    if isinstance(option, dict):
+        levels.update(option)
+    elif not isinstance(option, bool) and isinstance(option, int):
+        levels[encoding] = option
+    level = levels[encoding]
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.iter_encoded(), encoding, level)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < current_app.config['COMPRESS_MIN_SIZE']:
+            return response
+        response.set_data(compress_data(encoding, data, level))
+    response.headers['Content-Encoding'] = encoding
+
+    # the compressed body is not byte-for-byte identical, so weaken the strong ETag
+    etag, is_weak = response.get_etag()
+    if etag is not None and not is_weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+import typing as t
+
+from flask import current_app
+from flask import redirect
+from flask import request
+from flask import send_file
+from flask import url_for
+
+from .exceptions import HTTPError
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from flask.wrappers import Response
+
+# the config names of the API docs resources and their file names in the `DOCS_ASSETS_FOLDER`
+DOCS_ASSET_FILES: dict[str, str] = {
+    'SWAGGER_UI_CSS': 'swagger-ui.css',
+    'SWAGGER_UI_BUNDLE_JS': 'swagger-ui-bundle.js',
+    'SWAGGER_UI_STANDALONE_PRESET_JS': 'swagger-ui-standalone-preset.js',
+    'REDOC_STANDALONE_JS': 'redoc.standalone.js',
+    'ELEMENTS_JS': 'web-components.min.js',
+    'ELEMENTS_CSS': 'styles.min.css',
+    'RAPIDOC_JS': 'rapidoc-min.js',
+    'RAPIPDF_JS': 'rapipdf-min.js',
+    'DOCS_FAVICON': 'favicon.png',
+}
+# the precompressed variants of the assets, in the order of preference
+_encodings = [('br', '.br'), ('gzip', '.gz')]
+# the path of the asset -> (modification time, size, digest)
+_digests: dict[str, tuple[int, int, str]] = {}
+# one year, the URLs change when the content changes
+ASSET_MAX_AGE = 31536000
+
+
+def get_docs_assets_folder() -> str | None:
+    """Get the absolute path of the `DOCS_ASSETS_FOLDER` config.
+
+    The relative path is relative to the root path of the application.
+
+    *Version added: 3.2.0*
+    """
+    folder = current_app.config['DOCS_ASSETS_FOLDER']
+    if folder is None:
+        return None
+    return os.path.join(current_app.root_path, os.fspath(folder))
+
+
+def get_asset_digest(path: str) -> str | None:
+    """Get the content hash of the asset file, `None` if the file doesn't exist.
+
+    The hash is cached until the modification time or the size of the file changes.
+
+    *Version added: 3.2.0*
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = _digests.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    _digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def get_docs_asset_urls() -> dict[str, str]:
+    """Get the content-hashed URLs of the local API docs resources.
+
+    The keys are the config names of the resources (e.g., `SWAGGER_UI_BUNDLE_JS`), only
+    the resources with a file in the `DOCS_ASSETS_FOLDER` are included, the others are
+    still loaded from the URLs of the config.
+
+    *Version added: 3.2.0*
+    """
+    folder = get_docs_assets_folder()
+    # the route is registered if the config is set before the first app context
+    if folder is None or 'openapi.docs_asset' not in current_app.view_functions:
+        return {}
+    urls = {}
+    for config_name, filename in DOCS_ASSET_FILES.items():
+        digest = get_asset_digest(os.path.join(folder, filename))
+        if digest is not None:
+            urls[config_name] = url_for('openapi.docs_asset', digest=digest, filename=filename)
+    return urls
+
+
+def send_docs_asset(digest: str, filename: str) -> Response:
+    """Send the file of a local API docs resource.
+
+    The response can be cached forever since the URL contains the content hash, the
+    outdated URLs are redirected to the current URL. The precompressed variant
+    (`<filename>.br` or `<filename>.gz`) is sent if it exists and is accepted by the
+    client. The HEAD, conditional, and range requests are supported.
+
+    *Version added: 3.2.0*
+    """
+    folder = get_docs_assets_folder()
+    # only the known files are served
+    if folder is None or filename not in DOCS_ASSET_FILES.values():
+        raise HTTPError(404)
+    path = os.path.join(folder, filename)
+    current_digest = get_asset_digest(path)
+    if current_digest is None:
+        raise HTTPError(404)
+    if digest != current_digest:
+        return redirect(  # type: ignore[return-value]
+            url_for('openapi.docs_asset', digest=current_digest, filename=filename)
+        )
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if filename.endswith('.js'):
+        mimetype = 'text/javascript'
+    encoding = None
+    for name, extension in _encodings:
+        if request.accept_encodings[name] and os.path.isfile(path + extension):
+            encoding = name
+            path += extension
+            break
+    response = send_file(
+        path,
+        mimetype=mimetype,
+        max_age=ASSET_MAX_AGE,
+        etag=f'{digest}-{encoding}' if encoding else digest,
+        conditional=True,
+    )
+    response.cache_control.immutable = True
+    response.vary.add('Accept-Encoding')
+    if encoding is not None:
+        response.content_encoding = encoding
+    return response
@@ -1,6 +1,7 @@
 # Field aliases were skipped (e.g., Str, Int, Url, etc.)
 import typing as t
 import warnings
+from importlib import import_module
 
 from pydantic import GetJsonSchemaHandler
 from pydantic.json_schema import JsonSchemaValue
@@ -8,45 +9,100 @@ from pydantic_core import core_schema
 from typing_extensions import Annotated
 from werkzeug.datastructures import FileStorage
 
-with warnings.catch_warnings():
-    warnings.simplefilter('ignore')
+if t.TYPE_CHECKING:  # pragma: no cover
     from flask_marshmallow.fields import AbsoluteURLFor as AbsoluteURLFor
+    from flask_marshmallow.fields import Config as Config
+    from flask_marshmallow.fields import File as File
     from flask_marshmallow.fields import Hyperlinks as Hyperlinks
     from flask_marshmallow.fields import URLFor as URLFor
-from marshmallow.fields import AwareDateTime as AwareDateTime
-from marshmallow.fields import Boolean as Boolean
-from marshmallow.fields import Constant as Constant
-from marshmallow.fields import Date as Date
-from marshmallow.fields import DateTime as DateTime
-from marshmallow.fields import Decimal as Decimal
-from marshmallow.fields import Dict as Dict
-from marshmallow.fields import Email as Email
-from marshmallow.fields import Field as Field
-from marshmallow.fields import Float as Float
-from marshmallow.fields import Function as Function
-from marshmallow.fields import Integer as Integer
-from marshmallow.fields import IP as IP
-from marshmallow.fields import IPv4 as IPv4
-from marshmallow.fields import IPv6 as IPv6
-from marshmallow.fields import List as List
-from marshmallow.fields import Mapping as Mapping
-from marshmallow.fields import Method as Method
-from marshmallow.fields import NaiveDateTime as NaiveDateTime
-from marshmallow.fields import Nested as Nested
-from marshmallow.fields import Number as Number
-from marshmallow.fields import Pluck as Pluck
-from marshmallow.fields import Raw as Raw
-from marshmallow.fields import String as String
-from marshmallow.fields import Time as Time
-from marshmallow.fields import TimeDelta as TimeDelta
-from marshmallow.fields import Tuple as Tuple
-from marshmallow.fields import URL as URL
-from marshmallow.fields import UUID as UUID
-from marshmallow.fields import Enum as Enum
-from webargs.fields import DelimitedList as DelimitedList
-from webargs.fields import DelimitedTuple as DelimitedTuple
-from flask_marshmallow.fields import File as File
-from flask_marshmallow.fields import Config as Config
+    from marshmallow.fields import AwareDateTime as AwareDateTime
+    from marshmallow.fields import Boolean as Boolean
+    from marshmallow.fields import Constant as Constant
+    from marshmallow.fields import Date as Date
+    from marshmallow.fields import DateTime as DateTime
+    from marshmallow.fields import Decimal as Decimal
+    from marshmallow.fields import Dict as Dict
+    from marshmallow.fields import Email as Email
+    from marshmallow.fields import Field as Field
+    from marshmallow.fields import Float as Float
+    from marshmallow.fields import Function as Function
+    from marshmallow.fields import Integer as Integer
+    from marshmallow.fields import IP as IP
+    from marshmallow.fields import IPv4 as IPv4
+    from marshmallow.fields import IPv6 as IPv6
+    from marshmallow.fields import List as List
+    from marshmallow.fields import Mapping as Mapping
+    from marshmallow.fields import Method as Method
+    from marshmallow.fields import NaiveDateTime as NaiveDateTime
+    from marshmallow.fields import Nested as Nested
+    from marshmallow.fields import Number as Number
+    from marshmallow.fields import Pluck as Pluck
+    from marshmallow.fields import Raw as Raw
+    from marshmallow.fields import String as String
+    from marshmallow.fields import Time as Time
+    from marshmallow.fields import TimeDelta as TimeDelta
+    from marshmallow.fields import Tuple as Tuple
+    from marshmallow.fields import URL as URL
+    from marshmallow.fields import UUID as UUID
+    from marshmallow.fields import Enum as Enum
+    from webargs.fields import DelimitedList as DelimitedList
+    from webargs.fields import DelimitedTuple as DelimitedTuple
+
+# the marshmallow fields are imported on the first access, so the apps that only
+# use Pydantic models don't import marshmallow, webargs, and flask-marshmallow
+# (which also imports Flask-SQLAlchemy when it's installed)
+_lazy_fields: t.Dict[str, str] = {
+    'AbsoluteURLFor': 'flask_marshmallow.fields',
+    'Config': 'flask_marshmallow.fields',
+    'File': 'flask_marshmallow.fields',
+    'Hyperlinks': 'flask_marshmallow.fields',
+    'URLFor': 'flask_marshmallow.fields',
+    'AwareDateTime': 'marshmallow.fields',
+    'Boolean': 'marshmallow.fields',
+    'Constant': 'marshmallow.fields',
+    'Date': 'marshmallow.fields',
+    'DateTime': 'marshmallow.fields',
+    'Decimal': 'marshmallow.fields',
+    'Dict': 'marshmallow.fields',
+    'Email': 'marshmallow.fields',
+    'Field': 'marshmallow.fields',
+    'Float': 'marshmallow.fields',
+    'Function': 'marshmallow.fields',
+    'Integer': 'marshmallow.fields',
+    'IP': 'marshmallow.fields',
+    'IPv4': 'marshmallow.fields',
+    'IPv6': 'marshmallow.fields',
+    'List': 'marshmallow.fields',
+    'Mapping': 'marshmallow.fields',
+    'Method': 'marshmallow.fields',
+    'NaiveDateTime': 'marshmallow.fields',
+    'Nested': 'marshmallow.fields',
+    'Number': 'marshmallow.fields',
+    'Pluck': 'marshmallow.fields',
+    'Raw': 'marshmallow.fields',
+    'String': 'marshmallow.fields',
+    'Time': 'marshmallow.fields',
+    'TimeDelta': 'marshmallow.fields',
+    'Tuple': 'marshmallow.fields',
+    'URL': 'marshmallow.fields',
+    'UUID': 'marshmallow.fields',
+    'Enum': 'marshmallow.fields',
+    'DelimitedList': 'webargs.fields',
+    'DelimitedTuple': 'webargs.fields',
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module_name = _lazy_fields[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        module = import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
 
 class _FileTypeAnnotation:
@@ -75,3 +131,5 @@ class _FileTypeAnnotation:
 
 
 UploadFile = Annotated[FileStorage, _FileTypeAnnotation]
+
+__all__ = [*_lazy_fields, 'UploadFile']
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
 import typing as t
 
+from flask import current_app
 from flask import request
 from flask import url_for
 from pydantic import BaseModel
@@ -13,6 +15,46 @@ from .types import PaginationType
 
 _sentinel = object()
 
+# a page number that is unlikely to appear in any other part of the URL
+_PAGE_PLACEHOLDER = 918273645546372819
+_PAGE_URL_TEMPLATES_MAXSIZE = 1024
+
+_K = t.TypeVar('_K', bound=t.Hashable)
+_V = t.TypeVar('_V')
+
+
+class _BoundedCache(t.Generic[_K, _V]):
+    """A cache shared by the threads, the oldest entry is dropped when it's full.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._data: dict[_K, _V] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: _K, value: _V) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                del self._data[next(iter(self._data))]
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> list[_K]:
+        with self._lock:
+            return list(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 def get_reason_phrase(status_code: int, default: str = 'Unknown') -> str:
     """A helper function to get the reason phrase of the given status code.
@@ -134,16 +176,26 @@ def pagination_builder(
 
     *Version Added: 0.6.0*
 
+    *Version Changed: 3.2.0*
+
+    - Cache the page URL template per endpoint, host, and URL arguments.
+    - Build the `PaginationModel` without re-validating the URLs.
+
     *Version Changed: 3.1.0*
 
     - Add `schema_type` parameter.
     """
     endpoint: str | None = request.endpoint
     per_page: int = pagination.per_page
+    url_template: str | None = None
+    if endpoint is not None:
+        url_template = _get_page_url_template(endpoint, per_page, kwargs)
 
     def get_page_url(page: int) -> str:
         if endpoint is None:  # pragma: no cover
             return ''
+        if url_template is not None:
+            return url_template.format(page=page)
         return url_for(endpoint, page=page, per_page=per_page, _external=True, **kwargs)
 
     next: str = get_page_url(pagination.next_num) if pagination.has_next else ''
@@ -162,7 +214,7 @@ def pagination_builder(
     if schema_type == 'marshmallow':
         return pagination_dict
     elif schema_type == 'pydantic':
-        return PaginationModel(**pagination_dict)  # type: ignore
+        return PaginationModel.from_trusted(**pagination_dict)
     else:
         raise ValueError('Invalid schema_type parameter, should be "marshmallow" or "pydantic"')
 
@@ -205,3 +257,35 @@ def _normalize_header_name(name: str) -> str:
         return name
 
     return name.replace('_', '-')
+
+
+def _get_page_url_template(endpoint: str, per_page: int, kwargs: dict[str, t.Any]) -> str | None:
+    """Get the URL template of the given endpoint with a `{page}` placeholder.
+
+    The template is built with `url_for` once per app, endpoint, host, and
+    URL arguments, then cached on the app. Returns `None` if the template can't
+    be cached (e.g., unhashable URL arguments), in which case the caller should
+    fall back to `url_for`.
+
+    *Version Added: 3.2.0*
+    """
+    cache: _BoundedCache[t.Hashable, str | None] | None = getattr(
+        current_app, '_pagination_url_templates', None
+    )
+    if cache is None:
+        return None
+    try:
+        key: t.Hashable = (endpoint, request.url_root, per_page, frozenset(kwargs.items()))
+        template = cache.get(key, _sentinel)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+    if template is not _sentinel:
+        return template  # type: ignore
+    url = url_for(endpoint, page=_PAGE_PLACEHOLDER, per_page=per_page, _external=True, **kwargs)
+    placeholder = str(_PAGE_PLACEHOLDER)
+    if url.count(placeholder) == 1:
+        template = url.replace('{', '{{').replace('}', '}}').replace(placeholder, '{page}')
+    else:  # pragma: no cover
+        template = None
+    cache.set(key, template)
+    return template  # type: ignore
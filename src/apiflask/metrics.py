@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+import weakref
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+
+from flask import current_app
+from flask import request
+from flask.wrappers import Response
+
+LabelsType = t.Tuple[t.Tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_SIZE_BUCKETS: tuple[float, ...] = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_metrics_lock = threading.Lock()
+
+# (type, help) of the built-in metrics
+_metric_info: dict[str, tuple[str, str]] = {
+    'apiflask_requests_total': ('counter', 'The total number of requests.'),
+    'apiflask_validation_errors_total': (
+        'counter',
+        'The total number of requests that failed the input validation.',
+    ),
+    'apiflask_auth_errors_total': (
+        'counter',
+        'The total number of requests that failed the authentication.',
+    ),
+    'apiflask_request_duration_seconds': ('histogram', 'The request duration in seconds.'),
+    'apiflask_request_size_bytes': ('histogram', 'The request body size in bytes.'),
+    'apiflask_response_size_bytes': ('histogram', 'The response body size in bytes.'),
+}
+
+
+class _Shard:
+    """The metrics recorded by a single thread."""
+
+    def __init__(self) -> None:
+        self.counters: dict[tuple[str, LabelsType], float] = {}
+        # each histogram is a list of bucket counts, followed by the +Inf count and the sum
+        self.histograms: dict[tuple[str, LabelsType], list[float]] = {}
+
+    def merge(self, other: _Shard) -> None:
+        """Add the metrics of another shard to this shard."""
+        for key, value in other.counters.copy().items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, histogram in other.histograms.copy().items():
+            merged = self.histograms.get(key)
+            if merged is None:
+                self.histograms[key] = list(histogram)
+            else:
+                for index, value in enumerate(histogram):
+                    merged[index] += value
+
+
+class _ShardHolder:
+    """The thread-local holder of a shard, it's collected when the thread exits."""
+
+    def __init__(self, shard: _Shard) -> None:
+        self.shard = shard
+
+
+def _retire_shard(
+    shards: list[_Shard], retired: _Shard, lock: threading.RLock, shard: _Shard
+) -> None:
+    """Fold the shard of an exited thread into the retired shard."""
+    with lock:
+        retired.merge(shard)
+        shards.remove(shard)
+
+
+class _RequestState:
+    def __init__(self) -> None:
+        self.started_at = perf_counter()
+        self.failures: set[str] = set()
+
+
+_current_request: ContextVar[_RequestState | None] = ContextVar(
+    'apiflask_request_metrics', default=None
+)
+
+
+class MetricsRegistry:
+    """An in-process registry of counters and fixed-bucket histograms.
+
+    Each thread writes to its own shard without locking, and the shards are merged
+    when reading. The shard of a thread is folded into a shared shard when the
+    thread exits, so the number of shards doesn't grow with the threads that
+    ever ran.
+
+    Examples:
+
+    ```python
+    from apiflask.metrics import get_metrics_registry
+
+    registry = get_metrics_registry()
+    registry.inc('apiflask_requests_total', (('endpoint', 'get_pet'),))
+    print(registry.to_prometheus())
+    ```
+
+    Arguments:
+        latency_buckets: The upper bounds of the buckets for the duration histograms.
+        size_buckets: The upper bounds of the buckets for the size histograms.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(
+        self,
+        latency_buckets: t.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: t.Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        # the metrics of the exited threads
+        self._retired = _Shard()
+        # reentrant since a shard may be retired by the garbage collector while locked
+        self._lock = threading.RLock()
+
+    def _get_shard(self) -> _Shard:
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            shard = _Shard()
+            holder = self._local.holder = _ShardHolder(shard)
+            with self._lock:
+                self._shards.append(shard)
+            weakref.finalize(holder, _retire_shard, self._shards, self._retired, self._lock, shard)
+        return holder.shard
+
+    def _get_buckets(self, name: str) -> tuple[float, ...]:
+        return self.latency_buckets if name.endswith('_seconds') else self.size_buckets
+
+    def inc(self, name: str, labels: LabelsType = (), value: float = 1) -> None:
+        """Increase the counter with the given labels."""
+        counters = self._get_shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: LabelsType, value: float) -> None:
+        """Observe a value of the histogram with the given labels.
+
+        The metrics whose name ends with `_seconds` use the latency buckets, others
+        use the size buckets.
+        """
+        histograms = self._get_shard().histograms
+        key = (name, labels)
+        buckets = self._get_buckets(name)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = [0] * (len(buckets) + 2)
+        histogram[bisect_left(buckets, value)] += 1
+        histogram[-1] += value
+
+    def collect(
+        self,
+    ) -> tuple[dict[tuple[str, LabelsType], float], dict[tuple[str, LabelsType], list[float]]]:
+        """Merge the shards and return the counters and the histograms.
+
+        The histograms are lists of the (non-cumulative) bucket counts, followed
+        by the `+Inf` bucket count and the sum.
+        """
+        merged = _Shard()
+        with self._lock:
+            merged.merge(self._retired)
+            for shard in self._shards:
+                merged.merge(shard)
+        return merged.counters, merged.histograms
+
+    def clear(self) -> None:
+        """Reset all the metrics."""
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                shard.counters.clear()
+                shard.histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        counters, histograms = self.collect()
+        families: dict[str, list[str]] = {}
+        for (name, labels), value in sorted(counters.items()):
+            families.setdefault(name, []).append(
+                f'{name}{_format_labels(labels)} {_format_value(value)}'
+            )
+        for (name, labels), histogram in sorted(histograms.items()):
+            lines = families.setdefault(name, [])
+            cumulative = 0.0
+            buckets = self._get_buckets(name)
+            bounds = [_format_value(bound) for bound in buckets] + ['+Inf']
+            for index, le in enumerate(bounds):
+                cumulative += histogram[index]
+                bucket_labels = (*labels, ('le', le))
+                lines.append(
+                    f'{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}'
+                )
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(histogram[-1])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {_format_value(cumulative)}')
+
+        output = []
+        for name, lines in families.items():
+            metric_type, metric_help = _metric_info.get(
+                name, ('histogram' if name in {key[0] for key in histograms} else 'counter', '')
+            )
+            if metric_help:
+                output.append(f'# HELP {name} {metric_help}')
+            output.append(f'# TYPE {name} {metric_type}')
+            output.extend(lines)
+        return '\n'.join(output) + '\n' if output else ''
+
+
+def _format_labels(labels: LabelsType) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(key, value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for key, value in labels
+    )
+    return f'{{{pairs}}}'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the metrics registry of the current app.
+
+    The registry will be created with the `METRICS_LATENCY_BUCKETS` and
+    `METRICS_SIZE_BUCKETS` config and stored in `app.metrics_registry` when
+    first used.
+
+    *Version added: 3.2.0*
+    """
+    app = current_app._get_current_object()  # type: ignore
+    registry = getattr(app, 'metrics_registry', None)
+    if registry is None:
+        with _metrics_lock:
+            registry = getattr(app, 'metrics_registry', None)
+            if registry is None:
+                registry = MetricsRegistry(
+                    app.config['METRICS_LATENCY_BUCKETS'], app.config['METRICS_SIZE_BUCKETS']
+                )
+                app.metrics_registry = registry
+    return registry
+
+
+def mark_request_failure(kind: str) -> None:
+    """Mark the current request as failed in the `validation` or `auth` phase."""
+    state = _current_request.get()
+    if state is not None:
+        state.failures.add(kind)
+
+
+def start_request_metrics() -> None:
+    """Start recording the metrics of the request if the `METRICS` config is `True`.
+
+    It's registered as a `before_request` function of the app.
+    """
+    if current_app.config['METRICS']:
+        _current_request.set(_RequestState())
+
+
+def record_request_metrics(response: Response) -> Response:
+    """Record the metrics of the request.
+
+    It's registered as an `after_request` function of the app. The metrics
+    are labeled with the endpoint name.
+    """
+    state = _current_request.get()
+    if state is None:
+        return response
+    _current_request.set(None)
+    registry = get_metrics_registry()
+    endpoint = request.endpoint or ''
+    labels: LabelsType = (('endpoint', endpoint),)
+    registry.inc(
+        'apiflask_requests_total',
+        (
+            ('endpoint', endpoint),
+            ('method', request.method),
+            ('status', f'{response.status_code // 100}xx'),
+        ),
+    )
+    if 'validation' in state.failures:
+        registry.inc('apiflask_validation_errors_total', labels)
+    if 'auth' in state.failures:
+        registry.inc(
+            'apiflask_auth_errors_total',
+            (('endpoint', endpoint), ('status_code', str(response.status_code))),
+        )
+    registry.observe('apiflask_request_duration_seconds', labels, perf_counter() - state.started_at)
+    if request.content_length is not None:
+        registry.observe('apiflask_request_size_bytes', labels, request.content_length)
+    if not response.is_streamed:
+        registry.observe(
+            'apiflask_response_size_bytes', labels, response.calculate_content_length() or 0
+        )
+    return response
+
+
+def reset_request_metrics(exc: BaseException | None = None) -> None:
+    """Discard the metrics state of the request.
+
+    It's registered as a `teardown_request` function of the app.
+    """
+    _current_request.set(None)
@@ -11,9 +11,12 @@ if t.TYPE_CHECKING:  # pragma: no cover
 default_bypassed_endpoints: list[str] = [
     'static',
     'openapi.spec',
+    'openapi.sub_spec',
     'openapi.docs',
+    'openapi.docs_asset',
     'openapi.redoc',
     'openapi.swagger_ui_oauth_redirect',
+    'metrics.metrics',
     '_debug_toolbar.static',  # Flask-DebugToolbar
 ]
 
@@ -106,3 +109,106 @@ def get_default_response() -> dict[str, t.Any]:
         'headers': None,
     }
     return default_response
+
+
+# the component types referenced with $ref, the others (e.g., securitySchemes) are kept
+_referenced_components = (
+    'schemas',
+    'responses',
+    'parameters',
+    'examples',
+    'requestBodies',
+    'headers',
+    'links',
+    'callbacks',
+    'pathItems',
+)
+
+_http_methods = frozenset(('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace'))
+
+
+def _collect_refs(value: t.Any, refs: set[tuple[str, str]]) -> None:
+    """Collect the component references (`#/components/<type>/<name>`) in the value."""
+    if isinstance(value, dict):
+        ref = value.get('$ref')
+        if isinstance(ref, str) and ref.startswith('#/components/'):
+            component_type, _, name = ref[len('#/components/') :].partition('/')
+            refs.add((component_type, name))
+        for item in value.values():
+            _collect_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_refs(item, refs)
+
+
+def get_sub_spec(
+    spec: dict[str, t.Any], operations: t.Callable[[str, str, dict[str, t.Any]], bool]
+) -> dict[str, t.Any]:
+    """Get the spec with the selected operations and the components they reference.
+
+    The components referenced by the operations are collected transitively, the
+    unreferenced schemas (and other components used with `$ref`) are removed.
+
+    Arguments:
+        spec: The spec in dict.
+        operations: A function to select the operations, accepts the path,
+            the method, and the operation object.
+
+    *Version added: 3.2.0*
+    """
+    paths: dict[str, t.Any] = {}
+    for path, path_item in spec.get('paths', {}).items():
+        selected = {
+            key: value
+            for key, value in path_item.items()
+            if key not in _http_methods or operations(path, key, value)
+        }
+        # keep the path items with at least one operation
+        if not _http_methods.isdisjoint(selected):
+            paths[path] = selected
+
+    components = spec.get('components', {})
+    refs: set[tuple[str, str]] = set()
+    _collect_refs(paths, refs)
+    pending = list(refs)
+    while pending:
+        component_type, name = pending.pop()
+        found: set[tuple[str, str]] = set()
+        _collect_refs(components.get(component_type, {}).get(name), found)
+        for ref in found - refs:
+            refs.add(ref)
+            pending.append(ref)
+
+    sub_spec = {**spec, 'paths': paths}
+    if components:
+        sub_spec['components'] = {
+            component_type: (
+                {name: item for name, item in items.items() if (component_type, name) in refs}
+                if component_type in _referenced_components
+                else items
+            )
+            for component_type, items in components.items()
+        }
+    if 'tags' in spec:
+        used_tags = {
+            tag
+            for path_item in paths.values()
+            for method, operation in path_item.items()
+            if method in _http_methods
+            for tag in operation.get('tags', ())
+        }
+        sub_spec['tags'] = [tag for tag in spec['tags'] if tag['name'] in used_tags]
+    return sub_spec
+
+
+def get_spec_tags(spec: dict[str, t.Any]) -> list[str]:
+    """Get the names of the tags in the spec, including the tags only used by the operations.
+
+    *Version added: 3.2.0*
+    """
+    names = {tag['name']: None for tag in spec.get('tags', ())}
+    for path_item in spec.get('paths', {}).values():
+        for method, operation in path_item.items():
+            if method in _http_methods:
+                names.update(dict.fromkeys(operation.get('tags', ())))
+    return list(names)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import copy
+import sys
 import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from .fields import DelimitedList
 from .helpers import _normalize_header_name
 from .schema_adapters import registry
 
@@ -10,6 +13,18 @@ if t.TYPE_CHECKING:
     from apispec import APISpec
     from apispec.ext.marshmallow import MarshmallowPlugin
 
+    from .schema_cache import SchemaCache
+
+# (kind, schema id, location) -> the result of the schema conversion
+ConversionKey = t.Tuple[str, int, t.Optional[str]]
+
+# the schema conversions computed in advance for the spec generation in progress
+_schema_conversions: ContextVar[dict[ConversionKey, t.Any] | None] = ContextVar(
+    'apiflask_schema_conversions', default=None
+)
+# the on-disk cache of the schema conversions for the spec generation in progress
+_schema_cache: ContextVar[SchemaCache | None] = ContextVar('apiflask_schema_cache', default=None)
+
 
 def get_unique_schema_name(spec: APISpec, base_name: str) -> str:
     """Generate a unique schema name by appending a counter.
@@ -29,6 +44,65 @@ def get_unique_schema_name(spec: APISpec, base_name: str) -> str:
     return schema_name
 
 
+def _get_schema_identity(schema: t.Any) -> t.Any:
+    """Get the identity of a schema, the schemas with the same identity share a name."""
+    if isinstance(schema, type) or t.get_origin(schema) is not None:
+        identity: t.Any = schema
+    else:
+        marshmallow = sys.modules.get('marshmallow')
+        if marshmallow is not None and isinstance(schema, marshmallow.Schema):
+            from apispec.ext.marshmallow.common import make_schema_key
+
+            # the schema class with the modifiers (e.g., `partial`, `only`, and `exclude`)
+            identity = make_schema_key(schema)
+        else:
+            identity = type(schema)
+    try:
+        hash(identity)
+    except TypeError:
+        return id(schema)
+    return identity
+
+
+class SchemaNameIndex:
+    """The index of the component schema names for a spec generation.
+
+    It maps the identity of the registered schemas to their names, and keeps the
+    next counter of each base name, so the unique names (`Name`, `Name1`, `Name2`...)
+    are the same as the names of `get_unique_schema_name` without probing the names
+    from the first one.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self) -> None:
+        self.names: dict[t.Hashable, str] = {}
+        self._counters: dict[str, int] = {}
+
+    def get(self, schema: t.Any) -> str | None:
+        """Get the registered name of the schema."""
+        return self.names.get(_get_schema_identity(schema))
+
+    def add(self, schema: t.Any, name: str) -> None:
+        """Save the registered name of the schema."""
+        self.names[_get_schema_identity(schema)] = name
+
+    def get_unique_name(self, spec: APISpec, base_name: str) -> str:
+        """Generate a unique schema name by appending a counter.
+
+        Arguments:
+            spec: The APISpec object
+            base_name: The base schema name
+        """
+        counter = self._counters.get(base_name, 0)
+        schema_name = f'{base_name}{counter}' if counter else base_name
+        while schema_name in spec.components.schemas:
+            counter += 1
+            schema_name = f'{base_name}{counter}'
+        self._counters[base_name] = counter
+        return schema_name
+
+
 def extract_pydantic_defs(schema_dict: dict[str, t.Any], parent_name: str) -> dict[str, t.Any]:
     """Extract $defs from Pydantic schema and return them with composed keys.
 
@@ -122,6 +196,11 @@ class OpenAPIHelper:
         Returns:
             Full JSON schema dict with properties
         """
+        return self._convert(  # type: ignore[no-any-return]
+            'json_schema', schema, None, lambda: self._schema_to_json_schema(schema)
+        )
+
+    def _schema_to_json_schema(self, schema: t.Any) -> dict[str, t.Any]:
         try:
             adapter = registry.create_adapter(schema)
 
@@ -149,6 +228,11 @@ class OpenAPIHelper:
         Returns:
             List of OpenAPI parameter definitions
         """
+        return self._convert(  # type: ignore[no-any-return]
+            'parameters', schema, location, lambda: self._schema_to_parameters(schema, location)
+        )
+
+    def _schema_to_parameters(self, schema: t.Any, location: str) -> list[dict[str, t.Any]]:
         try:
             adapter = registry.create_adapter(schema)
 
@@ -196,8 +280,32 @@ class OpenAPIHelper:
         except Exception:
             return []
 
+    def _convert(
+        self, kind: str, schema: t.Any, location: str | None, convert: t.Callable[[], t.Any]
+    ) -> t.Any:
+        """Get the result of a schema conversion from the schema cache, the conversions
+        computed for the `SPEC_PARALLEL` config, or run the conversion.
+        """
+        cache = _schema_cache.get()
+        key = cache.get_key(kind, schema, location) if cache is not None else None
+        if key is not None:
+            result = cache.load(key)  # type: ignore[union-attr]
+            if result is not None:
+                return result
+        conversions = _schema_conversions.get()
+        if conversions is not None and (kind, id(schema), location) in conversions:
+            # the callers may change the result, so each call gets a copy
+            result = copy.deepcopy(conversions[kind, id(schema), location])
+        else:
+            result = convert()
+        if key is not None:
+            cache.save(key, result)  # type: ignore[union-attr]
+        return result
+
     def delimited_list2param(self, field, **kwargs) -> dict:  # type: ignore[no-untyped-def]
         """Set correct OpenAPI parameter attributes for DelimitedList fields."""
+        from webargs.fields import DelimitedList
+
         ret: dict = {}
         if isinstance(field, DelimitedList):
             ret['explode'] = False
@@ -232,3 +340,107 @@ class OpenAPIHelper:
 
 # Global helper instance
 openapi_helper = OpenAPIHelper()
+
+
+def _is_marshmallow_schema(schema: t.Any) -> bool:
+    try:
+        return registry.detect_schema_type(schema) == 'marshmallow'
+    except ValueError:
+        return False
+
+
+def _convert_schema(kind: str, schema: t.Any, location: str | None) -> t.Any:
+    """Run a schema conversion in a worker thread or process.
+
+    A new helper is used for each conversion, so the result doesn't depend on the
+    conversions that ran before it in the same worker.
+    """
+    helper = OpenAPIHelper()
+    if kind == 'parameters':
+        return helper.schema_to_parameters(schema, location=location)  # type: ignore
+    return helper.schema_to_json_schema(schema)
+
+
+def compute_schema_conversions(
+    conversions: list[tuple[str, t.Any, str | None]],
+    mode: str,
+    max_workers: int | None = None,
+) -> dict[ConversionKey, t.Any]:
+    """Compute the schema conversions in a thread pool or a process pool.
+
+    The conversions are the pure calls of `OpenAPIHelper.schema_to_parameters`
+    (kind `'parameters'`) and `OpenAPIHelper.schema_to_json_schema` (kind
+    `'json_schema'`, the location is `None`). The conversions that fail in the
+    worker (e.g., the schema can't be pickled for the process pool) are left out,
+    they will be computed when the spec is generated. The marshmallow schemas
+    are not sent to the process pool.
+
+    Arguments:
+        conversions: The list of `(kind, schema, location)` tuples.
+        mode: `'thread'` or `'process'`.
+        max_workers: The number of the workers, defaults to the default value
+            of the executor.
+
+    Returns:
+        The results keyed by `(kind, id(schema), location)`.
+
+    *Version added: 3.2.0*
+    """
+    from concurrent.futures import Executor
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor: Executor
+    if mode == 'thread':
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    elif mode == 'process':
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError(
+            "The SPEC_PARALLEL config should be one of 'thread', 'process', and None, "
+            f'got {mode!r}.'
+        )
+    results: dict[ConversionKey, t.Any] = {}
+    with executor:
+        futures = {}
+        for kind, schema, location in conversions:
+            key = (kind, id(schema), location)
+            if key in futures:
+                continue
+            # marshmallow.missing is not the same object after unpickling
+            if mode == 'process' and _is_marshmallow_schema(schema):
+                continue
+            futures[key] = executor.submit(_convert_schema, kind, schema, location)
+        # the results are collected in the order of the conversions, not the completion order
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception:
+                continue
+    return results
+
+
+@contextmanager
+def use_schema_cache(cache: SchemaCache | None) -> t.Iterator[None]:
+    """Use the on-disk schema cache in `openapi_helper` within the block.
+
+    *Version added: 3.2.0*
+    """
+    token = _schema_cache.set(cache)
+    try:
+        yield
+    finally:
+        _schema_cache.reset(token)
+
+
+@contextmanager
+def use_schema_conversions(conversions: dict[ConversionKey, t.Any] | None) -> t.Iterator[None]:
+    """Use the computed schema conversions in `openapi_helper` within the block.
+
+    *Version added: 3.2.0*
+    """
+    token = _schema_conversions.set(conversions)
+    try:
+        yield
+    finally:
+        _schema_conversions.reset(token)
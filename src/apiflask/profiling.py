@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import cProfile
+import fnmatch
+import json
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import typing as t
+from contextvars import ContextVar
+
+from flask import current_app
+from flask import request
+from flask.wrappers import Response
+
+from .timing import RequestTimings
+from .timing import _current_timings
+
+# only one profiler can be active at a time since Python 3.12
+_profile_lock = threading.Lock()
+_current_profile: ContextVar[_RequestProfile | None] = ContextVar(
+    'apiflask_request_profile', default=None
+)
+
+
+class _RequestProfile:
+    def __init__(self, profiler: cProfile.Profile, timings: RequestTimings, owned: bool) -> None:
+        self.profiler = profiler
+        self.timings = timings
+        # whether the timings were created for the profiling
+        self.owned = owned
+
+
+def get_profile_dir() -> str:
+    """Get the directory of the profile files.
+
+    It's the `PROFILE_DIR` config, defaults to the `profiles` directory in the instance folder.
+
+    *Version added: 3.2.0*
+    """
+    return current_app.config['PROFILE_DIR'] or os.path.join(current_app.instance_path, 'profiles')
+
+
+def _should_profile(endpoint: str | None) -> bool:
+    patterns = current_app.config['PROFILE_ROUTES']
+    if not patterns or endpoint is None:
+        return False
+    if not any(fnmatch.fnmatchcase(endpoint, pattern) for pattern in patterns):
+        return False
+    sample_rate: float = current_app.config['PROFILE_SAMPLE_RATE']
+    return random.random() < sample_rate
+
+
+def start_request_profiling() -> None:
+    """Start profiling the request if the endpoint matches the `PROFILE_ROUTES` config.
+
+    It's registered as a `before_request` function of the app. The requests are
+    sampled with the `PROFILE_SAMPLE_RATE` config. Only one request is profiled at a
+    time, the concurrent requests are skipped.
+    """
+    if not _should_profile(request.endpoint):
+        return
+    if not _profile_lock.acquire(blocking=False):
+        return
+    timings = _current_timings.get()
+    owned = timings is None
+    if timings is None:
+        timings = RequestTimings()
+        _current_timings.set(timings)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # pragma: no cover
+        # another profiling tool is active
+        if owned:
+            _current_timings.set(None)
+        _profile_lock.release()
+        return
+    _current_profile.set(_RequestProfile(profiler, timings, owned))
+
+
+def finish_request_profiling(response: Response) -> Response:
+    """Write the profile of the request to the profile directory.
+
+    It's registered as an `after_request` function of the app. The stats are saved
+    as `<PROFILE_DIR>/<endpoint>/<id>.prof` (readable with `pstats`), with a
+    `<id>.json` file for the request info and the phase timings.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return response
+    profile.profiler.disable()
+    _current_profile.set(None)
+    try:
+        if profile.owned:
+            _current_timings.set(None)
+        endpoint = t.cast(str, request.endpoint)
+        directory = os.path.join(get_profile_dir(), endpoint)
+        os.makedirs(directory, exist_ok=True)
+        name = f'{time.time_ns()}-{os.getpid()}-{threading.get_ident()}'
+        profile.profiler.dump_stats(os.path.join(directory, f'{name}.prof'))
+        with open(os.path.join(directory, f'{name}.json'), 'w') as f:
+            json.dump(
+                {
+                    'endpoint': endpoint,
+                    'method': request.method,
+                    'path': request.path,
+                    'status_code': response.status_code,
+                    'timings': profile.timings.to_dict(),
+                },
+                f,
+            )
+    finally:
+        _profile_lock.release()
+    return response
+
+
+def reset_request_profiling(exc: BaseException | None = None) -> None:
+    """Stop the profiler if the request failed before the response was made.
+
+    It's registered as a `teardown_request` function of the app.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    profile.profiler.disable()
+    _current_profile.set(None)
+    if profile.owned:
+        _current_timings.set(None)
+    _profile_lock.release()
+
+
+class EndpointProfile:
+    """The aggregated profiles of an endpoint.
+
+    Arguments:
+        endpoint: The endpoint name.
+        stats: The merged `pstats.Stats` of the profiled requests.
+        timings: The timings (in milliseconds) of each profiled request.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, endpoint: str, stats: pstats.Stats, timings: list[dict[str, float]]) -> None:
+        self.endpoint = endpoint
+        self.stats = stats
+        self.timings = timings
+
+    @property
+    def requests(self) -> int:
+        """The number of the profiled requests."""
+        return len(self.timings)
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """The mean durations (in milliseconds) of the phases and the `total` duration.
+
+        The time spent outside the apiflask phases (e.g., the `before_request` functions
+        and the response building) is reported as `other`.
+        """
+        totals: dict[str, float] = {}
+        for timings in self.timings:
+            for name, duration in timings.items():
+                totals[name] = totals.get(name, 0.0) + duration
+        phases = {name: duration / self.requests for name, duration in totals.items()}
+        total = phases.pop('total', 0.0)
+        phases['other'] = max(total - sum(phases.values()), 0.0)
+        phases['total'] = total
+        return phases
+
+    def top_functions(self, limit: int = 15, sort: str = 'cumulative') -> list[dict[str, t.Any]]:
+        """Get the most expensive functions.
+
+        The times are the mean per request in milliseconds.
+
+        Arguments:
+            limit: The number of the functions.
+            sort: One of `cumulative`, `tottime`, and `ncalls`.
+        """
+        index = {'ncalls': 1, 'tottime': 2, 'cumulative': 3}[sort]
+        items = sorted(
+            self.stats.stats.items(),  # type: ignore
+            key=lambda item: item[1][index],
+            reverse=True,
+        )
+        return [
+            {
+                'function': _format_function(func),
+                'ncalls': ncalls / self.requests,
+                'tottime': tottime * 1000 / self.requests,
+                'cumtime': cumtime * 1000 / self.requests,
+            }
+            for func, (_, ncalls, tottime, cumtime, _) in items[:limit]
+        ]
+
+
+def load_profiles(directory: str, endpoints: list[str] | None = None) -> list[EndpointProfile]:
+    """Load and aggregate the profile files written by the request profiling.
+
+    Examples:
+
+    ```python
+    from apiflask.profiling import load_profiles
+
+    for profile in load_profiles('instance/profiles'):
+        print(profile.endpoint, profile.phases)
+        profile.stats.sort_stats('cumulative').print_stats(10)
+    ```
+
+    Arguments:
+        directory: The profile directory (the `PROFILE_DIR` config).
+        endpoints: Only load the endpoints matching the glob patterns.
+
+    *Version added: 3.2.0*
+    """
+    profiles: list[EndpointProfile] = []
+    if not os.path.isdir(directory):
+        return profiles
+    for endpoint in sorted(os.listdir(directory)):
+        path = os.path.join(directory, endpoint)
+        if not os.path.isdir(path):
+            continue
+        if endpoints and not any(fnmatch.fnmatchcase(endpoint, pattern) for pattern in endpoints):
+            continue
+        stats: pstats.Stats | None = None
+        timings = []
+        for filename in sorted(os.listdir(path)):
+            name, extension = os.path.splitext(filename)
+            info_path = os.path.join(path, f'{name}.json')
+            if extension != '.prof' or not os.path.exists(info_path):
+                continue
+            with open(info_path) as f:
+                timings.append(json.load(f)['timings'])
+            if stats is None:
+                stats = pstats.Stats(os.path.join(path, filename))
+            else:
+                stats.add(os.path.join(path, filename))
+        if stats is not None:
+            profiles.append(EndpointProfile(endpoint, stats, timings))
+    return profiles
+
+
+def _format_function(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == '~':
+        # the built-in functions
+        return name
+    # shorten the path with the longest matched import path
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + os.sep):
+            filename = filename[len(path) + 1 :]
+            break
+    return f'{filename}:{line}({name})'
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import time
 import typing as t
 from functools import wraps
 
 from flask import current_app
+from flask import g
 from flask import jsonify
 from flask import request as flask_request
 from flask import Response
 from flask.typing import HeadersValue
 from flask.typing import ResponseValue as FlaskResponseValue
-from marshmallow import Schema
-from pydantic import BaseModel
-
+from werkzeug.http import generate_etag
+
+from .caching import CacheBackend
+from .caching import CacheEntry
+from .caching import VaryType
+from .caching import get_cache_backend
+from .caching import make_cache_key
+from .exceptions import HTTPError
 from .helpers import _sentinel
 from .schema_adapters import registry
-from .schemas import FileSchema
+from .schemas import _is_schema_instance
+from .timing import timed
 from .types import DecoratedType
 from .types import HTTPAuthType
 from .types import OpenAPISchemaType
@@ -25,6 +33,8 @@ from .views import MethodView
 
 if t.TYPE_CHECKING:
     from _typeshed.wsgi import WSGIApplication  # noqa: F401
+    from marshmallow import Schema
+    from pydantic import BaseModel
 
     try:
         from flask_sqlalchemy import extension as sqla_ext  # type: ignore
@@ -181,7 +191,7 @@ class APIScaffold:
 
         def decorator(f):
             f = _ensure_sync(f)
-            _annotate(f, auth=auth, roles=roles or [])
+            _annotate(f, auth=auth, roles=roles or [], auth_optional=optional)
             return auth.login_required(role=roles, optional=optional)(f)
 
         return decorator
@@ -332,6 +342,12 @@ class APIScaffold:
                 f._spec['args'].append((annotation_schema, location))
 
             arg_name_val = arg_name or f'{location}_data'
+            f._spec.setdefault('input_arg_names', {})[location] = arg_name_val
+
+            span_attributes = {
+                'apiflask.input.location': location,
+                'apiflask.input.schema': adapter.get_schema_name(),
+            }
 
             # For marshmallow schemas, use the original webargs approach for compatibility
             if adapter.schema_type == 'marshmallow':
@@ -341,8 +357,13 @@ class APIScaffold:
 
                     @wraps(f)
                     def wrapper(*args: t.Any, **kwargs: t.Any):
-                        location_data = parser.load_location_data(
-                            schema=annotation_schema, req=flask_request, location=location
+                        location_data = timed(
+                            f'input-{location}',
+                            span_attributes,
+                            parser.load_location_data,
+                            schema=annotation_schema,
+                            req=flask_request,
+                            location=location,
                         )
                         kwargs[arg_name_val] = location_data
                         return f(*args, **kwargs)
@@ -358,7 +379,14 @@ class APIScaffold:
 
                 @wraps(f)
                 def wrapper(*args: t.Any, **kwargs: t.Any):
-                    location_data = adapter.validate_input(flask_request, location, **kwargs)
+                    location_data = timed(
+                        f'input-{location}',
+                        span_attributes,
+                        adapter.validate_input,
+                        flask_request,
+                        location,
+                        **kwargs,
+                    )
                     kwargs[arg_name_val] = location_data
                     return f(*args, **kwargs)
 
@@ -377,6 +405,9 @@ class APIScaffold:
         links: dict[str, t.Any] | None = None,
         content_type: str | None = 'application/json',
         headers: SchemaType | None = None,
+        etag: bool | t.Callable[..., t.Any] = False,
+        compress: bool | int | dict[str, int] | None = None,
+        validate: bool | None = None,
     ) -> t.Callable[[DecoratedType], DecoratedType]:
         """Add output settings for view functions.
 
@@ -446,6 +477,37 @@ class APIScaffold:
 
             content_type: The content/media type of the response. It defaults to `application/json`.
             headers: The schemas of the headers.
+            etag: Set to `True` to add a strong `ETag` header computed from the serialized
+                body, and answer the `If-None-Match` requests with `304 Not Modified`.
+                You can also pass a version callable, it will be called with the same
+                arguments as the view function before the view runs, and the `ETag` will
+                be computed from its return value. In this case, the view function and
+                the serialization will be skipped for the `304` responses, and the unsafe
+                requests (i.e. `POST`, `PUT`, `PATCH`, `DELETE`) with a mismatched
+                `If-Match` header will get a `412 Precondition Failed` error. Example:
+
+                ```python
+                @app.get('/pets/<int:pet_id>')
+                @app.output(PetOut, etag=lambda pet_id: Pet.get_version(pet_id))
+                def get_pet(pet_id):
+                    return Pet.query.get_or_404(pet_id)
+                ```
+            compress: Control the response compression of this view. Set to `False` to
+                disable the compression, set to `True` to enable it even if the
+                `COMPRESS_RESPONSES` config is `False`. You can also pass a compression
+                level (e.g., `9`) or a dict of levels for each encoding (e.g.,
+                `{'gzip': 9, 'br': 11}`), which also enables the compression. Defaults
+                to `None` (follow the `COMPRESS_*` config).
+            validate: Only for Pydantic models. Set to `False` to trust the return value
+                and serialize it without validation, the dicts and objects (e.g., ORM
+                instances) will be converted to model instances without running the
+                validators. Defaults to `None` (follow the `VALIDATE_OUTPUT` config).
+
+        *Version changed: 3.2.0*
+
+        - Add parameter `etag`.
+        - Add parameter `compress`.
+        - Add parameter `validate`.
 
         *Version changed: 2.1.0*
 
@@ -505,6 +567,8 @@ class APIScaffold:
                     'links': links,
                     'content_type': content_type,
                     'headers': headers_schema,
+                    'etag': 'version' if callable(etag) else bool(etag),
+                    'compress': compress,
                 },
             )
 
@@ -515,7 +579,7 @@ class APIScaffold:
                 **kwargs: t.Any,
             ) -> Response:  # pragma: no cover
                 """Serialize output using schema adapters."""
-                if isinstance(body_schema, FileSchema):
+                if _is_schema_instance(body_schema, 'FileSchema'):
                     return obj  # type: ignore
                 # Handle many parameter
                 if many is _sentinel:
@@ -524,6 +588,9 @@ class APIScaffold:
                     many = getattr(body_schema_adapter, 'many', False) or getattr(
                         schema, 'many', False
                     )  # type: ignore
+                validate_output: bool = (
+                    current_app.config['VALIDATE_OUTPUT'] if validate is None else validate
+                )
 
                 base_schema: OpenAPISchemaType = current_app.config['BASE_RESPONSE_SCHEMA']
                 if base_schema is not None and status_code != 204:
@@ -536,7 +603,7 @@ class APIScaffold:
                             )
                         # Serialize the data part
                         obj[data_key] = body_schema_adapter.serialize_output(
-                            obj[data_key], many=many
+                            obj[data_key], many=many, validate=validate_output
                         )
                     else:
                         if not hasattr(obj, data_key):
@@ -546,24 +613,63 @@ class APIScaffold:
                         # Serialize the data part
                         data_value = getattr(obj, data_key)
                         serialized_data = body_schema_adapter.serialize_output(
-                            data_value, many=many
+                            data_value, many=many, validate=validate_output
                         )
                         setattr(obj, data_key, serialized_data)
 
                     base_schema_adapter = registry.create_adapter(base_schema)
                     data = base_schema_adapter.serialize_output(obj)  # type: ignore
                 else:
-                    data = body_schema_adapter.serialize_output(obj, many=many)  # type: ignore
+                    data = body_schema_adapter.serialize_output(  # type: ignore
+                        obj, many=many, validate=validate_output
+                    )
                 return jsonify(data, *args, **kwargs)
 
+            span_attributes = {
+                'apiflask.output.schema': body_schema_adapter.get_schema_name(),
+                'apiflask.output.status_code': status_code,
+            }
+
             @wraps(f)
             def _response(*args: t.Any, **kwargs: t.Any) -> ResponseReturnValueType:
-                rv = f(*args, **kwargs)
+                if etag:
+                    return _etag_response(*args, **kwargs)
+                return _make_response(*args, **kwargs)
+
+            def _etag_response(*args: t.Any, **kwargs: t.Any) -> Response:
+                version_etag: str | None = None
+                if callable(etag):
+                    version_etag = generate_etag(str(etag(*args, **kwargs)).encode('utf-8'))
+                    if flask_request.method in ('GET', 'HEAD'):
+                        if flask_request.if_none_match.contains_weak(version_etag):
+                            response = current_app.response_class(status=304)
+                            response.set_etag(version_etag)
+                            return response
+                    elif flask_request.if_match and not (
+                        flask_request.if_match.star_tag
+                        or flask_request.if_match.contains(version_etag)
+                    ):
+                        raise HTTPError(412)
+                response = current_app.make_response(
+                    _make_response(*args, **kwargs)  # type: ignore
+                )
+                if not 200 <= response.status_code < 300 or response.is_streamed:
+                    return response
+                if version_etag is not None:
+                    response.set_etag(version_etag)
+                else:
+                    response.add_etag()
+                if flask_request.method in ('GET', 'HEAD'):
+                    response.make_conditional(flask_request)
+                return response
+
+            def _make_response(*args: t.Any, **kwargs: t.Any) -> ResponseReturnValueType:
+                rv = timed('view', None, f, *args, **kwargs)
                 if isinstance(rv, Response):
                     return rv
                 if not isinstance(rv, tuple):
-                    return _jsonify(rv), status_code
-                json = _jsonify(rv[0])
+                    return timed('output', span_attributes, _jsonify, rv), status_code
+                json = timed('output', span_attributes, _jsonify, rv[0])
                 if len(rv) == 2:
                     rv = (json, rv[1]) if isinstance(rv[1], int) else (json, status_code, rv[1])
                 elif len(rv) >= 3:
@@ -576,6 +682,123 @@ class APIScaffold:
 
         return decorator
 
+    def cache(
+        self,
+        ttl: int = 60,
+        vary: list[VaryType] | None = None,
+        backend: CacheBackend | None = None,
+    ) -> t.Callable[[DecoratedType], DecoratedType]:
+        """Cache the serialized response of view functions.
+
+        The cache key is made from the validated input data (`query_data`, `path_data`,
+        etc.), so the equivalent requests share the same cache entry. Only successful
+        `GET` and `HEAD` requests are cached. The cached responses will include the
+        `Cache-Control` and `Age` headers.
+
+        > Be sure to put it under the `input` decorators and above the `output`
+        decorator, so that the validated input data is available for the cache key.
+
+        Examples:
+
+        ```python
+        from apiflask import APIFlask
+
+        app = APIFlask(__name__)
+
+        @app.get('/pets')
+        @app.input(PetQuery, location='query')
+        @app.cache(ttl=60, vary=['query'])
+        @app.output(PetOut(many=True))
+        def get_pets(query_data):
+            return Pet.query.filter_by(**query_data).all()
+        ```
+
+        Arguments:
+            ttl: The time to live of the cache entry in seconds, defaults to `60`.
+            vary: The request data that the response varies on, a list of `'query'`,
+                `'path'`, `'json'`, `'form'`, `'headers'`, `'cookies'`, and `'user'`
+                (the current user of `auth_required`), or the callables that return
+                a value for the key. Defaults to `['query', 'path']`. The responses of
+                the views that require authentication always vary on `'user'` and are
+                marked as `private`, and the cache is looked up after the authentication
+                whatever the order of the `cache` and `auth_required` decorators. The
+                user should have an `id` attribute or be a scalar value, otherwise pass a
+                callable that returns the identity of the user in `vary`.
+            backend: The cache backend, an instance of
+                [`CacheBackend`][apiflask.caching.CacheBackend]. Defaults to the
+                `app.cache_backend`, an in-process
+                [`MemoryCacheBackend`][apiflask.caching.MemoryCacheBackend]
+                configured by the `RESPONSE_CACHE_MAX_ENTRIES` and
+                `RESPONSE_CACHE_MAX_BYTES` config.
+
+        *Version added: 3.2.0*
+        """
+        if vary is None:
+            vary = ['query', 'path']
+
+        def decorator(f):
+            # the `auth_required` decorator below this decorator
+            auth = getattr(f, '_spec', {}).get('auth')
+            f = _ensure_sync(f)
+            _annotate(f, cache={'ttl': ttl, 'vary': vary})
+
+            @wraps(f)
+            def wrapper(*args: t.Any, **kwargs: t.Any) -> ResponseReturnValueType:
+                if flask_request.method not in ('GET', 'HEAD'):
+                    return f(*args, **kwargs)  # type: ignore
+
+                key_vary = vary
+                private = 'user' in vary
+                if 'auth' in f._spec or g.get('flask_httpauth_user') is not None:
+                    private = True
+                    if 'user' not in vary:
+                        key_vary = [*vary, 'user']
+                cache_control = f'{"private" if private else "public"}, max-age={ttl}'
+                cache_backend = backend or get_cache_backend()
+                input_arg_names: dict[str, str] = f._spec.get('input_arg_names', {})
+                input_data = {
+                    location: kwargs[arg_name]
+                    for location, arg_name in input_arg_names.items()
+                    if arg_name in kwargs
+                }
+                key = make_cache_key(key_vary, input_data)
+                now = time.time()
+                entry = cache_backend.get(key)
+                if entry is not None:
+                    response = current_app.response_class(
+                        entry.body, status=entry.status_code, headers=entry.headers
+                    )
+                    response.headers['Age'] = str(int(now - entry.created_at))
+                    if 'ETag' in response.headers:
+                        response.make_conditional(flask_request)
+                    return response
+
+                response = current_app.make_response(f(*args, **kwargs))
+                if (
+                    response.status_code == 200
+                    and not response.is_streamed
+                    and 'Set-Cookie' not in response.headers
+                ):
+                    response.headers['Cache-Control'] = cache_control
+                    headers = [
+                        (name, value)
+                        for name, value in response.headers.items()
+                        if name != 'Content-Length'
+                    ]
+                    cache_backend.set(
+                        key, CacheEntry(response.get_data(), 200, headers, now, now + ttl)
+                    )
+                return response
+
+            if auth is not None:
+                # authenticate the request before looking up the cache
+                return auth.login_required(
+                    role=f._spec['roles'] or None, optional=f._spec.get('auth_optional', False)
+                )(wrapper)
+            return wrapper
+
+        return decorator
+
     def doc(
         self,
         summary: str | None = None,
@@ -46,12 +46,14 @@ class SchemaAdapter(ABC):
         ...
 
     @abstractmethod
-    def serialize_output(self, data: t.Any, many: bool = False) -> t.Any:
+    def serialize_output(self, data: t.Any, many: bool = False, validate: bool = True) -> t.Any:
         """Serialize output data.
 
         Arguments:
             data: Data to serialize
             many: Whether to serialize many objects
+            validate: Whether to validate the data before serializing it. Adapters
+                that don't validate on output can ignore it.
 
         Returns:
             Serialized data ready for JSON response
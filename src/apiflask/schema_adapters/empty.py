@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import typing as t
+
+from .base import SchemaAdapter
+
+if t.TYPE_CHECKING:
+    from flask import Request
+
+
+class EmptySchemaAdapter(SchemaAdapter):
+    """Schema adapter for the empty dict schema (`{}`) without marshmallow.
+
+    It's used for the empty schemas (e.g., `app.output({}, status_code=204)`) when
+    marshmallow is not installed or not imported yet, so the apps that only use
+    Pydantic models never import marshmallow. The data is passed through as is.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, schema: t.Any, schema_name: str | None = None, many: bool = False) -> None:
+        super().__init__({}, schema_name=schema_name, many=many)
+
+    @property
+    def schema_type(self) -> str:
+        return 'empty'
+
+    def validate_input(self, request: Request, location: str, **kwargs: t.Any) -> t.Any:
+        """An empty schema accepts no data, the input data is always an empty dict."""
+        return {}
+
+    def serialize_output(self, data: t.Any, many: bool = False, validate: bool = True) -> t.Any:
+        return data
+
+    def get_openapi_schema(self, **kwargs: t.Any) -> dict[str, t.Any]:
+        return {}
+
+    def get_schema_name(self) -> str:
+        return 'Empty'
@@ -3,15 +3,19 @@ from __future__ import annotations
 import typing as t
 
 from flask import current_app
+from flask import has_app_context
 from marshmallow import Schema
 from marshmallow import ValidationError as MarshmallowValidationError
 from webargs.flaskparser import FlaskParser as BaseFlaskParser
 from webargs.multidictproxy import MultiDictProxy
 
 from ..exceptions import _ValidationError
-from ..schemas import EmptySchema
-from ..schemas import FileSchema
+from .._marshmallow_schemas import EmptySchema
+from .._marshmallow_schemas import FileSchema
+from ..timing import timed
+from ..tracing import is_tracing
 from .base import SchemaAdapter
+from .marshmallow_compiler import get_compiled_dump
 
 if t.TYPE_CHECKING:
     from flask import Request
@@ -47,6 +51,26 @@ class FlaskParser(BaseFlaskParser):
             error_headers,
         )
 
+    def parse(  # type: ignore
+        self, argmap: t.Any, req: Request | None = None, *, location: str | None = None, **kwargs
+    ) -> t.Any:
+        location = location or self.location
+        attributes = None
+        if is_tracing():
+            attributes = {
+                'apiflask.input.location': location,
+                'apiflask.input.schema': type(argmap).__name__,
+            }
+        return timed(
+            f'input-{location}',
+            attributes,
+            super().parse,
+            argmap,
+            req,
+            location=location,
+            **kwargs,
+        )
+
     def load_location_data(self, *, schema: Schema, req: Request, location: str) -> t.Any:
         return self._load_location_data(schema=schema, req=req, location=location)
 
@@ -133,11 +157,25 @@ class MarshmallowAdapter(SchemaAdapter):
         # Use webargs for other locations
         return parser.load_location_data(schema=self.schema, req=request, location=location)
 
-    def serialize_output(self, data: t.Any, many: bool = False) -> t.Any:
-        """Serialize output using marshmallow."""
+    def serialize_output(self, data: t.Any, many: bool = False, validate: bool = True) -> t.Any:
+        """Serialize output using marshmallow.
+
+        The `validate` argument is ignored since marshmallow doesn't validate on dump.
+        If the `COMPILE_OUTPUT_SCHEMAS` config is `True`, the compiled dump function
+        will be used when the schema is supported.
+
+        *Version changed: 3.2.0*
+
+        - Support compiled dump functions.
+        """
         if isinstance(self.schema, (EmptySchema, FileSchema)):
             return data
 
+        if has_app_context() and current_app.config['COMPILE_OUTPUT_SCHEMAS']:
+            dump = get_compiled_dump(self.schema)
+            if dump is not None:
+                return dump(data, many)
+
         # Use marshmallow's dump method which handles dump_default values
         return self.schema.dump(data, many=many)
 
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import typing as t
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+from marshmallow import fields
+from marshmallow import Schema
+from marshmallow import utils
+from marshmallow.decorators import POST_DUMP
+from marshmallow.decorators import PRE_DUMP
+from marshmallow.utils import missing
+
+DumpFunction = t.Callable[[t.Any, bool], t.Any]
+
+# the fields whose `_serialize` may return the value as is, the `Boolean` field of
+# marshmallow 3 converts the truthy and falsy values
+_RAW_FIELDS = (fields.Raw, fields.Boolean)
+_NUMBER_FIELDS: dict[type[fields.Field], str] = {fields.Integer: 'int', fields.Float: 'float'}
+
+_cache: WeakKeyDictionary[type[Schema], dict[t.Hashable, DumpFunction | None]] = WeakKeyDictionary()
+_cache_lock = Lock()
+
+
+def _ensure_text(value: t.Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return str(value)
+
+
+def _get_cache_key(schema: Schema) -> t.Hashable:
+    return (
+        frozenset(schema.only) if schema.only is not None else None,
+        frozenset(schema.exclude),
+        frozenset(schema.load_only),
+        frozenset(schema.dump_only),
+    )
+
+
+def _is_supported(schema: Schema) -> bool:
+    """Check whether the schema can be compiled.
+
+    The schemas with dump hooks, or with a customized `dump`, `_serialize`, or
+    `get_attribute` method are not supported.
+    """
+    schema_class = type(schema)
+    if schema._hooks[PRE_DUMP] or schema._hooks[POST_DUMP]:
+        return False
+    if schema.dict_class is not dict:
+        return False
+    return all(
+        getattr(schema_class, name) is getattr(Schema, name)
+        for name in ('dump', '_serialize', 'get_attribute')
+    )
+
+
+def _get_format_expression(field: fields.Field) -> str | None:
+    """Get the inline expression that formats the value `v` for the simple fields."""
+    field_class = type(field)
+    if field_class in _RAW_FIELDS and field_class._serialize is fields.Field._serialize:
+        return 'v'
+    if field_class is fields.String:
+        return 'v if v is None or type(v) is str else _ensure_text(v)'
+    if field_class in _NUMBER_FIELDS and not field.as_string:  # type: ignore
+        num_type = _NUMBER_FIELDS[field_class]
+        return f'None if v is None else {num_type}(v)'
+    return None
+
+
+def _is_simple_field(field: fields.Field, attr_name: str) -> bool:
+    """Check whether the value of the field can be accessed inline."""
+    key = attr_name if field.attribute is None else field.attribute
+    return (
+        field._CHECK_ATTRIBUTE
+        and type(field).get_value is fields.Field.get_value
+        and type(field).serialize is fields.Field.serialize
+        and '.' not in key
+    )
+
+
+def _generate_source(schema: Schema, namespace: dict[str, t.Any]) -> str:
+    dict_lines: list[str] = []
+    object_lines: list[str] = []
+    generic_lines: list[str] = []
+    for index, (attr_name, field) in enumerate(schema.dump_fields.items()):
+        data_key = field.data_key if field.data_key is not None else attr_name
+        if not _is_simple_field(field, attr_name):
+            # fall back to the generic field serialization
+            namespace[f'_field_{index}'] = field
+            lines = [
+                f'v = _field_{index}.serialize({attr_name!r}, obj, accessor=_get_attribute)',
+                'if v is not missing:',
+                f'    ret[{data_key!r}] = v',
+            ]
+            for block in (dict_lines, object_lines, generic_lines):
+                block.extend(lines)
+            continue
+
+        key = attr_name if field.attribute is None else field.attribute
+        accessors = (
+            (dict_lines, f'obj[{key!r}] if {key!r} in obj else getattr(obj, {key!r}, missing)'),
+            (object_lines, f'getattr(obj, {key!r}, missing)'),
+            (generic_lines, f'_get_value_for_key(obj, {key!r}, missing)'),
+        )
+        format_expression = _get_format_expression(field)
+        if format_expression is None:
+            namespace[f'_serialize_{index}'] = field._serialize
+            format_expression = f'_serialize_{index}(v, {attr_name!r}, obj)'
+        default = field.dump_default
+        namespace[f'_default_{index}'] = default
+        for block, accessor in accessors:
+            block.append(f'v = {accessor}')
+            if default is missing:
+                block.append('if v is not missing:')
+            else:
+                call = '()' if callable(default) else ''
+                block.extend(
+                    [
+                        'if v is missing:',
+                        f'    v = _default_{index}{call}',
+                        'if v is not missing:',
+                    ]
+                )
+            block.append(f'    ret[{data_key!r}] = {format_expression}')
+
+    def indent(lines: list[str]) -> str:
+        return '\n'.join(f'        {line}' for line in lines) or '        pass'
+
+    return f"""\
+def dump_one(obj):
+    ret = {{}}
+    if type(obj) is dict:
+{indent(dict_lines)}
+    elif not hasattr(obj, '__getitem__'):
+{indent(object_lines)}
+    else:
+{indent(generic_lines)}
+    return ret
+
+
+def dump(obj, many):
+    if many and obj is not None:
+        return [dump_one(item) for item in obj]
+    return dump_one(obj)
+"""
+
+
+def _compile(schema: Schema) -> DumpFunction | None:
+    if not _is_supported(schema):
+        return None
+    namespace: dict[str, t.Any] = {
+        'missing': missing,
+        '_ensure_text': _ensure_text,
+        '_get_attribute': schema.get_attribute,
+        '_get_value_for_key': utils._get_value_for_key,
+    }
+    source = _generate_source(schema, namespace)
+    code = compile(source, f'<apiflask compiled dump {type(schema).__name__}>', 'exec')
+    exec(code, namespace)
+    return namespace['dump']  # type: ignore
+
+
+def get_compiled_dump(schema: Schema) -> DumpFunction | None:
+    """Get the compiled dump function of the marshmallow schema.
+
+    The function is generated for each schema class and the set of `only`,
+    `exclude`, `load_only`, and `dump_only` fields, and it's cached. It takes the
+    object and the `many` flag, and returns the same result as `schema.dump`.
+    The simple fields (`Raw`, `String`, `Integer`, `Float`, and `Boolean` on
+    marshmallow 4) are formatted inline, other fields are serialized with their
+    own methods.
+
+    Returns `None` if the schema is not supported (e.g., it has `pre_dump` or
+    `post_dump` hooks), the caller should use `schema.dump` instead.
+
+    *Version added: 3.2.0*
+    """
+    schema_class = type(schema)
+    cache_key = _get_cache_key(schema)
+    compiled = _cache.get(schema_class)
+    if compiled is not None and cache_key in compiled:
+        return compiled[cache_key]
+    with _cache_lock:
+        compiled = _cache.setdefault(schema_class, {})
+        if cache_key not in compiled:
+            compiled[cache_key] = _compile(schema)
+        return compiled[cache_key]
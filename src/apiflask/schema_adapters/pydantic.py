@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import itertools
 import typing as t
+from functools import lru_cache
 
 from flask import current_app
 from werkzeug.datastructures import FileStorage
@@ -14,13 +16,14 @@ if t.TYPE_CHECKING:
     from flask import Request
 
 try:
-    from pydantic import BaseModel, ValidationError as PydanticValidationError
+    from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
     from pydantic.fields import FieldInfo
     from pydantic_core import ErrorDetails
 
     HAS_PYDANTIC = True
 except ImportError:
     BaseModel = None  # type: ignore
+    TypeAdapter = None  # type: ignore
     PydanticValidationError = None  # type: ignore
     FieldInfo = None  # type: ignore
     ErrorDetails = None  # type: ignore
@@ -54,6 +57,131 @@ def _format_pydantic_errors(errors: list[ErrorDetails]) -> dict[str, list[str]]:
     return formatted_errors
 
 
+_Builder = t.Callable[[t.Any], t.Any]
+
+
+def _contains_model(annotation: t.Any) -> bool:
+    """Check if the annotation is or contains a Pydantic model."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in t.get_args(annotation))
+
+
+def _get_value_builder(annotation: t.Any) -> _Builder | None:
+    """Get the builder for a field annotation that contains Pydantic models.
+
+    The annotations that contain models but can't be built without validation (e.g.,
+    a union of models) are validated, so the values are filtered like the models.
+    """
+    if not _contains_model(annotation):
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _get_trusted_builder(annotation)
+    origin = t.get_origin(annotation)
+    args = t.get_args(annotation)
+    if origin is t.Annotated:
+        return _get_value_builder(args[0])
+    if origin in (list, set, frozenset) or (
+        origin is tuple and len(args) == 2 and args[1] is Ellipsis
+    ):
+        item_builder = _get_value_builder(args[0])
+        if item_builder is not None:
+            return lambda value: [item_builder(item) for item in value]
+    elif origin is dict and len(args) == 2 and not _contains_model(args[0]):
+        value_builder = _get_value_builder(args[1])
+        if value_builder is not None:
+            return lambda value: {key: value_builder(item) for key, item in value.items()}
+    elif origin is t.Union or type(annotation).__name__ == 'UnionType':
+        builders = [_get_value_builder(arg) for arg in args if arg is not type(None)]
+        if len(builders) == 1 and builders[0] is not None:
+            builder = builders[0]
+            return lambda value: None if value is None else builder(value)
+    adapter = TypeAdapter(annotation)
+    return lambda value: adapter.validate_python(value, from_attributes=True)
+
+
+@lru_cache(maxsize=None)
+def _get_trusted_builder(model_class: type[BaseModel]) -> _Builder:
+    """Get a function that builds a model instance from trusted data without validation.
+
+    The data can be a dict, a model instance, or any object with the field attributes
+    (e.g., ORM objects). The nested models are built recursively.
+
+    *Version added: 3.2.0*
+    """
+    fields = [
+        (name, field.alias, _get_value_builder(field.annotation))
+        for name, field in model_class.__pydantic_fields__.items()
+    ]
+
+    def build(data: t.Any) -> t.Any:
+        if isinstance(data, BaseModel):
+            return data
+        values: dict[str, t.Any] = {}
+        if isinstance(data, dict):
+            for name, alias, builder in fields:
+                if alias is not None and alias in data:
+                    value = data[alias]
+                elif name in data:
+                    value = data[name]
+                else:
+                    continue
+                values[name] = value if builder is None or value is None else builder(value)
+        else:
+            for name, _, builder in fields:
+                value = getattr(data, name, _missing)
+                if value is _missing:
+                    continue
+                values[name] = value if builder is None or value is None else builder(value)
+        return construct(values)
+
+    construct = _get_constructor(model_class)
+    return build
+
+
+def _get_constructor(model_class: type[BaseModel]) -> _Builder:
+    """Get a function that creates a model instance from a dict of field values.
+
+    It's a faster `model_construct` for the models without private attributes, extra
+    fields, and `model_post_init`, which sets the instance attributes directly.
+    """
+    fields = model_class.model_fields
+    if (
+        model_class.__private_attributes__
+        or model_class.model_config.get('extra') == 'allow'
+        or getattr(model_class, '__pydantic_post_init__', True)
+        or any(getattr(field, 'default_factory_takes_data', False) for field in fields.values())
+    ):
+        return lambda values: model_class.model_construct(**values)
+
+    optional_fields = [(name, field) for name, field in fields.items() if not field.is_required()]
+    new = model_class.__new__
+    set_attribute = object.__setattr__
+
+    def construct(values: dict[str, t.Any]) -> t.Any:
+        fields_set = set(values)
+        for name, field in optional_fields:
+            if name not in values:
+                values[name] = field.get_default(call_default_factory=True)
+        instance = new(model_class)
+        set_attribute(instance, '__dict__', values)
+        set_attribute(instance, '__pydantic_fields_set__', fields_set)
+        set_attribute(instance, '__pydantic_extra__', None)
+        set_attribute(instance, '__pydantic_private__', None)
+        return instance
+
+    return construct
+
+
+@lru_cache(maxsize=None)
+def _get_type_adapter(model_class: type[BaseModel], many: bool) -> TypeAdapter:
+    """Get the cached `TypeAdapter` used to serialize the trusted output."""
+    return TypeAdapter(t.List[model_class] if many else model_class)  # type: ignore
+
+
+_missing = object()
+
+
 class PydanticAdapter(SchemaAdapter):
     """Schema adapter for Pydantic models."""
 
@@ -85,6 +213,7 @@ class PydanticAdapter(SchemaAdapter):
             raise TypeError(f'Expected Pydantic model, got {type(schema)}')
 
         self.many = many
+        self._output_counter = itertools.count()
 
     @property
     def schema_type(self) -> str:
@@ -204,8 +333,23 @@ class PydanticAdapter(SchemaAdapter):
                 {location: formatted_errors},
             ) from error
 
-    def serialize_output(self, data: t.Any, many: bool = False) -> t.Any:
-        """Serialize output using Pydantic with validation."""
+    def serialize_output(self, data: t.Any, many: bool = False, validate: bool = True) -> t.Any:
+        """Serialize output using Pydantic.
+
+        Arguments:
+            data: Data to serialize
+            many: Whether to serialize many objects
+            validate: Whether to validate the data that is not a model instance. If
+                `False`, the data is trusted and serialized without validation, except
+                one in every `OUTPUT_VALIDATION_SAMPLING` calls in debug mode.
+
+        *Version changed: 3.2.0*
+
+        - Add parameter `validate`.
+        """
+        if not validate and not self._should_sample():
+            return self._serialize_trusted_output(data, many)
+
         if many and isinstance(data, (list, tuple)):
             # Handle lists of data
             result = []
@@ -237,6 +381,25 @@ class PydanticAdapter(SchemaAdapter):
             validated = self.model_class.model_validate(data)
             return validated.model_dump(mode='json', by_alias=True)
 
+    def _should_sample(self) -> bool:
+        """Check whether the current trusted output should be validated."""
+        sampling: int | None = current_app.config['OUTPUT_VALIDATION_SAMPLING']
+        if not sampling or not current_app.debug:
+            return False
+        return next(self._output_counter) % sampling == 0
+
+    def _serialize_trusted_output(self, data: t.Any, many: bool) -> t.Any:
+        """Serialize the trusted output without validation."""
+        build = _get_trusted_builder(self.model_class)
+        is_list = isinstance(data, (list, tuple))
+        if is_list:
+            data = [build(item) for item in data]
+        else:
+            data = build(data)
+        return _get_type_adapter(self.model_class, is_list).dump_python(
+            data, mode='json', by_alias=True, warnings=False
+        )
+
     def get_openapi_schema(self, **kwargs: t.Any) -> dict[str, t.Any]:
         """Get OpenAPI schema from Pydantic model.
 
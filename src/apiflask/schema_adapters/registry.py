@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 import typing as t
+from importlib import import_module
+from importlib.util import find_spec
 
 from .base import SchemaAdapter
 
 if t.TYPE_CHECKING:
-    pass
+    from marshmallow import Schema
 
 try:
     from pydantic import BaseModel  # type: ignore[import-not-found]
@@ -15,13 +18,18 @@ except ImportError:
     BaseModel = None  # type: ignore
     HAS_PYDANTIC = False
 
-try:
-    from marshmallow import Schema
+# marshmallow is only imported when a marshmallow schema is used
+HAS_MARSHMALLOW = find_spec('marshmallow') is not None
 
-    HAS_MARSHMALLOW = True
-except ImportError:
-    Schema = None  # type: ignore
-    HAS_MARSHMALLOW = False
+
+def _get_marshmallow_schema_class() -> type[Schema] | None:
+    """Get the `marshmallow.Schema` class if marshmallow was imported.
+
+    An object can't be a marshmallow schema if marshmallow was never imported,
+    so the detection doesn't need to import it.
+    """
+    marshmallow = sys.modules.get('marshmallow')
+    return marshmallow.Schema if marshmallow is not None else None
 
 
 class SchemaRegistry:
@@ -32,20 +40,32 @@ class SchemaRegistry:
 
     def __init__(self) -> None:
         self._adapters: dict[str, type[SchemaAdapter]] = {}
+        # the adapters imported on the first use, maps the name to the module and class name
+        self._lazy_adapters: dict[str, tuple[str, str]] = {}
         self._register_default_adapters()
 
     def _register_default_adapters(self) -> None:
-        """Register the default schema adapters."""
-        if HAS_MARSHMALLOW:
-            from .marshmallow import MarshmallowAdapter
+        """Register the default schema adapters.
 
-            self.register('marshmallow', MarshmallowAdapter)
+        *Version changed: 3.2.0*
+
+        - The marshmallow adapter is imported on the first use.
+        """
+        if HAS_MARSHMALLOW:
+            self._lazy_adapters['marshmallow'] = (
+                f'{__package__}.marshmallow',
+                'MarshmallowAdapter',
+            )
 
         if HAS_PYDANTIC:
             from .pydantic import PydanticAdapter
 
             self.register('pydantic', PydanticAdapter)
 
+        from .empty import EmptySchemaAdapter
+
+        self.register('empty', EmptySchemaAdapter)
+
     def register(self, name: str, adapter_class: type[SchemaAdapter]) -> None:
         """Register a schema adapter.
 
@@ -53,8 +73,17 @@ class SchemaRegistry:
             name: Name of the adapter
             adapter_class: Schema adapter class
         """
+        self._lazy_adapters.pop(name, None)
         self._adapters[name] = adapter_class
 
+    def _get_adapter_class(self, name: str) -> type[SchemaAdapter] | None:
+        lazy_adapter = self._lazy_adapters.get(name)
+        if lazy_adapter is not None:
+            module_name, class_name = lazy_adapter
+            self._adapters[name] = getattr(import_module(module_name), class_name)
+            self._lazy_adapters.pop(name, None)
+        return self._adapters.get(name)
+
     def detect_schema_type(self, schema: t.Any) -> str:
         """Detect the type of schema.
 
@@ -79,17 +108,21 @@ class SchemaRegistry:
                 pass
 
         # Check for marshmallow schemas
-        if HAS_MARSHMALLOW:
+        schema_class = _get_marshmallow_schema_class()
+        if schema_class is not None:
             try:
-                if isinstance(schema, Schema):
+                if isinstance(schema, schema_class):
                     return 'marshmallow'
-                elif isinstance(schema, type) and issubclass(schema, Schema):
+                elif isinstance(schema, type) and issubclass(schema, schema_class):
                     return 'marshmallow'
                 elif isinstance(schema, dict):  # Dict schemas are marshmallow
                     return 'marshmallow'
             except TypeError:
                 # Not a class that can be checked with issubclass
                 pass
+        elif isinstance(schema, dict) and not schema:
+            # the empty schema doesn't need marshmallow
+            return 'empty'
 
         # Check for generic types like list[Model]
         if hasattr(schema, '__origin__') and hasattr(schema, '__args__'):
@@ -132,20 +165,24 @@ class SchemaRegistry:
                 many = True
 
         # For marshmallow
-        if isinstance(schema, Schema) and hasattr(schema, 'many'):
+        schema_class = _get_marshmallow_schema_class()
+        if (
+            schema_class is not None
+            and isinstance(schema, schema_class)
+            and hasattr(schema, 'many')
+        ):
             many = schema.many
 
         # Detect schema type from the inner schema
         if schema_type is None:
             schema_type = self.detect_schema_type(inner_schema)
 
-        if schema_type not in self._adapters:
-            available = ', '.join(self._adapters.keys())
+        adapter_class = self._get_adapter_class(schema_type)
+        if adapter_class is None:
+            available = ', '.join(self.get_available_types())
             raise ValueError(
                 f'Unsupported schema type: {schema_type}. ' f'Available types: {available}'
             )
-
-        adapter_class = self._adapters[schema_type]
         return adapter_class(inner_schema, schema_name=schema_name, many=many)
 
     def get_available_types(self) -> list[str]:
@@ -154,7 +191,7 @@ class SchemaRegistry:
         Returns:
             List of available schema type names
         """
-        return list(self._adapters.keys())
+        return [*self._lazy_adapters, *self._adapters]
 
 
 # Global registry instance
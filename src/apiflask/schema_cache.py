@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import typing as t
+
+
+def _get_versions() -> list[str | None]:
+    """Get the versions of the packages that affect the result of the schema conversions."""
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version
+
+    versions: list[str | None] = ['.'.join(map(str, sys.version_info[:2]))]
+    for name in ('apiflask', 'apispec', 'marshmallow', 'pydantic'):
+        try:
+            versions.append(version(name))
+        except PackageNotFoundError:
+            versions.append(None)
+    return versions
+
+
+# the attributes of the marshmallow fields that are not arguments of the field
+_FIELD_SKIPPED_ATTRIBUTES = {
+    'parent',
+    'name',
+    'root',
+    'nested',
+    'inner',
+    'tuple_fields',
+    'key_field',
+    'value_field',
+}
+
+
+class _Unsupported(Exception):
+    """The schema can't be fingerprinted reliably, so the conversion is not cached."""
+
+
+class SchemaCache:
+    """The on-disk cache of the schema conversions of the spec generation.
+
+    Each conversion is saved in a JSON file named with the fingerprint of the
+    schema, which contains the qualified names, the field definitions, and the
+    hash of the source files of the schema and the nested schemas, and the versions
+    of apiflask, apispec, marshmallow, and Pydantic. The files are written
+    atomically, so the processes can read the cache while it's written. The
+    least recently used files are removed when the size of the cache exceeds
+    `max_size`.
+
+    The schemas that can't be fingerprinted (e.g., the schemas defined in the
+    interactive shell, nested with a string or a callable, or with a lambda or a
+    local function as a validator or a default) are not cached.
+
+    Arguments:
+        path: The directory of the cache files.
+        max_size: The max size of the cache files in bytes, or `None` for no limit.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_size: int | None = None) -> None:
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        self._versions = _get_versions()
+        self._source_hashes: dict[str, str] = {}
+        self._keys: dict[tuple[str, int, str | None], str | None] = {}
+        # the content of the files read or written by this instance, and the keys of
+        # the loaded files to touch in `prune`
+        self._contents: dict[str, str] = {}
+        self._loaded: set[str] = set()
+
+    def get_key(self, kind: str, schema: t.Any, location: str | None = None) -> str | None:
+        """Get the cache key of a schema conversion, or `None` if it can't be cached.
+
+        Arguments:
+            kind: The kind of the conversion, `'json_schema'` or `'parameters'`.
+            schema: The schema to convert.
+            location: The location of the parameters.
+        """
+        memo_key = (kind, id(schema), location)
+        if memo_key not in self._keys:
+            try:
+                signature = self._signature(schema, set())
+            except _Unsupported:
+                self._keys[memo_key] = None
+            else:
+                data = json.dumps([self._versions, kind, location, signature])
+                self._keys[memo_key] = hashlib.sha256(data.encode()).hexdigest()
+        return self._keys[memo_key]
+
+    def _get_file(self, key: str) -> str:
+        return os.path.join(self.path, f'{key}.json')
+
+    def has(self, kind: str, schema: t.Any, location: str | None = None) -> bool:
+        """Check if the conversion of the schema is in the cache."""
+        key = self.get_key(kind, schema, location)
+        return key is not None and os.path.exists(self._get_file(key))
+
+    def load(self, key: str) -> t.Any | None:
+        """Get the cached result of a conversion, return `None` on cache miss.
+
+        The file is only read once, each call gets a new copy of the result.
+        """
+        content = self._contents.get(key)
+        if content is None:
+            try:
+                with open(self._get_file(key), encoding='utf-8') as f:
+                    content = f.read()
+            except OSError:
+                return None
+            self._contents[key] = content
+        self._loaded.add(key)
+        try:
+            return json.loads(content)
+        except ValueError:
+            return None
+
+    def save(self, key: str, value: t.Any) -> None:
+        """Save the result of a conversion, the values that can't be saved as JSON are skipped."""
+        try:
+            content = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        # the tuples and other values that are changed by the JSON round trip
+        if json.loads(content) != value:
+            return
+        path = self._get_file(key)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        else:
+            self._contents[key] = content
+
+    def prune(self) -> None:
+        """Remove the least recently used files until the size of the cache fits `max_size`.
+
+        The modification times of the files loaded by this instance are updated first.
+        """
+        for key in self._loaded:
+            try:
+                os.utime(self._get_file(key))
+            except OSError:
+                pass
+        self._loaded.clear()
+        if self.max_size is None:
+            return
+        entries = []
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if entry.name.endswith('.json'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+
+    def _get_source_hash(self, obj: type | t.Callable) -> str:
+        """Get the hash of the source file of the module that defines the class or function."""
+        module_name = obj.__module__
+        if module_name not in self._source_hashes:
+            path = getattr(sys.modules.get(module_name), '__file__', None)
+            if path is None:
+                raise _Unsupported(module_name)
+            try:
+                with open(path, 'rb') as f:
+                    self._source_hashes[module_name] = hashlib.sha256(f.read()).hexdigest()
+            except OSError as e:
+                raise _Unsupported(module_name) from e
+        return self._source_hashes[module_name]
+
+    def _class_signature(self, cls: type) -> list[str]:
+        return [f'{cls.__module__}.{cls.__qualname__}', self._get_source_hash(cls)]
+
+    def _signature(self, schema: t.Any, seen: set[int]) -> t.Any:
+        """Get the signature of a marshmallow schema, a Pydantic model, or `list[Model]`."""
+        if isinstance(schema, dict):
+            return [
+                [str(name), self._field_signature(field, seen)] for name, field in schema.items()
+            ]
+        args = t.get_args(schema)
+        if args:
+            return [
+                repr(t.get_origin(schema)),
+                [self._annotation_signature(arg, seen) for arg in args],
+            ]
+        schema_class = schema if isinstance(schema, type) else type(schema)
+        signature: list[t.Any] = self._class_signature(schema_class)
+        if id(schema) in seen:
+            return signature
+        seen = seen | {id(schema)}
+        model_fields = getattr(schema_class, 'model_fields', None)
+        if isinstance(model_fields, dict):  # Pydantic models
+            signature.append(self._value_signature(dict(schema_class.model_config)))  # type: ignore
+            for name, field in model_fields.items():
+                # the arguments shown in the repr of the field, with the callables
+                arguments = {
+                    key: getattr(field, key, value)
+                    for key, value in field.__repr_args__()
+                    if key != 'annotation'
+                }
+                signature.append(
+                    [
+                        name,
+                        self._value_signature(arguments),
+                        self._annotation_signature(field.annotation, seen),
+                    ]
+                )
+            return signature
+        fields = getattr(schema, 'fields', None)
+        if not isinstance(fields, dict):
+            fields = getattr(schema_class, '_declared_fields', None)
+        if not isinstance(fields, dict):
+            raise _Unsupported(schema_class)
+        for name, field in fields.items():
+            signature.append([name, self._field_signature(field, seen)])
+        if not isinstance(schema, type):
+            only = sorted(schema.only) if schema.only is not None else None
+            signature.append(repr([schema.many, schema.partial, only, sorted(schema.exclude)]))
+        return signature
+
+    def _field_signature(self, field: t.Any, seen: set[int]) -> t.Any:
+        """Get the signature of a marshmallow field, including the nested schemas."""
+        # the arguments of the field, the nested schemas and fields are added below
+        arguments = {
+            name: value
+            for name, value in vars(field).items()
+            if not name.startswith('_') and name not in _FIELD_SKIPPED_ATTRIBUTES
+        }
+        signature = [self._class_signature(type(field)), self._value_signature(arguments)]
+        nested = getattr(field, 'nested', None)
+        if nested is not None:
+            if isinstance(nested, str) or (callable(nested) and not isinstance(nested, type)):
+                raise _Unsupported(nested)
+            signature.append(self._signature(nested, seen))
+        for inner in [getattr(field, 'inner', None), *getattr(field, 'tuple_fields', [])]:
+            if inner is not None:
+                signature.append(self._field_signature(inner, seen))
+        for name in ('key_field', 'value_field'):
+            if getattr(field, name, None) is not None:
+                signature.append(self._field_signature(getattr(field, name), seen))
+        return signature
+
+    def _value_signature(self, value: t.Any) -> t.Any:
+        """Get the signature of an argument of a field, without the memory addresses.
+
+        The functions are named with the qualified names and the hash of the source
+        files. The lambdas, the local functions, and the objects without a stable
+        repr can't be told apart across the processes, so they are not cached.
+        """
+        if isinstance(value, dict):
+            items = sorted(value.items(), key=lambda item: repr(item[0]))
+            return [[repr(key), self._value_signature(item)] for key, item in items]
+        if isinstance(value, (list, tuple)):
+            return [self._value_signature(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted(json.dumps(self._value_signature(item)) for item in value)
+        if isinstance(value, type) or inspect.isroutine(value):
+            module_name = getattr(value, '__module__', None)
+            qualname = getattr(value, '__qualname__', '<unknown>')
+            if module_name is None or '<' in qualname:
+                raise _Unsupported(value)
+            if module_name == 'builtins':
+                return f'builtins.{qualname}'
+            return [f'{module_name}.{qualname}', self._get_source_hash(value)]
+        signature = repr(value)
+        if ' at 0x' in signature:
+            raise _Unsupported(value)
+        return signature
+
+    def _annotation_signature(self, annotation: t.Any, seen: set[int]) -> t.Any:
+        """Get the signature of a type annotation of a Pydantic field."""
+        if isinstance(annotation, type) and hasattr(annotation, 'model_fields'):
+            return self._signature(annotation, seen)
+        args = t.get_args(annotation)
+        if args:
+            return [repr(annotation), [self._annotation_signature(arg, seen) for arg in args]]
+        if isinstance(annotation, type) and annotation.__module__ != 'builtins':
+            # the enums, the dataclasses, and other classes
+            try:
+                return self._class_signature(annotation)
+            except _Unsupported:
+                return f'{annotation.__module__}.{annotation.__qualname__}'
+        return repr(annotation)
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+import sys
 import typing as t
 
-from marshmallow import Schema as BaseSchema
-from marshmallow.fields import Integer
-from marshmallow.fields import URL
 from pydantic import AnyUrl
 from pydantic import BaseModel
+from pydantic import field_serializer
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ._marshmallow_schemas import EmptySchema as EmptySchema
+    from ._marshmallow_schemas import FileSchema as FileSchema
+    from ._marshmallow_schemas import PaginationSchema as PaginationSchema
+    from ._marshmallow_schemas import Schema as Schema
+
+__all__ = [
+    'validation_error_detail_schema',
+    'validation_error_schema',
+    'http_error_schema',
+    'Schema',
+    'EmptySchema',
+    'PaginationSchema',
+    'PaginationModel',
+    'FileSchema',
+]
+
+# the schemas based on marshmallow are imported on the first access,
+# so the apps that only use Pydantic models don't import marshmallow
+_marshmallow_schema_names = ('Schema', 'EmptySchema', 'PaginationSchema', 'FileSchema')
 
 
 # schema for the detail object of validation error response
@@ -41,40 +61,6 @@ http_error_schema: dict[str, t.Any] = {
 }
 
 
-class Schema(BaseSchema):
-    """A base schema for all schemas. Equivalent to `marshmallow.Schema`.
-
-    *Version Added: 1.2.0*
-    """
-
-    pass
-
-
-class EmptySchema(Schema):
-    """An empty schema used to generate empty response/schema.
-
-    *Version changed: 3.0.0*
-
-    - Removed from docs and should only be used internally. Use `{}` instead.
-    """
-
-    pass
-
-
-class PaginationSchema(Schema):
-    """A schema for common pagination information."""
-
-    page = Integer()
-    per_page = Integer()
-    pages = Integer()
-    total = Integer()
-    current = URL()
-    next = URL()
-    prev = URL()
-    first = URL()
-    last = URL()
-
-
 class PaginationModel(BaseModel):
     """A model for common pagination information."""
 
@@ -88,59 +74,38 @@ class PaginationModel(BaseModel):
     first: t.Union[AnyUrl, t.Literal['']]
     last: t.Union[AnyUrl, t.Literal['']]
 
+    @field_serializer('current', 'next', 'prev', 'first', 'last')
+    def _serialize_url(self, value: t.Any) -> str:
+        return str(value)
 
-class FileSchema(Schema):
-    """A schema for file response.
-
-    This is used to represent a file response in OpenAPI spec. If you want to
-    embed a file as base64 string in the JSON body, you can use the
-    `apiflask.fields.File` field instead.
-
-    Example:
-
-    ```python
-    from apiflask.schemas import FileSchema
-    from flask import send_from_directory
-
-    @app.get('/images/<filename>')
-    @app.output(
-        FileSchema(type='string', format='binary'),
-        content_type='image/png',
-        description='An image file'
-    )
-    @app.doc(summary="Returns the image file")
-    def get_image(filename):
-        return send_from_directory(app.config['IMAGE_FOLDER'], filename)
-    ```
-
-    The output OpenAPI spec will be:
-
-    ```yaml
-    paths:
-    /images/{filename}:
-      get:
-        summary: Returns the image file
-        responses:
-          '200':
-            description: An image file
-            content:
-              image/png:
-                schema:
-                  type: string
-                  format: binary
-    ```
-
-    *Version Added: 2.0.0*
-    """
+    @classmethod
+    def from_trusted(cls, **data: t.Any) -> PaginationModel:
+        """Create a pagination model from trusted data without validation.
 
-    def __init__(self, *, type: str = 'string', format: str = 'binary') -> None:
-        """
-        Arguments:
-            type: The type of the file. Defaults to `string`.
-            format: The format of the file, one of `binary` and `base64`. Defaults to `binary`.
+        The URLs built by [`pagination_builder`][apiflask.helpers.pagination_builder]
+        come from Flask's URL routing, so the `AnyUrl` validation is skipped. Only
+        use it for the data you built yourself.
+
+        *Version added: 3.2.0*
         """
-        self.type = type
-        self.format = format
+        return cls.model_construct(**data)
+
 
-    def __repr__(self) -> str:
-        return f'schema: \n  type: {self.type}\n  format: {self.format}'
+def __getattr__(name: str) -> t.Any:
+    if name not in _marshmallow_schema_names:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from . import _marshmallow_schemas
+
+    value = getattr(_marshmallow_schemas, name)
+    globals()[name] = value
+    return value
+
+
+def _is_schema_instance(obj: t.Any, name: str) -> bool:
+    """Check if the object is an instance of the marshmallow schema class with the given name.
+
+    It doesn't import marshmallow, since the object can't be an instance of these
+    classes if they were never imported.
+    """
+    module = sys.modules.get(f'{__package__}._marshmallow_schemas')
+    return module is not None and isinstance(obj, getattr(module, name))
@@ -12,6 +12,8 @@ from flask_httpauth import MultiAuth as BaseMultiAuth
 from werkzeug.datastructures import Authorization
 
 from .exceptions import HTTPError
+from .metrics import mark_request_failure
+from .timing import timed
 from .types import ErrorCallbackType
 from .types import HTTPAuthType
 from .types import ResponseReturnValueType
@@ -29,11 +31,18 @@ class _AuthBase:
         self.description = description
         self.security_scheme_name = security_scheme_name
         self.error_handler(self._auth_error_handler)  # type: ignore
+        self._span_attributes = {'apiflask.auth.class': type(self).__name__}
 
     @property
     def current_user(self) -> None | t.Any:
         return g.get('flask_httpauth_user', None)
 
+    def authenticate(self, auth: Authorization | None, stored_password: t.Any) -> t.Any:
+        return timed('auth', self._span_attributes, super().authenticate, auth, stored_password)  # type: ignore
+
+    def authorize(self, role: t.Any, user: t.Any, auth: Authorization | None) -> t.Any:
+        return timed('auth', self._span_attributes, super().authorize, role, user, auth)  # type: ignore
+
     @staticmethod
     def _auth_error_handler(status_code: int) -> ResponseReturnValueType:
         """The default error handler for Flask-HTTPAuth.
@@ -45,6 +54,7 @@ class _AuthBase:
         - The default reason phrase is used for auth errors.
         - It will call the `app.error_callback` for auth errors.
         """
+        mark_request_failure('auth')
         error = HTTPError(status_code)
         if current_app.json_errors:  # type: ignore
             return current_app.error_callback(error)  # type: ignore
@@ -78,7 +88,12 @@ class _AuthBase:
 
         *Version added: 0.9.0*
         """
-        self.error_handler(lambda status_code: f(HTTPError(status_code)))  # type: ignore
+
+        def error_handler(status_code: int) -> ResponseReturnValueType:
+            mark_request_failure('auth')
+            return f(HTTPError(status_code))
+
+        self.error_handler(error_handler)  # type: ignore
 
 
 class HTTPBasicAuth(_AuthBase, BaseHTTPBasicAuth, SecurityScheme):
@@ -26,13 +26,23 @@ JSON_SPEC_MIMETYPE: str = 'application/json'
 LOCAL_SPEC_PATH: str | None = None
 LOCAL_SPEC_JSON_INDENT: int = 2
 SYNC_LOCAL_SPEC: bool | None = None
+SYNC_LOCAL_SPEC_BACKGROUND: bool = False
 SPEC_PROCESSOR_PASS_OBJECT: bool = False
+SPEC_SOURCE: str = 'app'
+SPEC_FINGERPRINT_MISMATCH: str = 'warn'
+SUB_SPECS: bool = False
+SPEC_PARALLEL: str | None = None
+SPEC_PARALLEL_WORKERS: int | None = None
+SCHEMA_CACHE_PATH: str | None = None
+SCHEMA_CACHE_MAX_SIZE: int | None = 50 * 1024 * 1024
 SPEC_DECORATORS: list[t.Callable] | None = None
 DOCS_DECORATORS: list[t.Callable] | None = None
 SWAGGER_UI_OAUTH_REDIRECT_DECORATORS: list[t.Callable] | None = None
+METRICS_DECORATORS: list[t.Callable] | None = None
 # Automation behavior control
 AUTO_TAGS: bool = True
 AUTO_SERVERS: bool = True
+AUTO_SERVERS_HOSTS: list[str] | None = None
 AUTO_OPERATION_SUMMARY: bool = True
 AUTO_OPERATION_DESCRIPTION: bool = True
 AUTO_OPERATION_ID: bool = False
@@ -51,8 +61,53 @@ VALIDATION_ERROR_SCHEMA: OpenAPISchemaType = validation_error_schema
 HTTP_ERROR_SCHEMA: OpenAPISchemaType = http_error_schema
 BASE_RESPONSE_SCHEMA: OpenAPISchemaType | None = None
 BASE_RESPONSE_DATA_KEY: str = 'data'
+VALIDATE_OUTPUT: bool = True
+OUTPUT_VALIDATION_SAMPLING: int | None = None
+COMPILE_OUTPUT_SCHEMAS: bool = False
+# Request timing
+REQUEST_TIMING: bool = False
+SERVER_TIMING_HEADER: bool = True
+# Tracing
+TRACING: bool = False
+# Metrics
+METRICS: bool = False
+METRICS_LATENCY_BUCKETS: list[float] = [
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+]
+METRICS_SIZE_BUCKETS: list[float] = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+# Profiling
+PROFILE_ROUTES: list[str] | None = None
+PROFILE_SAMPLE_RATE: float = 1.0
+PROFILE_DIR: str | None = None
+# Response caching
+RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+# Response compression
+COMPRESS_RESPONSES: bool = False
+COMPRESS_MIN_SIZE: int = 500
+COMPRESS_ALGORITHMS: list[str] = ['br', 'zstd', 'gzip']
+COMPRESS_LEVELS: dict[str, int] = {'br': 4, 'zstd': 3, 'gzip': 6}
+COMPRESS_MIMETYPES: list[str] = [
+    'application/json',
+    'application/problem+json',
+    'text/html',
+    'text/plain',
+    'text/vnd.yaml',
+]
 # API docs
 DOCS_FAVICON: str = 'https://apiflask.com/_assets/favicon.png'
+DOCS_CACHE_CONTROL: str | None = 'no-cache'
+DOCS_ASSETS_FOLDER: str | None = None
 REDOC_USE_GOOGLE_FONT: bool = True
 REDOC_STANDALONE_JS: str = 'https://cdn.redoc.ly/redoc/latest/bundles/\
 redoc.standalone.js'  # TODO: rename to REDOC_JS
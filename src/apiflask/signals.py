@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from flask.signals import Namespace
+
+_signals = Namespace()
+
+#: Sent when the timing of a request is finished, with the `timings` keyword
+#: argument (a dict of the phase durations in milliseconds). The sender is the app.
+#:
+#: *Version added: 3.2.0*
+request_timed = _signals.signal('request-timed')
@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import enum
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import typing as t
+import warnings
+from contextlib import contextmanager
+
+from .openapi import default_bypassed_endpoints
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from flask import Flask
+
+# the top-level key of the spec file to save the fingerprint of the app
+FINGERPRINT_KEY = 'x-apiflask-fingerprint'
+
+
+# the config that affects the generated spec
+_SPEC_CONFIG_KEYS = [
+    'OPENAPI_VERSION',
+    'SERVERS',
+    'TAGS',
+    'EXTERNAL_DOCS',
+    'INFO',
+    'DESCRIPTION',
+    'TERMS_OF_SERVICE',
+    'CONTACT',
+    'LICENSE',
+    'SECURITY_SCHEMES',
+    'SPEC_PROCESSOR_PASS_OBJECT',
+    'AUTO_TAGS',
+    'AUTO_SERVERS',
+    'AUTO_OPERATION_SUMMARY',
+    'AUTO_OPERATION_DESCRIPTION',
+    'AUTO_OPERATION_ID',
+    'AUTO_200_RESPONSE',
+    'AUTO_404_RESPONSE',
+    'AUTO_VALIDATION_ERROR_RESPONSE',
+    'AUTO_AUTH_ERROR_RESPONSE',
+    'SUCCESS_DESCRIPTION',
+    'NOT_FOUND_DESCRIPTION',
+    'VALIDATION_ERROR_DESCRIPTION',
+    'AUTH_ERROR_DESCRIPTION',
+    'VALIDATION_ERROR_STATUS_CODE',
+    'AUTH_ERROR_STATUS_CODE',
+    'VALIDATION_ERROR_SCHEMA',
+    'HTTP_ERROR_SCHEMA',
+    'BASE_RESPONSE_SCHEMA',
+    'BASE_RESPONSE_DATA_KEY',
+]
+# the attributes of the marshmallow fields that refer to other objects
+_FIELD_SKIPPED_ATTRIBUTES = {'parent', 'root', 'name', 'validators', 'nested', 'inner'}
+
+
+def _qualified_name(obj: t.Any) -> str:
+    return f'{obj.__module__}.{obj.__qualname__}'
+
+
+def _is_plain(value: t.Any) -> bool:
+    """Check if the value only contains the JSON-like values."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_plain(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain(item) for item in value)
+    return False
+
+
+def _get_attributes(obj: t.Any) -> dict[str, t.Any]:
+    """Get the public attributes of an object, including the slots."""
+    attributes = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            if name not in attributes and hasattr(obj, name):
+                attributes[name] = getattr(obj, name)
+    return {name: value for name, value in attributes.items() if not name.startswith('_')}
+
+
+def _object_signature(obj: t.Any, seen: set[int], skipped: t.Container[str] = ()) -> t.Any:
+    """Get the signature of an object (e.g., a validator) with its plain attributes."""
+    name = _qualified_name(type(obj))
+    if id(obj) in seen:
+        return name
+    seen = seen | {id(obj)}
+    return [
+        name,
+        [
+            [attribute, _canonical(value, seen)]
+            for attribute, value in sorted(_get_attributes(obj).items())
+            if attribute not in skipped and (_is_plain(value) or callable(value))
+        ],
+    ]
+
+
+def _callable_signature(func: t.Any) -> t.Any:
+    """Get the signature of a function with the hash of its source code.
+
+    The bytecode is used when the source is not available, which may differ
+    across the Python versions.
+    """
+    func = getattr(func, '__func__', func)
+    name = _qualified_name(func) if hasattr(func, '__qualname__') else type(func).__name__
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = func.__code__
+        consts = [repr(const) for const in code.co_consts if _is_plain(const)]
+        source = code.co_code + repr(consts).encode()
+    return [name, hashlib.sha256(source).hexdigest()]
+
+
+def _schema_signature(schema: t.Any, seen: set[int]) -> t.Any:
+    """Get the signature of a marshmallow schema or a Pydantic model.
+
+    The signature contains the fields with their options, validators, metadata,
+    and defaults, and the options of the schema, so the fingerprint changes when
+    a field is added, removed, or changed.
+    """
+    schema_class = schema if isinstance(schema, type) else type(schema)
+    name = _qualified_name(schema_class)
+    if id(schema_class) in seen and name != 'marshmallow.schema.GeneratedSchema':
+        return name
+    seen = seen | {id(schema_class)}
+    model_fields = getattr(schema_class, 'model_fields', None)
+    if isinstance(model_fields, dict):  # Pydantic models
+        return [
+            name,
+            schema_class.__doc__,
+            _canonical(dict(schema_class.model_config), seen),  # type: ignore[attr-defined]
+            [
+                [
+                    field_name,
+                    _annotation_signature(field.annotation, seen),
+                    field.is_required(),
+                    _canonical(field.default, seen),
+                    [_object_signature(item, seen) for item in field.metadata],
+                    _object_signature(field, seen, {'annotation', 'default', 'metadata'}),
+                ]
+                for field_name, field in model_fields.items()
+            ],
+        ]
+    # marshmallow schemas
+    fields = schema._declared_fields if isinstance(schema, type) else schema.fields  # type: ignore
+    meta = getattr(schema_class, 'Meta', None)
+    signature: list[t.Any] = [
+        name,
+        schema_class.__doc__,
+        _object_signature(meta, seen) if meta is not None else None,
+        [[field_name, _field_signature(field, seen)] for field_name, field in fields.items()],
+    ]
+    if not isinstance(schema, type):
+        signature.append(
+            [
+                schema.many,
+                _canonical(schema.partial, seen),
+                _canonical(schema.only, seen),
+                sorted(schema.exclude),
+            ]
+        )
+    return signature
+
+
+def _field_signature(field: t.Any, seen: set[int]) -> t.Any:
+    """Get the signature of a marshmallow field.
+
+    It contains the options (e.g., `required`, `data_key`, the defaults, and the
+    metadata), the validators, and the nested schemas and the inner fields.
+    """
+    signature = [
+        _object_signature(field, seen, _FIELD_SKIPPED_ATTRIBUTES),
+        [_canonical(validator, seen) for validator in getattr(field, 'validators', [])],
+    ]
+    for attribute in ('load_default', 'dump_default', 'enum'):
+        if hasattr(field, attribute):
+            signature.append(_canonical(getattr(field, attribute), seen))
+    nested = getattr(field, 'nested', None)
+    if nested is not None and not isinstance(nested, str):
+        signature.append(_canonical(nested, seen))
+    for inner in [getattr(field, 'inner', None), *getattr(field, 'tuple_fields', [])]:
+        if inner is not None:
+            signature.append(_field_signature(inner, seen))
+    for attribute in ('key_field', 'value_field'):
+        if getattr(field, attribute, None) is not None:
+            signature.append(_field_signature(getattr(field, attribute), seen))
+    return signature
+
+
+def _annotation_signature(annotation: t.Any, seen: set[int]) -> t.Any:
+    if isinstance(annotation, type) and hasattr(annotation, 'model_fields'):
+        return _schema_signature(annotation, seen)
+    args = t.get_args(annotation)
+    if args:
+        return [
+            repr(t.get_origin(annotation)),
+            [
+                _object_signature(arg, seen)
+                if _is_metadata(arg)
+                else _annotation_signature(arg, seen)
+                for arg in args
+            ],
+        ]
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return _canonical(annotation, seen)
+    return repr(annotation)
+
+
+def _is_metadata(value: t.Any) -> bool:
+    """Check if the value is the metadata of `Annotated` (e.g., `Field(...)` or `Gt(1)`)."""
+    return (
+        not isinstance(value, type)
+        and t.get_origin(value) is None
+        and (hasattr(value, '__dict__') or hasattr(type(value), '__slots__'))
+    )
+
+
+def _is_schema(obj: t.Any) -> bool:
+    schema_class = obj if isinstance(obj, type) else type(obj)
+    return hasattr(schema_class, 'model_fields') or hasattr(schema_class, '_declared_fields')
+
+
+def _is_field(obj: t.Any) -> bool:
+    return hasattr(obj, '_deserialize') and hasattr(obj, 'validators')
+
+
+def _canonical(value: t.Any, seen: set[int]) -> t.Any:
+    """Convert the value to a JSON serializable value that is stable across processes."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return [[str(key), _canonical(item, seen)] for key, item in sorted(value.items(), key=str)]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, seen) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(_canonical(item, seen)) for item in value)
+    if isinstance(value, enum.Enum):
+        return [_qualified_name(type(value)), _canonical(value.value, seen)]
+    if isinstance(value, type) and issubclass(value, enum.Enum):
+        return [_qualified_name(value), [_canonical(member.value, seen) for member in value]]
+    if t.get_origin(value) is not None:  # list[Model]
+        return _annotation_signature(value, seen)
+    if _is_schema(value):
+        return _schema_signature(value, seen)
+    if _is_field(value):
+        return _field_signature(value, seen)
+    if isinstance(value, type):
+        return _qualified_name(value)
+    if hasattr(value, '__code__') or hasattr(getattr(value, '__func__', None), '__code__'):
+        return _callable_signature(value)
+    # the objects like the validators and the auth instances, with their plain attributes
+    return _object_signature(value, seen)
+
+
+def get_spec_fingerprint(app: Flask) -> str:
+    """Get the fingerprint of the routes, the schemas, and the spec config of the application.
+
+    The fingerprint is the SHA-256 hash of the URL rules, the API information
+    (input, output, and other OpenAPI fields) of the view functions with the
+    fields, validators, metadata, and defaults of the schemas, the spec-related
+    config (e.g., `INFO`, `SERVERS`, `TAGS`, and `BASE_RESPONSE_SCHEMA`), the
+    blueprint tags, and the bytecode of the spec processor, which is much cheaper
+    to get than generating the spec. The spec, docs, and static endpoints are
+    skipped since they don't appear in the spec. It's saved in the spec file written by the
+    `flask spec` command when the `SPEC_SOURCE` config is `'file'`, and checked
+    when the spec file is loaded.
+
+    Arguments:
+        app: The application instance.
+
+    *Version added: 3.2.0*
+    """
+    routes = []
+    for rule in sorted(app.url_map.iter_rules(), key=lambda rule: (rule.rule, rule.endpoint)):
+        # the spec, docs, and static endpoints don't change the spec
+        if rule.endpoint in default_bypassed_endpoints:
+            continue
+        view_func = app.view_functions.get(rule.endpoint)
+        info = {
+            'doc': getattr(view_func, '__doc__', None),
+            'spec': getattr(view_func, '_spec', None),
+            'method_spec': getattr(view_func, '_method_spec', None),
+        }
+        routes.append(
+            [rule.rule, rule.endpoint, sorted(rule.methods or ()), _canonical(info, set())]
+        )
+    blueprints = [
+        [
+            name,
+            _canonical(getattr(blueprint, 'tag', None), set()),
+            getattr(blueprint, 'enable_openapi', True),
+        ]
+        for name, blueprint in sorted(app.blueprints.items())
+        if name not in ('openapi', 'metrics')
+    ]
+    spec_callback = getattr(app, 'spec_callback', None)
+    data = [
+        app.title,  # type: ignore[attr-defined]
+        app.version,  # type: ignore[attr-defined]
+        routes,
+        blueprints,
+        [[key, _canonical(app.config.get(key), set())] for key in _SPEC_CONFIG_KEYS],
+        _canonical(spec_callback, set()) if spec_callback is not None else None,
+    ]
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def load_spec_file(path: str) -> dict[str, t.Any]:
+    """Load the prebuilt spec file (JSON or YAML, depends on the file extension).
+
+    Arguments:
+        path: The path of the spec file.
+
+    *Version added: 3.2.0*
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    if str(path).endswith(('.yaml', '.yml')):
+        import yaml  # type: ignore
+
+        spec = yaml.safe_load(content)
+    else:
+        spec = json.loads(content)
+    if not isinstance(spec, dict):
+        raise ValueError(f'The spec file {path!r} should contain an object.')
+    return spec
+
+
+def check_spec_fingerprint(app: Flask, fingerprint: str | None, path: str) -> None:
+    """Compare the fingerprint of the spec file with the fingerprint of the application.
+
+    Warn or raise a `RuntimeError` on the mismatch, based on the
+    `SPEC_FINGERPRINT_MISMATCH` config.
+
+    *Version added: 3.2.0*
+    """
+    action = app.config['SPEC_FINGERPRINT_MISMATCH']
+    if action == 'ignore':
+        return
+    if action not in ('warn', 'error'):
+        raise ValueError(
+            "The SPEC_FINGERPRINT_MISMATCH config should be one of 'warn', 'error', "
+            f"and 'ignore', got {action!r}."
+        )
+    if fingerprint is None:
+        message = f'The spec file {path!r} has no fingerprint.'
+    elif fingerprint != get_spec_fingerprint(app):
+        message = f'The spec file {path!r} is out of date with the routes and schemas.'
+    else:
+        return
+    message += ' Regenerate it with the "flask spec" command.'
+    if action == 'error':
+        raise RuntimeError(message)
+    warnings.warn(message, stacklevel=3)
+
+
+@contextmanager
+def _file_lock(path: str) -> t.Iterator[None]:
+    """Hold an exclusive lock of the lock file, shared by the processes."""
+    with open(path, 'a+b') as f:
+        if sys.platform == 'win32':  # pragma: no cover
+            import msvcrt
+
+            f.seek(0)
+            # retries for 10 seconds before raising an OSError
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def write_spec_file(path: str | os.PathLike[str], content: bytes) -> bool:
+    """Write the spec file atomically if the content changed.
+
+    The content is written to a temporary file in the same directory, then moved to
+    the path with `os.replace`, so the readers never see a partial file. The
+    processes writing the same file are coordinated with the `<path>.lock` file.
+
+    Arguments:
+        path: The path of the spec file.
+        content: The content of the spec file.
+
+    Returns:
+        Whether the file was written.
+
+    *Version added: 3.2.0*
+    """
+    path = os.fspath(path)
+    with _file_lock(f'{path}.lock'):
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    return False
+        except FileNotFoundError:
+            pass
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    return True
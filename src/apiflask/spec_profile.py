@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+_current_spec_profile: ContextVar[SpecProfile | None] = ContextVar(
+    'apiflask_spec_profile', default=None
+)
+
+# the phases of the spec generation, the rest of the time is reported as `other`
+SPEC_PHASES = ['schemas', 'parameters', 'responses', 'operations', 'spec_processor']
+
+
+def _get_schema_label(schema: t.Any) -> str:
+    if t.get_origin(schema) is not None:
+        return repr(schema)
+    schema_class = schema if isinstance(schema, type) else type(schema)
+    return f'{schema_class.__module__}.{schema_class.__qualname__}'
+
+
+class SpecProfile:
+    """The profile of a spec generation.
+
+    The wall time of the generation is split into the phases:
+
+    - `schemas`: register the schemas to the components and convert them.
+    - `parameters`: convert the input schemas (e.g., query and headers) to the parameters.
+    - `responses`: build the responses, without the time of the schemas.
+    - `operations`: the rest of the time to build the operations.
+    - `spec_processor`: call the spec processor.
+    - `other`: the rest of the time (e.g., create the spec and convert it to a dict).
+
+    The time of a phase doesn't include the nested phases (e.g., the schemas
+    registered when building a response). The durations are in milliseconds.
+
+    Attributes:
+        total: The wall time of the generation.
+        phases: The total time of each phase.
+        rules: The time of each phase for each operation, the keys are
+            `'<METHOD> <rule>'` (e.g., `'GET /pets/<int:pet_id>'`).
+        schemas: The time of each phase for each schema class, the keys are
+            the qualified class names.
+        components: The size (bytes of compact JSON) of each component schema
+            in the generated spec.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.phases: dict[str, float] = {}
+        self.rules: dict[str, dict[str, float]] = {}
+        self.schemas: dict[str, dict[str, float]] = {}
+        self.components: dict[str, int] = {}
+        self._started_at = perf_counter()
+        # [phase, schema label, start time, time of the nested phases]
+        self._stack: list[list[t.Any]] = []
+        self._operation: str | None = None
+
+    def start(self, phase: str, schema: t.Any = None) -> None:
+        """Start a phase, optionally for a schema."""
+        label = None if schema is None else _get_schema_label(schema)
+        self._stack.append([phase, label, perf_counter(), 0.0])
+
+    def stop(self) -> None:
+        """Stop the current phase."""
+        phase, label, started_at, nested = self._stack.pop()
+        elapsed = perf_counter() - started_at
+        if self._stack:
+            self._stack[-1][3] += elapsed
+        duration = (elapsed - nested) * 1000
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+        if self._operation is not None:
+            phases = self.rules.setdefault(self._operation, {})
+            phases[phase] = phases.get(phase, 0.0) + duration
+        if label is not None:
+            phases = self.schemas.setdefault(label, {})
+            phases[phase] = phases.get(phase, 0.0) + duration
+
+    def start_operation(self, name: str) -> None:
+        """Start building an operation, the phases until it's finished are counted for it."""
+        self.finish_operation()
+        self._operation = name
+        self.start('operations')
+
+    def finish_operation(self) -> None:
+        """Finish building the current operation."""
+        if self._operation is not None:
+            self.stop()
+            self._operation = None
+
+    def finish(self) -> None:
+        """Finish the profile, called when the spec generation finished."""
+        self.finish_operation()
+        self.total = (perf_counter() - self._started_at) * 1000
+
+    def add_components(self, spec: dict[str, t.Any]) -> None:
+        """Record the size of the component schemas of the generated spec."""
+        for name, schema in spec.get('components', {}).get('schemas', {}).items():
+            self.components[name] = len(
+                json.dumps(schema, separators=(',', ':'), default=str).encode()
+            )
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """Get the profile as a JSON serializable dict, the items are sorted by cost."""
+
+        def sort(items: dict[str, dict[str, float]]) -> list[dict[str, t.Any]]:
+            result = [
+                {'name': name, 'total': sum(phases.values()), 'phases': phases}
+                for name, phases in items.items()
+            ]
+            return sorted(result, key=lambda item: item['total'], reverse=True)
+
+        phases = {phase: self.phases.get(phase, 0.0) for phase in SPEC_PHASES}
+        phases['other'] = max(self.total - sum(self.phases.values()), 0.0)
+        return {
+            'total': self.total,
+            'phases': phases,
+            'rules': sort(self.rules),
+            'schemas': sort(self.schemas),
+            'components': [
+                {'name': name, 'size': size}
+                for name, size in sorted(
+                    self.components.items(), key=lambda item: item[1], reverse=True
+                )
+            ],
+        }
+
+
+def get_spec_profile() -> SpecProfile | None:
+    """Get the profile of the current spec generation, `None` if it's not profiled.
+
+    *Version added: 3.2.0*
+    """
+    return _current_spec_profile.get()
+
+
+@contextmanager
+def spec_profiling() -> t.Iterator[SpecProfile]:
+    """Profile the spec generations in the block.
+
+    Examples:
+
+    ```python
+    from apiflask.spec_profile import spec_profiling
+
+    with spec_profiling() as profile:
+        app.spec
+
+    print(profile.to_dict()['schemas'][:10])
+    ```
+
+    *Version added: 3.2.0*
+    """
+    profile = SpecProfile()
+    token = _current_spec_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        profile.finish()
+        _current_spec_profile.reset(token)
+
+
+def profiled(
+    phase: str, schema: t.Any, func: t.Callable[..., t.Any], /, *args: t.Any, **kwargs: t.Any
+) -> t.Any:
+    """Call the function as a phase of the spec generation if the generation is profiled."""
+    profile = _current_spec_profile.get()
+    if profile is None:
+        return func(*args, **kwargs)
+    profile.start(phase, schema)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profile.stop()
+
+
+def spec_phase(phase: str) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    """Profile the calls of the decorated function as a phase of the spec generation."""
+
+    def decorator(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        @wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            return profiled(phase, None, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_spec_operation(name: str) -> None:
+    """Start profiling the building of an operation if the spec generation is profiled."""
+    profile = _current_spec_profile.get()
+    if profile is not None:
+        profile.start_operation(name)
+
+
+def finish_spec_operation() -> None:
+    """Finish profiling the building of the current operation."""
+    profile = _current_spec_profile.get()
+    if profile is not None:
+        profile.finish_operation()
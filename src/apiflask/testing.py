@@ -0,0 +1,631 @@
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import decimal
+import enum
+import ipaddress
+import random
+import string
+import typing as t
+import uuid
+from io import BytesIO
+
+from werkzeug.datastructures import FileStorage
+
+from .schema_adapters import registry
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from marshmallow import Schema
+    from marshmallow.fields import Field
+    from pydantic import BaseModel
+
+_Generator = t.Callable[[], t.Any]
+
+_DEFAULT_STRING_LENGTH = (3, 12)
+_DEFAULT_ITEMS = (1, 3)
+_DEFAULT_NUMBER_SPAN = 1000
+_EPOCH = dt.datetime(2020, 1, 1)
+_BODY_LOCATIONS = ['json', 'files', 'form', 'form_and_files', 'json_or_form']
+# a 1x1 PNG image, used as the file fields so it passes the common file type validators
+_FILE_CONTENT = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CYII='
+)
+_EXAMPLE_MAX_DEPTH = 8
+_string_formats: dict[str, str] = {
+    'date': '2024-01-01',
+    'date-time': '2024-01-01T00:00:00Z',
+    'time': '00:00:00',
+    'email': 'user@example.com',
+    'idn-email': 'user@example.com',
+    'uuid': '00000000-0000-4000-8000-000000000000',
+    'uri': 'https://example.com',
+    'url': 'https://example.com',
+    'hostname': 'example.com',
+    'ipv4': '127.0.0.1',
+    'ipv6': '::1',
+    'password': 'password',
+}
+
+
+class PayloadGenerator:
+    """Generate random but valid input data for marshmallow schemas and Pydantic models.
+
+    The schemas are resolved with the schema adapters registry (the same way as
+    `app.input`), and the values respect the validators of the fields, e.g., the
+    `Range`, `Length`, and `OneOf` validators of marshmallow, and the `gt`, `le`,
+    `min_length`, `max_length`, `multiple_of`, and `Literal` constraints of Pydantic.
+    The `Regexp` validators and the `pattern` constraints are not supported.
+
+    The generation is deterministic with a seed, and the generator functions of
+    each schema are built once and reused, so generating a large list is cheap.
+
+    Examples:
+
+    ```python
+    from apiflask.testing import PayloadGenerator
+
+    generator = PayloadGenerator(seed=42)
+    pet = generator.generate(PetIn)
+    pets = generator.generate(PetIn, many=True, count=10_000)
+    ```
+
+    Arguments:
+        seed: The seed of the random generator.
+        max_depth: The maximum depth of the nested schemas, the optional nested
+            fields deeper than it are omitted.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self, seed: int | None = None, max_depth: int = 3) -> None:
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self._compiled: dict[t.Any, _Generator] = {}
+
+    def generate(self, schema: t.Any, many: bool = False, count: int = 10) -> t.Any:
+        """Generate the input data of the schema.
+
+        Arguments:
+            schema: The marshmallow schema (class, instance, or dict) or the Pydantic model.
+            many: Generate a list of `count` items.
+            count: The number of the items when `many` is `True`.
+        """
+        generate = self._get_generator(schema)
+        if many:
+            return [generate() for _ in range(count)]
+        return generate()
+
+    def generate_inputs(self, view_func: t.Callable[..., t.Any]) -> dict[str, t.Any]:
+        """Generate the data of each input location of a view function.
+
+        The input schemas are read from the `app.input` decorators of the view
+        function, the result is a dict of the location and the data, e.g.,
+        `{'query': {...}, 'json': {...}}`.
+        """
+        spec = getattr(view_func, '_spec', {})
+        args = {location: schema for schema, location in spec.get('args') or []}
+        inputs = {}
+        for location in spec.get('input_arg_names', {}):
+            schema = spec['body'] if location in _BODY_LOCATIONS else args[location]
+            inputs[location] = self.generate(schema)
+        return inputs
+
+    def _get_generator(self, schema: t.Any) -> _Generator:
+        # the dict schemas are converted to a new schema class every time
+        key = id(schema) if isinstance(schema, dict) else schema
+        generate = self._compiled.get(key)
+        if generate is None:
+            adapter = registry.create_adapter(schema)
+            if adapter.schema_type == 'marshmallow':
+                generate = self._compile_marshmallow(adapter.schema, 0)
+            elif adapter.schema_type == 'pydantic':
+                generate = self._compile_pydantic(adapter.model_class, 0)  # type: ignore
+            else:  # pragma: no cover
+                raise TypeError(f'Unsupported schema type: {adapter.schema_type}.')
+            self._compiled[key] = generate
+        return generate
+
+    # marshmallow
+
+    def _compile_marshmallow(self, schema: Schema, depth: int) -> _Generator:
+        generators = []
+        for name, field in schema.load_fields.items():
+            generate = self._compile_marshmallow_field(field, depth)
+            if generate is not None:
+                generators.append((field.data_key or name, generate))
+            elif field.required:
+                generators.append((field.data_key or name, dict))
+
+        def generate_schema() -> dict[str, t.Any]:
+            return {key: generate() for key, generate in generators}
+
+        return generate_schema
+
+    def _compile_marshmallow_field(self, field: Field, depth: int) -> _Generator | None:
+        from marshmallow import fields
+        from marshmallow import validate
+        from webargs.fields import DelimitedList
+        from webargs.fields import DelimitedTuple
+
+        from .fields import File
+
+        rng = self.random
+        constraints: dict[str, t.Any] = {}
+        for validator in field.validators:
+            if isinstance(validator, validate.OneOf):
+                choices = list(validator.choices)
+                return lambda: rng.choice(choices)
+            if isinstance(validator, validate.Equal):
+                comparable = validator.comparable
+                return lambda: comparable
+            if isinstance(validator, validate.Range):
+                constraints.update(
+                    minimum=validator.min,
+                    maximum=validator.max,
+                    exclusive_minimum=not validator.min_inclusive,
+                    exclusive_maximum=not validator.max_inclusive,
+                )
+            elif isinstance(validator, validate.Length):
+                if validator.equal is not None:
+                    constraints.update(min_length=validator.equal, max_length=validator.equal)
+                else:
+                    constraints.update(min_length=validator.min, max_length=validator.max)
+
+        if isinstance(field, fields.Constant):
+            constant = field.constant
+            return lambda: constant
+        if isinstance(field, (fields.Method, fields.Function)):
+            return None
+        if isinstance(field, fields.Nested):
+            if depth >= self.max_depth:
+                return None
+            nested = self._compile_marshmallow(field.schema, depth + 1)
+            if field.many:
+                return self._compile_list(nested, constraints)
+            return nested
+        if isinstance(field, fields.Pluck):  # pragma: no cover
+            return None
+        if isinstance(field, (DelimitedList, DelimitedTuple)):
+            inner = (
+                self._compile_marshmallow_field(field.inner, depth)
+                if isinstance(field, DelimitedList)
+                else None
+            )
+            delimiter = field.delimiter
+            if inner is None:
+                return lambda: delimiter.join(self._random_string({}) for _ in range(2))
+            items = self._compile_list(inner, constraints)
+            return lambda: delimiter.join(str(item) for item in items())
+        if isinstance(field, fields.List):
+            inner = self._compile_marshmallow_field(field.inner, depth)
+            return self._compile_list(inner or self._random_string_generator({}), constraints)
+        if isinstance(field, fields.Tuple):
+            elements = [
+                self._compile_marshmallow_field(element, depth) or self._random_string_generator({})
+                for element in field.tuple_fields
+            ]
+            return lambda: [generate() for generate in elements]
+        if isinstance(field, fields.Dict):
+            value_field = field.value_field
+            values = (
+                self._compile_marshmallow_field(value_field, depth) if value_field else None
+            ) or self._random_string_generator({})
+            keys = self._random_string_generator({})
+            return lambda: {keys(): values() for _ in range(rng.randint(*_DEFAULT_ITEMS))}
+        if isinstance(field, fields.Boolean):
+            return lambda: rng.random() < 0.5
+        if isinstance(field, fields.Integer):
+            return self._compile_number(constraints, integer=True)
+        if isinstance(field, fields.Decimal):
+            numbers = self._compile_number(constraints, integer=False)
+            # marshmallow stores the places as the exponent to quantize
+            exponent = field.places if field.places is not None else decimal.Decimal('0.01')
+            return lambda: str(decimal.Decimal(str(numbers())).quantize(exponent))
+        if isinstance(field, fields.Number):
+            return self._compile_number(constraints, integer=False)
+        if isinstance(field, fields.Email):
+            return lambda: f'{self._random_string({}).lower()}@example.com'
+        if isinstance(field, fields.URL):
+            return lambda: f'https://example.com/{self._random_string({}).lower()}'
+        if isinstance(field, fields.UUID):
+            return lambda: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        if isinstance(field, fields.String):
+            return self._random_string_generator(constraints)
+        if isinstance(field, File):
+            return self._random_file
+        # the fields serialized from Python values, e.g., dates and enums
+        values = self._get_python_value_generator(field)
+        if values is not None:
+            return lambda: field._serialize(values(), None, None)
+        return self._random_string_generator(constraints)
+
+    def _get_python_value_generator(self, field: Field) -> _Generator | None:
+        from marshmallow import fields
+
+        rng = self.random
+        if isinstance(field, fields.TimeDelta):
+            return lambda: dt.timedelta(seconds=rng.randint(0, 86400))
+        if isinstance(field, fields.Enum):
+            members = list(field.enum.__members__.values())
+            return lambda: rng.choice(members)
+        if isinstance(field, fields.IPv6):
+            return lambda: ipaddress.IPv6Address(rng.getrandbits(128))
+        if isinstance(field, (fields.IPv4, fields.IP)):
+            return lambda: ipaddress.IPv4Address(rng.getrandbits(32))
+        # marshmallow 3 makes Date and Time the subclasses of DateTime
+        if isinstance(field, fields.Date):
+            return lambda: self._random_datetime().date()
+        if isinstance(field, fields.Time):
+            return lambda: self._random_datetime().time()
+        if isinstance(field, fields.DateTime):
+            if isinstance(field, fields.AwareDateTime):
+                return lambda: self._random_datetime().replace(tzinfo=dt.timezone.utc)
+            return self._random_datetime
+        return None
+
+    # Pydantic
+
+    def _compile_pydantic(self, model_class: type[BaseModel], depth: int) -> _Generator:
+        generators = []
+        for name, field in model_class.model_fields.items():
+            constraints = _get_pydantic_constraints(field.metadata)
+            generate = self._compile_pydantic_type(field.annotation, constraints, depth)
+            alias = field.validation_alias if isinstance(field.validation_alias, str) else None
+            key = alias or field.alias or name
+            if generate is not None:
+                generators.append((key, generate))
+            elif field.is_required():
+                generators.append((key, dict))
+
+        def generate_model() -> dict[str, t.Any]:
+            return {key: generate() for key, generate in generators}
+
+        return generate_model
+
+    def _compile_pydantic_type(
+        self, annotation: t.Any, constraints: dict[str, t.Any], depth: int
+    ) -> _Generator | None:
+        from pydantic import BaseModel
+
+        rng = self.random
+        origin = t.get_origin(annotation)
+        args = t.get_args(annotation)
+        if origin is t.Annotated:
+            return self._compile_pydantic_type(
+                args[0], {**constraints, **_get_pydantic_constraints(args[1:])}, depth
+            )
+        if origin is t.Union or type(annotation).__name__ == 'UnionType':
+            options = [arg for arg in args if arg is not type(None)]
+            if not options:
+                return lambda: None
+            return self._compile_pydantic_type(options[0], constraints, depth)
+        if origin is t.Literal:
+            choices = list(args)
+            return lambda: rng.choice(choices)
+        if origin in (list, set, frozenset) or (
+            origin is not None and getattr(origin, '__name__', '') in ('Sequence', 'Iterable')
+        ):
+            inner = self._compile_pydantic_type(args[0] if args else t.Any, {}, depth)
+            if inner is None:
+                return None
+            items = self._compile_list(inner, constraints)
+            if origin in (set, frozenset):
+                # the duplicated items will be merged by the validation
+                return lambda: list(dict.fromkeys(_hashable(item) for item in items()))
+            return items
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                inner = self._compile_pydantic_type(args[0], {}, depth)
+                return self._compile_list(inner, constraints) if inner is not None else None
+            elements = [self._compile_pydantic_type(arg, {}, depth) for arg in args]
+            if any(element is None for element in elements):
+                return None
+            return lambda: [generate() for generate in elements]  # type: ignore
+        if origin is dict or (origin is not None and getattr(origin, '__name__', '') == 'Mapping'):
+            keys = self._compile_pydantic_type(args[0] if args else str, {}, depth)
+            values = self._compile_pydantic_type(args[1] if args else t.Any, {}, depth)
+            if keys is None or values is None:
+                return None
+            generate_key, generate_value = keys, values
+            return lambda: {
+                _hashable(generate_key()): generate_value()
+                for _ in range(rng.randint(*_DEFAULT_ITEMS))
+            }
+        if not isinstance(annotation, type):
+            return self._random_string_generator(constraints)
+
+        if issubclass(annotation, BaseModel):
+            if depth >= self.max_depth:
+                return None
+            return self._compile_pydantic(annotation, depth + 1)
+        if issubclass(annotation, enum.Enum):
+            values = [member.value for member in annotation]
+            return lambda: rng.choice(values)
+        if issubclass(annotation, bool):
+            return lambda: rng.random() < 0.5
+        if issubclass(annotation, int):
+            return self._compile_number(constraints, integer=True)
+        if issubclass(annotation, decimal.Decimal):
+            numbers = self._compile_number(constraints, integer=False)
+            exponent = decimal.Decimal(1).scaleb(-constraints.get('decimal_places', 2))
+            return lambda: str(decimal.Decimal(str(numbers())).quantize(exponent))
+        if issubclass(annotation, float):
+            return self._compile_number(constraints, integer=False)
+        if issubclass(annotation, dt.datetime):
+            return lambda: self._random_datetime().isoformat()
+        if issubclass(annotation, dt.date):
+            return lambda: self._random_datetime().date().isoformat()
+        if issubclass(annotation, dt.time):
+            return lambda: self._random_datetime().time().isoformat()
+        if issubclass(annotation, dt.timedelta):
+            return lambda: rng.randint(0, 86400)
+        if issubclass(annotation, uuid.UUID):
+            return lambda: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        if issubclass(annotation, FileStorage):
+            return self._random_file
+        if issubclass(annotation, (ipaddress.IPv6Address, ipaddress.IPv6Interface)):
+            return lambda: str(ipaddress.IPv6Address(rng.getrandbits(128)))
+        if issubclass(annotation, (ipaddress.IPv4Address, ipaddress.IPv4Interface)):
+            return lambda: str(ipaddress.IPv4Address(rng.getrandbits(32)))
+        name = annotation.__name__
+        if 'Email' in name:
+            return lambda: f'{self._random_string({}).lower()}@example.com'
+        if 'Url' in name or 'URL' in name:
+            return lambda: f'https://example.com/{self._random_string({}).lower()}'
+        return self._random_string_generator(constraints)
+
+    # shared
+
+    def _compile_list(self, generate: _Generator, constraints: dict[str, t.Any]) -> _Generator:
+        minimum, maximum = _get_length_range(constraints, _DEFAULT_ITEMS)
+        randint = self.random.randint
+        return lambda: [generate() for _ in range(randint(minimum, maximum))]
+
+    def _compile_number(self, constraints: dict[str, t.Any], integer: bool) -> _Generator:
+        rng = self.random
+        bounds = _get_number_bounds(constraints, integer)
+        if isinstance(bounds, tuple):
+            low, high, step = bounds
+            if integer:
+                return lambda: rng.randint(low, high) * step
+            return lambda: float(rng.randint(low, high) * step)
+        minimum, maximum = bounds.minimum, bounds.maximum
+
+        def generate_float() -> float:
+            value = rng.uniform(minimum, maximum)
+            if not bounds.contains(value):
+                return float((minimum + maximum) / 2)
+            return value
+
+        return generate_float
+
+    def _random_string_generator(self, constraints: dict[str, t.Any]) -> _Generator:
+        return lambda: self._random_string(constraints)
+
+    def _random_string(self, constraints: dict[str, t.Any]) -> str:
+        minimum, maximum = _get_length_range(constraints, _DEFAULT_STRING_LENGTH)
+        length = self.random.randint(minimum, maximum)
+        return ''.join(self.random.choices(string.ascii_letters, k=length))
+
+    def _random_datetime(self) -> dt.datetime:
+        return _EPOCH + dt.timedelta(seconds=self.random.randint(0, 10 * 365 * 86400))
+
+    def _random_file(self) -> FileStorage:
+        return _make_file(self._random_string({}).lower())
+
+
+def generate_payload(
+    schema: t.Any, many: bool = False, count: int = 10, seed: int | None = None
+) -> t.Any:
+    """Generate random but valid input data for a marshmallow schema or a Pydantic model.
+
+    A shortcut of `PayloadGenerator(seed).generate(schema, many, count)`.
+
+    Examples:
+
+    ```python
+    from apiflask.testing import generate_payload
+
+    pets = generate_payload(PetIn, many=True, count=1000, seed=42)
+    ```
+
+    *Version added: 3.2.0*
+    """
+    return PayloadGenerator(seed).generate(schema, many=many, count=count)
+
+
+def generate_example(
+    schema: dict[str, t.Any], components: dict[str, t.Any] | None = None, _depth: int = 0
+) -> t.Any:
+    """Generate a deterministic value that is valid for the given OpenAPI schema object.
+
+    The `example`, `examples`, and `default` of the schema are used if present,
+    otherwise the simplest value that satisfies the constraints is generated. It
+    uses the same constraint handling as `PayloadGenerator`, the binary strings are
+    generated as a PNG file (`FileStorage`).
+
+    Arguments:
+        schema: The OpenAPI schema object.
+        components: The component schemas used to resolve the `$ref`.
+
+    *Version added: 3.2.0*
+    """
+    components = components or {}
+    if _depth > _EXAMPLE_MAX_DEPTH:
+        return None
+    if '$ref' in schema:
+        name = schema['$ref'].split('/components/schemas/', 1)[-1]
+        return generate_example(components.get(name, {}), components, _depth + 1)
+    for key in ('example', 'default', 'const'):
+        if schema.get(key) is not None:
+            return schema[key]
+    if schema.get('examples') and isinstance(schema['examples'], list):
+        return schema['examples'][0]
+    if schema.get('enum'):
+        return next((value for value in schema['enum'] if value is not None), None)
+    if 'allOf' in schema:
+        result: dict[str, t.Any] = {}
+        for item in schema['allOf']:
+            value = generate_example(item, components, _depth + 1)
+            if not isinstance(value, dict):
+                return value
+            result.update(value)
+        return result
+    for key in ('anyOf', 'oneOf'):
+        if key in schema:
+            options = [item for item in schema[key] if item.get('type') != 'null']
+            return generate_example(options[0], components, _depth + 1) if options else None
+
+    schema_type = schema.get('type')
+    if isinstance(schema_type, list):
+        schema_type = next((item for item in schema_type if item != 'null'), None)
+    if schema_type is None and 'properties' in schema:
+        schema_type = 'object'
+    constraints = _get_openapi_constraints(schema)
+    if schema_type == 'object':
+        return {
+            name: generate_example(property_schema, components, _depth + 1)
+            for name, property_schema in schema.get('properties', {}).items()
+            if not property_schema.get('readOnly')
+        }
+    if schema_type == 'array':
+        minimum, maximum = _get_length_range(constraints, (1, 1))
+        count = min(max(minimum, 1), maximum)
+        return [generate_example(schema.get('items', {}), components, _depth + 1)] * count
+    if schema_type in ('integer', 'number'):
+        return _get_simplest_number(constraints, schema_type == 'integer')
+    if schema_type == 'boolean':
+        return True
+    if schema_type == 'string':
+        if schema.get('format') == 'binary':
+            return _make_file('file')
+        value = _string_formats.get(schema.get('format', ''), 'string')
+        minimum, maximum = _get_length_range(constraints, (len(value), len(value)))
+        return value.ljust(minimum, 'x')[:maximum]
+    if schema_type == 'null':
+        return None
+    return 'string'
+
+
+def _get_openapi_constraints(schema: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Get the constraints of an OpenAPI schema object in the format of the generators."""
+    constraints: dict[str, t.Any] = {}
+    for key in ('minimum', 'maximum'):
+        if schema.get(key) is not None:
+            constraints[key] = schema[key]
+        exclusive = schema.get(f'exclusive{key.capitalize()}')
+        # exclusiveMinimum/Maximum are flags in OpenAPI 3.0 and numbers in OpenAPI 3.1
+        if isinstance(exclusive, bool):
+            constraints[f'exclusive_{key}'] = exclusive
+        elif exclusive is not None:
+            constraints[key] = exclusive
+            constraints[f'exclusive_{key}'] = True
+    if schema.get('multipleOf'):
+        constraints['multiple_of'] = schema['multipleOf']
+    for key, name in (
+        ('minLength', 'min_length'),
+        ('maxLength', 'max_length'),
+        ('minItems', 'min_length'),
+        ('maxItems', 'max_length'),
+    ):
+        if schema.get(key) is not None:
+            constraints[name] = schema[key]
+    return constraints
+
+
+class _FloatBounds:
+    def __init__(self, constraints: dict[str, t.Any], minimum: float, maximum: float) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.exclusive_minimum = constraints.get('exclusive_minimum', False)
+        self.exclusive_maximum = constraints.get('exclusive_maximum', False)
+
+    def contains(self, value: float) -> bool:
+        if value < self.minimum or (self.exclusive_minimum and value == self.minimum):
+            return False
+        return value < self.maximum or (not self.exclusive_maximum and value == self.maximum)
+
+
+def _get_number_bounds(
+    constraints: dict[str, t.Any], integer: bool
+) -> tuple[int, int, float] | _FloatBounds:
+    """Get the valid numbers of the constraints.
+
+    The integers and the multiples are returned as the range of the multiples
+    `(low, high, step)`, the valid values are `low * step` to `high * step`. The
+    other numbers are returned as the bounds of the floats.
+    """
+    minimum = constraints.get('minimum')
+    maximum = constraints.get('maximum')
+    multiple_of = constraints.get('multiple_of')
+    if minimum is None:
+        minimum = 0 if maximum is None or maximum > 0 else maximum - _DEFAULT_NUMBER_SPAN
+    if maximum is None:
+        maximum = minimum + _DEFAULT_NUMBER_SPAN
+    if not integer and not multiple_of:
+        return _FloatBounds(constraints, minimum, maximum)
+
+    step = multiple_of or 1
+    # the range of the multiples of the step
+    low = int(-(-minimum // step))
+    high = int(maximum // step)
+    if constraints.get('exclusive_minimum') and low * step <= minimum:
+        low += 1
+    if constraints.get('exclusive_maximum') and high * step >= maximum:
+        high -= 1
+    return low, high, step
+
+
+def _get_simplest_number(constraints: dict[str, t.Any], integer: bool) -> int | float:
+    """Get the valid number closest to 1."""
+    bounds = _get_number_bounds(constraints, integer)
+    if isinstance(bounds, tuple):
+        low, high, step = bounds
+        value = min(max(-(-1 // step), low), high) * step
+        return int(value) if integer else float(value)
+    value = min(max(1.0, bounds.minimum), bounds.maximum)
+    if not bounds.contains(value):
+        value = (bounds.minimum + bounds.maximum) / 2
+    return float(value)
+
+
+def _make_file(name: str) -> FileStorage:
+    return FileStorage(BytesIO(_FILE_CONTENT), f'{name}.png', content_type='image/png')
+
+
+def _get_pydantic_constraints(metadata: t.Iterable[t.Any]) -> dict[str, t.Any]:
+    constraints: dict[str, t.Any] = {}
+    for item in metadata:
+        # the FieldInfo in Annotated
+        if hasattr(item, 'metadata') and isinstance(item.metadata, list):
+            constraints.update(_get_pydantic_constraints(item.metadata))
+        for name, key, exclusive in (
+            ('gt', 'minimum', True),
+            ('ge', 'minimum', False),
+            ('lt', 'maximum', True),
+            ('le', 'maximum', False),
+        ):
+            value = getattr(item, name, None)
+            if value is not None:
+                constraints[key] = value
+                constraints[f'exclusive_{key}'] = exclusive
+        for name in ('multiple_of', 'min_length', 'max_length', 'decimal_places'):
+            value = getattr(item, name, None)
+            if value is not None:
+                constraints[name] = value
+    return constraints
+
+
+def _get_length_range(constraints: dict[str, t.Any], default: tuple[int, int]) -> tuple[int, int]:
+    minimum = constraints.get('min_length')
+    maximum = constraints.get('max_length')
+    if minimum is None:
+        minimum = min(default[0], maximum) if maximum is not None else default[0]
+    if maximum is None:
+        maximum = max(default[1], minimum)
+    return minimum, maximum
+
+
+def _hashable(value: t.Any) -> t.Any:
+    return tuple(value) if isinstance(value, list) else value
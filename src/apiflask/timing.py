@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import typing as t
+from contextvars import ContextVar
+from time import perf_counter
+
+from flask import current_app
+from flask.wrappers import Response
+
+from .signals import request_timed
+from .tracing import _current_tracer
+from .tracing import traced_call
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    'apiflask_request_timings', default=None
+)
+
+
+class RequestTimings:
+    """The durations of the phases of the current request.
+
+    The phases are `auth`, `input-<location>` (e.g., `input-json`), `view`, and `output`.
+    The durations are in milliseconds.
+
+    *Version added: 3.2.0*
+    """
+
+    def __init__(self) -> None:
+        self.started_at = perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def add(self, name: str, duration: float) -> None:
+        """Add the duration (in seconds) to the phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + duration * 1000
+
+    def to_dict(self) -> dict[str, float]:
+        """Get the phase durations with the `total` duration of the request."""
+        timings = dict(self.phases)
+        timings['total'] = (perf_counter() - self.started_at) * 1000
+        return timings
+
+
+def get_request_timings() -> RequestTimings | None:
+    """Get the timings of the current request, `None` if the timing is disabled.
+
+    *Version added: 3.2.0*
+    """
+    return _current_timings.get()
+
+
+def timed(
+    name: str,
+    attributes: dict[str, t.Any] | None,
+    func: t.Callable[..., t.Any],
+    /,
+    *args: t.Any,
+    **kwargs: t.Any,
+) -> t.Any:
+    """Call the function as the given phase of the request.
+
+    The duration is recorded when the request timing is enabled, and the call is
+    wrapped in a child span with the attributes when the tracing is enabled.
+    """
+    timings = _current_timings.get()
+    tracer = _current_tracer.get()
+    if timings is None and tracer is None:
+        return func(*args, **kwargs)
+    if tracer is not None:
+        return traced_call(tracer, name, attributes, _timed_call, timings, name, func, args, kwargs)
+    return _timed_call(timings, name, func, args, kwargs)
+
+
+def _timed_call(
+    timings: RequestTimings | None,
+    name: str,
+    func: t.Callable[..., t.Any],
+    args: tuple[t.Any, ...],
+    kwargs: dict[str, t.Any],
+) -> t.Any:
+    if timings is None:
+        return func(*args, **kwargs)
+    start = perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings.add(name, perf_counter() - start)
+
+
+def start_request_timing() -> None:
+    """Start timing the request if the `REQUEST_TIMING` config is `True`.
+
+    It's registered as a `before_request` function of the app.
+    """
+    if current_app.config['REQUEST_TIMING']:
+        _current_timings.set(RequestTimings())
+
+
+def finish_request_timing(response: Response) -> Response:
+    """Report the timings of the request.
+
+    It's registered as an `after_request` function of the app. The timings will be
+    added to the `Server-Timing` header, passed to the `app.request_timings` callback,
+    and sent with the `request_timed` signal.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        return response
+    _current_timings.set(None)
+    result = timings.to_dict()
+    if current_app.config['SERVER_TIMING_HEADER']:
+        response.headers.add(
+            'Server-Timing',
+            ', '.join(f'{name};dur={duration:.3f}' for name, duration in result.items()),
+        )
+    callback = current_app.request_timings_callback  # type: ignore
+    if callback is not None:
+        callback(result)
+    request_timed.send(current_app._get_current_object(), timings=result)  # type: ignore
+    return response
+
+
+def reset_request_timing(exc: BaseException | None = None) -> None:
+    """Discard the timings of the request.
+
+    It's registered as a `teardown_request` function of the app.
+    """
+    _current_timings.set(None)
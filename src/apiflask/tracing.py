@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import typing as t
+from contextvars import ContextVar
+
+from flask import current_app
+from flask import json
+from flask import request
+from flask.wrappers import Response
+
+from .exceptions import _ValidationError
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from opentelemetry.trace import Tracer
+
+_current_tracer: ContextVar[Tracer | None] = ContextVar('apiflask_tracer', default=None)
+
+
+def get_tracer() -> Tracer | None:
+    """Get the OpenTelemetry tracer of the current app.
+
+    The tracer is created from `app.tracer_provider`, or the global tracer provider
+    if it's `None`. Returns `None` if the `opentelemetry-api` package is not installed.
+
+    *Version added: 3.2.0*
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+
+    app = current_app._get_current_object()  # type: ignore
+    provider = app.tracer_provider
+    cached = getattr(app, '_tracer', None)
+    if cached is not None and cached[0] is provider:
+        return cached[1]  # type: ignore[no-any-return]
+    tracer = trace.get_tracer('apiflask', tracer_provider=provider)
+    app._tracer = (provider, tracer)
+    return tracer
+
+
+def is_tracing() -> bool:
+    """Check whether the apiflask phases of the current request are being traced.
+
+    *Version added: 3.2.0*
+    """
+    return _current_tracer.get() is not None
+
+
+def start_request_tracing() -> None:
+    """Start tracing the apiflask phases if the `TRACING` config is `True`.
+
+    It's registered as a `before_request` function of the app.
+    """
+    if current_app.config['TRACING']:
+        _current_tracer.set(get_tracer())
+
+
+def reset_request_tracing(exc: BaseException | None = None) -> None:
+    """Stop tracing the request.
+
+    It's registered as a `teardown_request` function of the app.
+    """
+    _current_tracer.set(None)
+
+
+def traced_call(
+    tracer: Tracer,
+    phase: str,
+    attributes: dict[str, t.Any] | None,
+    func: t.Callable[..., t.Any],
+    /,
+    *args: t.Any,
+    **kwargs: t.Any,
+) -> t.Any:
+    """Call the function in a child span of the phase.
+
+    The span is named after the phase (e.g., `apiflask.input.json`). The validation
+    errors are recorded as the `apiflask.validation_error` span events, other
+    exceptions are recorded and set the span status to error.
+    """
+    from opentelemetry.trace import Status
+    from opentelemetry.trace import StatusCode
+
+    span_attributes = dict(attributes) if attributes else {}
+    if phase.startswith('input-') and request.content_length is not None:
+        span_attributes['apiflask.input.size'] = request.content_length
+    elif phase == 'view':
+        span_attributes['apiflask.endpoint'] = request.endpoint or ''
+
+    with tracer.start_as_current_span(
+        f'apiflask.{phase.replace("-", ".")}',
+        attributes=span_attributes,
+        record_exception=False,
+        set_status_on_exception=False,
+    ) as span:
+        try:
+            result = func(*args, **kwargs)
+        except _ValidationError as error:
+            span.add_event(
+                'apiflask.validation_error',
+                {
+                    'apiflask.error.status_code': error.status_code,
+                    'apiflask.error.detail': json.dumps(error.detail),
+                },
+            )
+            raise
+        except Exception as error:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, f'{type(error).__name__}: {error}'))
+            raise
+        if isinstance(result, Response) and not result.is_streamed:
+            span.set_attribute('apiflask.output.size', result.calculate_content_length() or 0)
+        return result
@@ -57,6 +57,7 @@ ResponseReturnValueType = t.Union[
 ]
 SpecCallbackType = t.Callable[[t.Union[dict, str]], t.Union[dict, str]]
 ErrorCallbackType = t.Callable[['HTTPError'], ResponseReturnValueType]
+RequestTimingsCallbackType = t.Callable[[t.Dict[str, float]], None]
 
 DictSchemaType = t.Dict[str, t.Union['Field', type]]
 SchemaType = t.Union['Schema', t.Type['Schema'], DictSchemaType, t.Type['BaseModel']]
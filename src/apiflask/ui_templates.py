@@ -1,4 +1,18 @@
-redoc_template = """
+# the selector of the tag specs, shown when the SUB_SPECS config is enabled
+spec_selector = """
+{% if sub_specs %}
+  <select aria-label="Spec" style="position: fixed; top: 8px; right: 8px; z-index: 1000;"
+    onchange="window.location.search = this.value ? '?spec=' + encodeURIComponent(this.value) : ''">
+    <option value="">All</option>
+    {% for name in sub_specs %}
+    <option value="{{ name }}"{% if name == spec_name %} selected{% endif %}>{{ name }}</option>
+    {% endfor %}
+  </select>
+{% endif %}
+"""
+
+redoc_template = (
+    """
 <!DOCTYPE html>
 <html>
 
@@ -10,7 +24,7 @@ redoc_template = """
   <link href="https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700" rel="stylesheet">
   {% endif %}
   <link rel="icon" type="image/png"
-    href="{{ config.DOCS_FAVICON }}">
+    href="{{ assets.DOCS_FAVICON or config.DOCS_FAVICON }}">
   <style>
     body {
       margin: 0;
@@ -20,12 +34,15 @@ redoc_template = """
 </head>
 
 <body>
+"""
+    + spec_selector
+    + """
   <div id="redoc"></div>
 
-  <script src="{{ config.REDOC_STANDALONE_JS }}"> </script>
+  <script src="{{ assets.REDOC_STANDALONE_JS or config.REDOC_STANDALONE_JS }}"> </script>
   <script>
     Redoc.init(
-      "{{ url_for('openapi.spec') }}",
+      "{{ spec_url or url_for('openapi.spec') }}",
       {% if config.REDOC_CONFIG %}{{ config.REDOC_CONFIG | tojson }}{% else %}{}{% endif %},
       document.getElementById("redoc")
     )
@@ -34,17 +51,19 @@ redoc_template = """
 
 </html>
 """
+)
 
-swagger_ui_template = """
+swagger_ui_template = (
+    """
 <!DOCTYPE html>
 <html lang="en">
 
 <head>
   <meta charset="UTF-8">
   <title>{{ title }} {{ version }} - Swagger UI</title>
-  <link rel="stylesheet" type="text/css" href="{{ config.SWAGGER_UI_CSS }}">
+  <link rel="stylesheet" type="text/css" href="{{ assets.SWAGGER_UI_CSS or config.SWAGGER_UI_CSS }}">
   <link rel="icon" type="image/png"
-    href="{{ config.DOCS_FAVICON }}">
+    href="{{ assets.DOCS_FAVICON or config.DOCS_FAVICON }}">
   <style>
     html {
       box-sizing: border-box;
@@ -66,10 +85,13 @@ swagger_ui_template = """
 </head>
 
 <body>
+"""
+    + spec_selector
+    + """
   <div id="swagger-ui"></div>
 
-  <script src="{{ config.SWAGGER_UI_BUNDLE_JS }}"></script>
-  <script src="{{ config.SWAGGER_UI_STANDALONE_PRESET_JS }}"></script>
+  <script src="{{ assets.SWAGGER_UI_BUNDLE_JS or config.SWAGGER_UI_BUNDLE_JS }}"></script>
+  <script src="{{ assets.SWAGGER_UI_STANDALONE_PRESET_JS or config.SWAGGER_UI_STANDALONE_PRESET_JS }}"></script>
   <script>
     // we can get several config items of Function type
     // referring to https://swagger.io/docs/open-source-tools/swagger-ui/usage/configuration/
@@ -80,7 +102,7 @@ swagger_ui_template = """
     }
 
     var baseConfig = {
-      url: "{{ url_for('openapi.spec') }}",
+      url: "{{ spec_url or url_for('openapi.spec') }}",
       dom_id: "#swagger-ui",
       deepLinking: true,
       presets: [
@@ -115,6 +137,7 @@ swagger_ui_template = """
 
 </html>
 """
+)
 
 swagger_ui_oauth2_redirect_template = """
 <!doctype html>
@@ -197,7 +220,8 @@ swagger_ui_oauth2_redirect_template = """
 </html>
 """
 
-elements_template = """
+elements_template = (
+    """
 <!doctype html>
 <html lang="en">
 <head>
@@ -205,14 +229,17 @@ elements_template = """
   <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
   <title>{{ title }} {{ version }} - Elements</title>
   <link rel="icon" type="image/png"
-    href="{{ config.DOCS_FAVICON }}">
-  <script src="{{ config.ELEMENTS_JS }}"></script>
-  <link rel="stylesheet" href="{{ config.ELEMENTS_CSS }}">
+    href="{{ assets.DOCS_FAVICON or config.DOCS_FAVICON }}">
+  <script src="{{ assets.ELEMENTS_JS or config.ELEMENTS_JS }}"></script>
+  <link rel="stylesheet" href="{{ assets.ELEMENTS_CSS or config.ELEMENTS_CSS }}">
 </head>
 <body>
+"""
+    + spec_selector
+    + """
 
   <elements-api
-    apiDescriptionUrl="{{ url_for('openapi.spec') }}"
+    apiDescriptionUrl="{{ spec_url or url_for('openapi.spec') }}"
     layout="{{ config.ELEMENTS_LAYOUT }}"
     {% if config.ELEMENTS_CONFIG and 'router' in config.ELEMENTS_CONFIG %}
       {% set router = config.ELEMENTS_CONFIG['router'] %}
@@ -230,20 +257,25 @@ elements_template = """
 </body>
 </html>
 """
+)
 
-rapidoc_template = """
+rapidoc_template = (
+    """
 <!doctype html> <!-- Important: must specify -->
 <html>
 <head>
   <meta charset="utf-8"> <!-- Important: rapi-doc uses utf8 characters -->
   <title>{{ title }} {{ version }} - RapiDoc</title>
   <link rel="icon" type="image/png"
-    href="{{ config.DOCS_FAVICON }}">
-  <script type="module" src="{{ config.RAPIDOC_JS }}"></script>
+    href="{{ assets.DOCS_FAVICON or config.DOCS_FAVICON }}">
+  <script type="module" src="{{ assets.RAPIDOC_JS or config.RAPIDOC_JS }}"></script>
 </head>
 <body>
+"""
+    + spec_selector
+    + """
   <rapi-doc
-    spec-url="{{ url_for('openapi.spec') }}"
+    spec-url="{{ spec_url or url_for('openapi.spec') }}"
     theme="{{ config.RAPIDOC_THEME }}"
     {% if config.RAPIDOC_CONFIG and 'show-header' in config.RAPIDOC_CONFIG %}
       {% set show_header = config.RAPIDOC_CONFIG['show-header'] %}
@@ -260,19 +292,24 @@ rapidoc_template = """
 </body>
 </html>
 """
+)
 
-rapipdf_template = """
+rapipdf_template = (
+    """
 <!doctype html>
 <html>
 <head>
   <title>{{ title }} {{ version }} - RapiPDF</title>
   <link rel="icon" type="image/png"
-    href="{{ config.DOCS_FAVICON }}">
-  <script src="{{ config.RAPIPDF_JS }}"></script>
+    href="{{ assets.DOCS_FAVICON or config.DOCS_FAVICON }}">
+  <script src="{{ assets.RAPIPDF_JS or config.RAPIPDF_JS }}"></script>
 </head>
 <body>
+"""
+    + spec_selector
+    + """
   <rapi-pdf
-    spec-url="{{ url_for('openapi.spec') }}"
+    spec-url="{{ spec_url or url_for('openapi.spec') }}"
     {% if config.RAPIPDF_CONFIG %}
       {% for key, value in config.RAPIPDF_CONFIG.items() %}
         {{ key }}={{ value | tojson }}
@@ -282,6 +319,7 @@ rapipdf_template = """
 </body>
   </html>
 """
+)
 
 ui_templates = {
     'swagger-ui': swagger_ui_template,
@@ -1,24 +1,59 @@
+import io
 import os
+import re
 import typing as t
+from importlib import import_module
+from tempfile import SpooledTemporaryFile
 
-from flask_marshmallow.validate import _get_filestorage_size
-from flask_marshmallow.validate import _parse_size
-from flask_marshmallow.validate import FileSize as FileSize
-from flask_marshmallow.validate import FileType as FileType
-from marshmallow.validate import ContainsNoneOf as ContainsNoneOf
-from marshmallow.validate import ContainsOnly as ContainsOnly
-from marshmallow.validate import Email as Email
-from marshmallow.validate import Equal as Equal
-from marshmallow.validate import Length as Length
-from marshmallow.validate import NoneOf as NoneOf
-from marshmallow.validate import OneOf as OneOf
-from marshmallow.validate import Predicate as Predicate
-from marshmallow.validate import Range as Range
-from marshmallow.validate import Regexp as Regexp
-from marshmallow.validate import URL as URL
-from marshmallow.validate import Validator as Validator
 from werkzeug.datastructures import FileStorage
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from flask_marshmallow.validate import FileSize as FileSize
+    from flask_marshmallow.validate import FileType as FileType
+    from marshmallow.validate import ContainsNoneOf as ContainsNoneOf
+    from marshmallow.validate import ContainsOnly as ContainsOnly
+    from marshmallow.validate import Email as Email
+    from marshmallow.validate import Equal as Equal
+    from marshmallow.validate import Length as Length
+    from marshmallow.validate import NoneOf as NoneOf
+    from marshmallow.validate import OneOf as OneOf
+    from marshmallow.validate import Predicate as Predicate
+    from marshmallow.validate import Range as Range
+    from marshmallow.validate import Regexp as Regexp
+    from marshmallow.validate import URL as URL
+    from marshmallow.validate import Validator as Validator
+
+# the marshmallow validators are imported on the first access, so the apps that only
+# use Pydantic models don't import marshmallow and flask-marshmallow
+_lazy_validators: t.Dict[str, str] = {
+    'FileSize': 'flask_marshmallow.validate',
+    'FileType': 'flask_marshmallow.validate',
+    'ContainsNoneOf': 'marshmallow.validate',
+    'ContainsOnly': 'marshmallow.validate',
+    'Email': 'marshmallow.validate',
+    'Equal': 'marshmallow.validate',
+    'Length': 'marshmallow.validate',
+    'NoneOf': 'marshmallow.validate',
+    'OneOf': 'marshmallow.validate',
+    'Predicate': 'marshmallow.validate',
+    'Range': 'marshmallow.validate',
+    'Regexp': 'marshmallow.validate',
+    'URL': 'marshmallow.validate',
+    'Validator': 'marshmallow.validate',
+}
+
+__all__ = [*_lazy_validators, 'validate_file_type', 'validate_file_size']
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module_name = _lazy_validators[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 def validate_file_type(
     accept: t.Iterable[str], error: t.Optional[str] = None
@@ -128,3 +163,32 @@ def validate_file_size(
         return value
 
     return validator
+
+
+def _parse_size(size: str) -> float:
+    """Return the value which the `size` represents in bytes (from flask-marshmallow)."""
+    size = size.strip()
+    match = re.fullmatch(r'([e\+\-\.\d]+)\s*([kmgtpezy])?(i)?(b)', size, flags=re.I)
+    if not match:
+        raise ValueError(f'Invalid size value: {size!r}')
+    number, unit, binary, bits = match.groups()
+    try:
+        value = float(number)
+    except ValueError as e:
+        raise ValueError(f'Invalid float value while parsing size: {number!r}') from e
+    exponent = 'kmgtpezy'.index(unit.lower()) + 1 if unit else 0
+    base = 1024 if binary else 1000
+    divisor = {'b': 8, 'B': 1}[bits]
+    return float(value * base**exponent / divisor)
+
+
+def _get_filestorage_size(file: FileStorage) -> int:
+    """Return the size of the `FileStorage` object in bytes (from flask-marshmallow)."""
+    stream = file.stream
+    if isinstance(stream, io.BytesIO):
+        return stream.getbuffer().nbytes
+    if isinstance(stream, SpooledTemporaryFile):
+        return os.stat(stream.fileno()).st_size
+    size = len(file.read())
+    file.stream.seek(0)
+    return size
@@ -0,0 +1,63 @@
+import typing as t
+from io import BytesIO
+
+from pydantic import BaseModel
+from pydantic import Field
+from werkzeug.datastructures import FileStorage
+
+from apiflask.bench import _make_form_data
+from apiflask.bench import build_bench_requests
+from apiflask.bench import run_bench
+
+
+def test_build_bench_requests_pydantic(app):
+    class Owner(BaseModel):
+        name: str = Field(min_length=2)
+        email: t.Optional[str] = None
+
+    class Pet(BaseModel):
+        name: str
+        category: t.Literal['dog', 'cat']
+        age: int = Field(gt=0, le=20)
+        owners: list[Owner] = Field(min_length=1)
+
+    @app.put('/pets/<uuid:pet_id>/<any(small, large):size>')
+    @app.input(Pet)
+    def update_pet(pet_id, size, json_data):
+        return json_data.model_dump()
+
+    @app.get('/hidden/<float:number>')
+    @app.doc(hide=True)
+    def hidden(number):
+        return {'number': number}
+
+    # the methods other than GET and HEAD are only benchmarked when passed explicitly
+    assert [request.endpoint for request in build_bench_requests(app)] == ['hidden']
+
+    bench_requests = build_bench_requests(app, methods=['GET', 'PUT'])
+    requests = {request.endpoint: request for request in bench_requests}
+    assert set(requests) == {'update_pet', 'hidden'}
+    assert requests['update_pet'].url == '/pets/00000000-0000-4000-8000-000000000000/small'
+    assert requests['hidden'].url == '/hidden/1.0'
+
+    assert requests['update_pet'].open(app.test_client()).json == {
+        'name': 'string',
+        'category': 'dog',
+        'age': 1,
+        'owners': [{'name': 'string', 'email': 'string'}],
+    }
+
+    results = run_bench(app, list(requests.values()), requests=4, threads=2, warmup=0)
+    assert [dict(result.status_codes) for result in results] == [{'200': 4}, {'200': 4}]
+    assert [len(result.latencies) for result in results] == [4, 4]
+
+
+def test_make_form_data_files():
+    report = FileStorage(BytesIO(b'%PDF'), 'report.pdf', content_type='application/pdf')
+    data = _make_form_data({'report': report, 'images': [report], 'name': 'foo'})
+    stream, filename, content_type = data['report']
+    assert stream.read() == b'%PDF'
+    assert stream is not report.stream
+    assert (filename, content_type) == ('report.pdf', 'application/pdf')
+    assert data['images'][0][1:] == ('report.pdf', 'application/pdf')
+    assert data['name'] == 'foo'
@@ -2,9 +2,17 @@ import json
 
 import pytest
 
+from .schemas import FilesList
 from .schemas import Foo
 from .schemas import Qux
+from apiflask import HTTPTokenAuth
+from apiflask.commands import bench_command
 from apiflask.commands import spec_command
+from apiflask.fields import Integer
+from apiflask.fields import String
+from apiflask.validators import Length
+from apiflask.validators import OneOf
+from apiflask.validators import Range
 
 
 def test_flask_spec_stdout(app, cli_runner):
@@ -87,3 +95,133 @@ def test_flask_spec_decimal_field(app, cli_runner):
 
     result = cli_runner.invoke(spec_command)
     assert 'openapi' in result.output
+
+
+def test_flask_spec_profile(app, cli_runner):
+    @app.get('/foo')
+    @app.input(Foo, location='query')
+    @app.output(Foo)
+    def foo():
+        pass
+
+    @app.spec_processor
+    def update_spec(spec):
+        return spec
+
+    result = cli_runner.invoke(spec_command, ['--profile', '--profile-top', '1'])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == app.spec
+    assert result.stderr.startswith('Spec generation: ')
+    for phase in ['schemas', 'parameters', 'responses', 'operations', 'spec_processor']:
+        assert f'\n{phase} ' in result.stderr
+    assert 'RULE' in result.stderr
+    assert 'GET /foo' in result.stderr
+    assert 'tests.schemas.Foo' in result.stderr
+    assert '\nValidationError ' in result.stderr
+    assert 'openapi' not in result.stderr
+
+
+@pytest.fixture
+def bench_app(app):
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return token == 'secret'
+
+    @app.get('/pets/<int:pet_id>')
+    @app.input(
+        {
+            'category': String(required=True, validate=OneOf(['dog', 'cat'])),
+            'limit': Integer(required=True, validate=Range(min=10, max=20)),
+        },
+        location='query',
+    )
+    @app.input({'x_client': String(required=True, validate=Length(min=3))}, location='headers')
+    def get_pet(pet_id, query_data, headers_data):
+        assert pet_id == 1
+        assert query_data == {'category': 'dog', 'limit': 10}
+        assert headers_data['x_client'] == 'string'
+        return {}
+
+    @app.post('/pets')
+    @app.input(Foo)
+    def create_pet(json_data):
+        assert json_data == {'id': 1, 'name': 'string'}
+        return {}, 201
+
+    @app.post('/images')
+    @app.input(FilesList, location='files')
+    def upload_images(files_data):
+        assert files_data['images'][0].filename.endswith('.png')
+        return {}
+
+    @app.delete('/secret')
+    @app.auth_required(auth)
+    def secret():
+        return '', 204
+
+    return app
+
+
+def test_flask_bench(bench_app, cli_runner):
+    result = cli_runner.invoke(bench_command, ['-n', '5', '--sort', 'route', '--unsafe'])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].split() == [
+        'METHOD', 'ROUTE', 'STATUS', 'REQ/S', 'MEAN', 'P50', 'P90', 'P99', 'MAX'
+    ]  # fmt: skip
+    assert [line.split()[:3] for line in lines[1:]] == [
+        ['POST', '/images', '200'],
+        ['POST', '/pets', '201'],
+        ['GET', '/pets/<int:pet_id>', '200'],
+        ['DELETE', '/secret', '401'],
+    ]
+
+
+def test_flask_bench_options(bench_app, cli_runner):
+    result = cli_runner.invoke(
+        bench_command,
+        [
+            *['-n', '9', '-t', '3', '-e', 'sec*', '-m', 'delete', '--unsafe'],
+            *['-H', 'Authorization: Bearer secret', '--json'],
+        ],
+    )
+    assert result.exit_code == 0
+    results = json.loads(result.output)
+    assert len(results) == 1
+    assert results[0]['endpoint'] == 'secret'
+    assert results[0]['requests'] == 9
+    assert results[0]['status_codes'] == {'204': 9}
+    assert results[0]['p50'] <= results[0]['p99'] <= results[0]['max']
+
+    result = cli_runner.invoke(bench_command, ['-H', 'invalid'])
+    assert 'is not a "Name: value" header' in result.output
+
+    result = cli_runner.invoke(bench_command, ['-e', 'missing'])
+    assert result.exit_code == 1
+    assert 'No route to benchmark' in result.output
+
+
+def test_flask_bench_methods(bench_app, cli_runner):
+    # only the GET and HEAD routes are benchmarked by default
+    result = cli_runner.invoke(bench_command, ['-n', '2', '--json'])
+    assert result.exit_code == 0
+    assert [item['method'] for item in json.loads(result.output)] == ['GET']
+
+    result = cli_runner.invoke(bench_command, ['-e', 'secret'])
+    assert result.exit_code == 1
+    assert 'No route to benchmark' in result.output
+
+    result = cli_runner.invoke(bench_command, ['-n', '2', '-m', 'head', '--json'])
+    assert result.exit_code == 0
+    results = json.loads(result.output)
+    assert [(item['method'], item['status_codes']) for item in results] == [('HEAD', {'200': 2})]
+
+    result = cli_runner.invoke(bench_command, ['-m', 'GET', '-m', 'POST'])
+    assert result.exit_code == 2
+    assert 'POST may change the data of the app, pass --unsafe' in result.output
+
+    result = cli_runner.invoke(bench_command, ['-n', '2', '-m', 'POST', '--unsafe', '--json'])
+    assert result.exit_code == 0
+    assert {item['method'] for item in json.loads(result.output)} == {'POST'}
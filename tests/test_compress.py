@@ -0,0 +1,147 @@
+import gzip
+import zlib
+
+import pytest
+from flask import stream_with_context
+
+from .schemas import Foo
+from apiflask.compress import compress_data
+from apiflask.compress import get_available_encodings
+
+
+@pytest.fixture
+def compress_app(app):
+    app.config['COMPRESS_RESPONSES'] = True
+    app.config['COMPRESS_MIN_SIZE'] = 10
+
+    @app.get('/foo')
+    @app.output(Foo(many=True))
+    def foo():
+        return [{'id': i, 'name': 'foo'} for i in range(100)]
+
+    return app
+
+
+def test_compress_response(compress_app, client):
+    rv = client.get('/foo', headers={'Accept-Encoding': 'gzip'})
+    assert rv.status_code == 200
+    assert rv.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in rv.headers['Vary']
+    assert int(rv.headers['Content-Length']) == len(rv.data)
+    data = gzip.decompress(rv.data)
+    assert data.startswith(b'[{')
+
+    rv = client.get('/foo')
+    assert 'Content-Encoding' not in rv.headers
+    assert 'Accept-Encoding' in rv.headers['Vary']
+    assert len(rv.json) == 100
+
+
+def test_compress_response_disabled_by_default(app, client):
+    @app.get('/foo')
+    @app.output(Foo(many=True))
+    def foo():
+        return [{'id': i, 'name': 'foo'} for i in range(100)]
+
+    rv = client.get('/foo', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+def test_compress_min_size(compress_app, client):
+    compress_app.config['COMPRESS_MIN_SIZE'] = 100000
+
+    rv = client.get('/foo', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+def test_compress_unsupported_encoding(compress_app, client):
+    rv = client.get('/foo', headers={'Accept-Encoding': 'gzip;q=0, deflate'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+def test_compress_mimetypes(compress_app, client):
+    @compress_app.get('/image')
+    def image():
+        return b'0' * 1000, {'Content-Type': 'image/png'}
+
+    rv = client.get('/image', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+@pytest.mark.parametrize('compress', [False, True, 1, {'gzip': 9}])
+def test_compress_output_option(app, client, compress):
+    app.config['COMPRESS_MIN_SIZE'] = 10
+
+    @app.get('/foo')
+    @app.output(Foo(many=True), compress=compress)
+    def foo():
+        return [{'id': i, 'name': 'foo'} for i in range(100)]
+
+    rv = client.get('/foo', headers={'Accept-Encoding': 'gzip'})
+    if compress is False:
+        assert 'Content-Encoding' not in rv.headers
+    else:
+        assert rv.headers['Content-Encoding'] == 'gzip'
+        level = 9 if isinstance(compress, dict) else 6 if compress is True else compress
+        expected = compress_data('gzip', client.get('/foo').data, level)
+        assert rv.data == expected
+
+
+def test_compress_method_view(compress_app, client):
+    from apiflask.views import MethodView
+
+    class Bar(MethodView):
+        @compress_app.output(Foo(many=True), compress=False)
+        def get(self):
+            return [{'id': i, 'name': 'foo'} for i in range(100)]
+
+    compress_app.add_url_rule('/bar', view_func=Bar.as_view('bar'))
+    rv = client.get('/bar', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+def test_compress_streamed_response(compress_app, client):
+    @compress_app.get('/stream')
+    def stream():
+        def generate():
+            for i in range(100):
+                yield f'line {i}\n'
+
+        return stream_with_context(generate()), {'Content-Type': 'text/plain'}
+
+    rv = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+    assert rv.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in rv.headers
+    data = zlib.decompress(rv.data, 31)
+    assert data.startswith(b'line 0\nline 1\n')
+
+
+def test_compress_weakens_etag(compress_app, client):
+    @compress_app.get('/bar')
+    @compress_app.output(Foo(many=True), etag=True)
+    def bar():
+        return [{'id': i, 'name': 'foo'} for i in range(100)]
+
+    rv = client.get('/bar', headers={'Accept-Encoding': 'gzip'})
+    etag = rv.headers['ETag']
+    assert etag.startswith('W/')
+    rv = client.get('/bar', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert rv.status_code == 304
+
+
+def test_compress_skip_head_and_not_modified(compress_app, client):
+    rv = client.head('/foo', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in rv.headers
+
+
+@pytest.mark.parametrize('encoding', ['br', 'zstd'])
+def test_compress_optional_encodings(compress_app, client, encoding):
+    if encoding not in get_available_encodings():
+        pytest.skip(f'{encoding} is not installed')
+    rv = client.get('/foo', headers={'Accept-Encoding': f'gzip;q=0.5, {encoding}'})
+    assert rv.headers['Content-Encoding'] == encoding
+
+
+def test_compress_data_unsupported_encoding():
+    with pytest.raises(ValueError):
+        compress_data('deflate', b'foo', 1)
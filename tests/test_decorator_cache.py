@@ -0,0 +1,298 @@
+import time
+
+import openapi_spec_validator as osv
+import pytest
+from flask import url_for
+from pydantic import BaseModel
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask import HTTPTokenAuth
+from apiflask.caching import CacheBackend
+from apiflask.caching import CacheEntry
+from apiflask.caching import MemoryCacheBackend
+
+
+class DictCacheBackend(CacheBackend):
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, entry):
+        self.entries[key] = entry
+
+    def delete(self, key):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def test_cache(app, client):
+    calls = []
+
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    @app.cache(ttl=30)
+    @app.output(Foo)
+    def foo(query_data):
+        calls.append(query_data)
+        return {'id': query_data['id'], 'name': 'foo'}
+
+    rv = client.get('/foo?id=1')
+    assert rv.status_code == 200
+    assert rv.json == {'id': 1, 'name': 'foo'}
+    assert rv.headers['Cache-Control'] == 'public, max-age=30'
+    assert 'Age' not in rv.headers
+
+    rv = client.get('/foo?id=01')
+    assert rv.status_code == 200
+    assert rv.json == {'id': 1, 'name': 'foo'}
+    assert rv.headers['Cache-Control'] == 'public, max-age=30'
+    assert rv.headers['Age'] == '0'
+    assert len(calls) == 1
+
+    rv = client.get('/foo?id=2')
+    assert rv.json == {'id': 2, 'name': 'foo'}
+    assert len(calls) == 2
+    assert len(app.cache_backend) == 2
+
+
+def test_cache_with_pydantic_input(app, client):
+    class PetQuery(BaseModel):
+        page: int = 1
+
+    calls = []
+
+    @app.get('/pets')
+    @app.input(PetQuery, location='query')
+    @app.cache()
+    @app.output({})
+    def get_pets(query_data):
+        calls.append(query_data)
+        return {}
+
+    client.get('/pets')
+    client.get('/pets?page=1')
+    assert len(calls) == 1
+
+
+def test_cache_ttl(app, client, monkeypatch):
+    calls = []
+
+    @app.get('/foo')
+    @app.cache(ttl=10)
+    @app.output(Foo)
+    def foo():
+        calls.append(1)
+        return {'name': 'foo'}
+
+    client.get('/foo')
+    client.get('/foo')
+    assert len(calls) == 1
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 11)
+    client.get('/foo')
+    assert len(calls) == 2
+
+
+def test_cache_skip_unsafe_methods_and_errors(app, client):
+    calls = []
+
+    @app.post('/foo')
+    @app.cache()
+    @app.output(Foo)
+    def create_foo():
+        calls.append(1)
+        return {'name': 'foo'}
+
+    @app.get('/bar')
+    @app.cache()
+    def bar():
+        calls.append(1)
+        return {'message': 'error'}, 400
+
+    client.post('/foo')
+    client.post('/foo')
+    client.get('/bar')
+    client.get('/bar')
+    assert len(calls) == 4
+
+
+def test_cache_vary_user(app, client):
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return token
+
+    @app.get('/foo')
+    @app.auth_required(auth)
+    @app.cache(vary=['user'])
+    def foo():
+        return {'user': auth.current_user}
+
+    rv = client.get('/foo', headers={'Authorization': 'Bearer a'})
+    assert rv.json == {'user': 'a'}
+    assert rv.headers['Cache-Control'] == 'private, max-age=60'
+    rv = client.get('/foo', headers={'Authorization': 'Bearer b'})
+    assert rv.json == {'user': 'b'}
+    rv = client.get('/foo', headers={'Authorization': 'Bearer a'})
+    assert rv.json == {'user': 'a'}
+    assert 'Age' in rv.headers
+
+
+@pytest.mark.parametrize('cache_first', [True, False])
+def test_cache_auth_required(app, client, cache_first):
+    auth = HTTPTokenAuth()
+    calls = []
+
+    @auth.verify_token
+    def verify_token(token):
+        return {'alice-token': 'alice', 'bob-token': 'bob'}.get(token)
+
+    def get_user():
+        calls.append(auth.current_user)
+        return {'user': auth.current_user}
+
+    if cache_first:
+        view = app.cache(ttl=60)(app.auth_required(auth)(get_user))
+    else:
+        view = app.auth_required(auth)(app.cache(ttl=60)(get_user))
+    app.get('/me')(view)
+
+    rv = client.get('/me', headers={'Authorization': 'Bearer alice-token'})
+    assert rv.json == {'user': 'alice'}
+    assert rv.headers['Cache-Control'] == 'private, max-age=60'
+    rv = client.get('/me', headers={'Authorization': 'Bearer bob-token'})
+    assert rv.json == {'user': 'bob'}
+    rv = client.get('/me')
+    assert rv.status_code == 401
+    rv = client.get('/me', headers={'Authorization': 'Bearer alice-token'})
+    assert rv.json == {'user': 'alice'}
+    assert 'Age' in rv.headers
+    assert calls == ['alice', 'bob']
+
+    spec = app.spec
+    headers = spec['paths']['/me']['get']['responses']['200']['headers']
+    assert headers['Cache-Control']['schema']['example'] == 'private, max-age=60'
+
+
+def test_cache_user_identity(app, client):
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return User(token)
+
+    @app.get('/foo')
+    @app.auth_required(auth)
+    @app.cache()
+    def foo():
+        return {'user': auth.current_user.name}
+
+    @app.get('/bar')
+    @app.auth_required(auth)
+    @app.cache(vary=[lambda: auth.current_user.name])
+    def bar():
+        return {'user': auth.current_user.name}
+
+    rv = client.get('/foo', headers={'Authorization': 'Bearer a'})
+    assert rv.status_code == 500
+    rv = client.get('/bar', headers={'Authorization': 'Bearer a'})
+    assert rv.json == {'user': 'a'}
+    rv = client.get('/bar', headers={'Authorization': 'Bearer b'})
+    assert rv.json == {'user': 'b'}
+    assert 'Age' not in rv.headers
+    rv = client.get('/bar', headers={'Authorization': 'Bearer a'})
+    assert 'Age' in rv.headers
+
+
+def test_cache_vary_host(app, client):
+    @app.get('/foo')
+    @app.cache()
+    def foo():
+        return {'url': url_for('foo', _external=True)}
+
+    rv = client.get('/foo', base_url='http://a.example.com')
+    assert rv.json == {'url': 'http://a.example.com/foo'}
+    rv = client.get('/foo', base_url='http://b.example.com')
+    assert rv.json == {'url': 'http://b.example.com/foo'}
+    assert 'Age' not in rv.headers
+
+
+def test_cache_custom_backend(app, client):
+    backend = DictCacheBackend()
+
+    @app.get('/foo')
+    @app.cache(backend=backend)
+    def foo():
+        return {'name': 'foo'}
+
+    client.get('/foo')
+    assert len(backend.entries) == 1
+    assert app.cache_backend is None
+
+
+def test_cache_invalid_vary(app, client):
+    @app.get('/foo')
+    @app.cache(vary=['body'])
+    def foo():
+        pass
+
+    app.testing = False
+    rv = client.get('/foo')
+    assert rv.status_code == 500
+
+
+def test_memory_cache_backend_eviction():
+    backend = MemoryCacheBackend(max_entries=2, max_bytes=100)
+    now = time.time()
+
+    def make_entry(size):
+        return CacheEntry(b'x' * size, 200, [], now, now + 60)
+
+    backend.set('a', make_entry(10))
+    backend.set('b', make_entry(10))
+    assert backend.get('a') is not None
+    backend.set('c', make_entry(10))
+    assert backend.get('b') is None
+    assert backend.get('a') is not None
+    assert len(backend) == 2
+
+    backend.set('d', make_entry(95))
+    assert len(backend) == 1
+    assert backend.current_bytes == 95
+
+    backend.set('e', make_entry(101))
+    assert backend.get('e') is None
+
+    backend.delete('d')
+    assert len(backend) == 0
+    backend.set('f', CacheEntry(b'', 200, [], now, now))
+    assert backend.get('f') is None
+    backend.set('g', make_entry(1))
+    backend.clear()
+    assert backend.current_bytes == 0
+
+
+@pytest.mark.parametrize('vary', [['query'], []])
+def test_cache_spec(app, client, vary):
+    @app.get('/foo')
+    @app.cache(ttl=30, vary=vary)
+    @app.output(Foo)
+    def foo():
+        pass
+
+    spec = app.spec
+    osv.validate(spec)
+    headers = spec['paths']['/foo']['get']['responses']['200']['headers']
+    assert headers['Cache-Control']['schema']['example'] == 'public, max-age=30'
+    assert headers['Age']['schema'] == {'type': 'integer'}
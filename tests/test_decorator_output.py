@@ -346,3 +346,111 @@ def test_response_content_type(app, client):
     assert len(rv.json['paths']['/bar']['get']['responses']['200']['content']) == 1
     assert 'application/json' in rv.json['paths']['/foo']['get']['responses']['200']['content']
     assert 'image/png' in rv.json['paths']['/bar']['get']['responses']['200']['content']
+
+
+def test_output_etag(app, client):
+    calls = []
+
+    @app.get('/foo')
+    @app.output(Foo, etag=True)
+    def foo():
+        calls.append(1)
+        return {'id': 1, 'name': 'foo'}
+
+    rv = client.get('/foo')
+    assert rv.status_code == 200
+    etag = rv.headers['ETag']
+    assert not etag.startswith('W/')
+
+    rv = client.get('/foo', headers={'If-None-Match': etag})
+    assert rv.status_code == 304
+    assert rv.data == b''
+    assert rv.headers['ETag'] == etag
+    assert len(calls) == 2
+
+    rv = client.get('/foo', headers={'If-None-Match': '"other"'})
+    assert rv.status_code == 200
+    assert rv.json == {'id': 1, 'name': 'foo'}
+
+
+def test_output_etag_version_callable(app, client):
+    versions = {1: 'v1'}
+    calls = []
+
+    @app.get('/pets/<int:pet_id>')
+    @app.output(Foo, etag=lambda pet_id: versions[pet_id])
+    def get_pet(pet_id):
+        calls.append(pet_id)
+        return {'id': pet_id, 'name': 'foo'}
+
+    @app.put('/pets/<int:pet_id>')
+    @app.output(Foo, etag=lambda pet_id: versions[pet_id])
+    def update_pet(pet_id):
+        versions[pet_id] = 'v2'
+        return {'id': pet_id, 'name': 'bar'}
+
+    rv = client.get('/pets/1')
+    assert rv.status_code == 200
+    etag = rv.headers['ETag']
+    assert len(calls) == 1
+
+    rv = client.get('/pets/1', headers={'If-None-Match': etag})
+    assert rv.status_code == 304
+    assert rv.headers['ETag'] == etag
+    assert len(calls) == 1
+
+    rv = client.put('/pets/1', headers={'If-Match': '"stale"'})
+    assert rv.status_code == 412
+    assert rv.json['message'] == 'Precondition Failed'
+    assert versions[1] == 'v1'
+
+    rv = client.put('/pets/1', headers={'If-Match': etag})
+    assert rv.status_code == 200
+    assert versions[1] == 'v2'
+
+    rv = client.get('/pets/1', headers={'If-None-Match': etag})
+    assert rv.status_code == 200
+    assert rv.headers['ETag'] != etag
+    assert len(calls) == 2
+
+
+def test_output_etag_skip_error_response(app, client):
+    @app.get('/foo')
+    @app.output(Foo, etag=True)
+    def foo():
+        return {'name': 'foo'}, 400
+
+    rv = client.get('/foo')
+    assert rv.status_code == 400
+    assert 'ETag' not in rv.headers
+
+
+def test_output_etag_spec(app, client):
+    @app.get('/foo')
+    @app.output(Foo, etag=True)
+    def foo():
+        pass
+
+    @app.put('/foo')
+    @app.output(Foo, etag=lambda: 1)
+    def update_foo():
+        pass
+
+    @app.post('/foo')
+    @app.output(Foo, status_code=201, etag=True)
+    def create_foo():
+        pass
+
+    spec = app.spec
+    osv.validate(spec)
+    get_responses = spec['paths']['/foo']['get']['responses']
+    assert get_responses['304'] == {'description': 'Not Modified'}
+    assert 'ETag' in get_responses['200']['headers']
+    put_responses = spec['paths']['/foo']['put']['responses']
+    assert '304' not in put_responses
+    assert put_responses['412']['content']['application/json']['schema'] == {
+        '$ref': '#/components/schemas/HTTPError'
+    }
+    post_responses = spec['paths']['/foo']['post']['responses']
+    assert '412' not in post_responses
+    assert 'ETag' in post_responses['201']['headers']
@@ -1,4 +1,5 @@
 import io
+import threading
 import typing as t
 
 import pytest
@@ -10,6 +11,7 @@ from apiflask import pagination_builder
 from apiflask import PaginationModel
 from apiflask import PaginationSchema
 from apiflask.fields import UploadFile
+from apiflask.helpers import _BoundedCache
 from apiflask.helpers import _get_fields_by_type
 from apiflask.helpers import _normalize_header_name
 
@@ -126,6 +128,101 @@ def test_pagination_builder_exception_case(app, client):
     assert rv.status_code == 500
 
 
+def test_pagination_builder_url_template_cache(app, client):
+    class Pagination:
+        page = 2
+        per_page = 10
+        pages = 5
+        total = 50
+        next_num = 3
+        has_next = True
+        prev_num = 1
+        has_prev = True
+
+    @app.get('/pets/<category>')
+    @app.output(PaginationModel)
+    def get_pets(category):
+        return pagination_builder(Pagination(), schema_type='pydantic', category=category)
+
+    rv = client.get('/pets/cat')
+    assert rv.status_code == 200
+    assert rv.json['next'] == 'http://localhost/pets/cat?page=3&per_page=10'
+    assert rv.json['prev'] == 'http://localhost/pets/cat?page=1&per_page=10'
+    assert rv.json['last'] == 'http://localhost/pets/cat?page=5&per_page=10'
+    assert len(app._pagination_url_templates) == 1
+
+    rv = client.get('/pets/cat')
+    assert len(app._pagination_url_templates) == 1
+
+    rv = client.get('/pets/dog', base_url='https://example.com')
+    assert rv.json['current'] == 'https://example.com/pets/dog?page=2&per_page=10'
+    assert len(app._pagination_url_templates) == 2
+
+
+def test_pagination_builder_unhashable_kwargs(app, client):
+    class Pagination:
+        page = 1
+        per_page = 20
+        pages = 1
+        total = 1
+        next_num = None
+        has_next = False
+        prev_num = None
+        has_prev = False
+
+    @app.get('/pets')
+    @app.output(PaginationSchema)
+    def get_pets():
+        return pagination_builder(Pagination(), tags=['a', 'b'])
+
+    rv = client.get('/pets')
+    assert rv.status_code == 200
+    assert rv.json['current'].endswith('/pets?page=1&per_page=20&tags=a&tags=b')
+    assert len(app._pagination_url_templates) == 0
+
+
+def test_bounded_cache():
+    cache = _BoundedCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 3)
+    assert cache.get('a') == 3
+    cache.set('c', 4)
+    assert cache.keys() == ['b', 'c']
+    assert cache.get('a', 0) == 0
+    cache.clear()
+    assert len(cache) == 0
+
+    def fill(start):
+        for index in range(start, start + 1000):
+            cache.set(index, index)
+
+    threads = [threading.Thread(target=fill, args=(index * 1000,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 2
+
+
+def test_pagination_model_from_trusted():
+    data = {
+        'page': 1,
+        'per_page': 20,
+        'pages': 1,
+        'total': 1,
+        'current': 'http://localhost/pets?page=1',
+        'next': '',
+        'prev': '',
+        'first': 'http://localhost/pets?page=1',
+        'last': 'http://localhost/pets?page=1',
+    }
+    model = PaginationModel.from_trusted(**data)
+    assert model.current == 'http://localhost/pets?page=1'
+    assert model.model_dump(mode='json') == data
+    assert PaginationModel(**data).model_dump(mode='json') == data
+
+
 def test_get_fields_by_type():
     class Files(BaseModel):
         single_file: UploadFile
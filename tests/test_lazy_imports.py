@@ -0,0 +1,144 @@
+import subprocess
+import sys
+
+import pytest
+
+import apiflask
+
+# the heavy modules that are only needed when the spec is generated or the docs are served
+deferred_modules = {
+    'apispec',
+    'apispec.ext.marshmallow',
+    'yaml',
+    'flask_marshmallow',
+    'flask_sqlalchemy',
+    'apiflask.ui_templates',
+}
+
+
+def get_imported_modules(code):
+    """Run the code in a new interpreter, return the names of the imported modules."""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    modules = set()
+    for line in output.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.rsplit('|', 1)[1].strip())
+    return modules
+
+
+@pytest.mark.parametrize(
+    'code',
+    [
+        'import apiflask',
+        'from apiflask import APIFlask, APIBlueprint, Schema, HTTPTokenAuth, abort',
+        'from apiflask import APIFlask\n'
+        'from apiflask.fields import String\n'
+        'from apiflask.validators import Length\n'
+        'app = APIFlask(__name__, docs_path=None)\n'
+        '@app.get("/")\n'
+        '@app.input({"name": String(validate=Length(1))}, location="query")\n'
+        'def index(query_data):\n'
+        '    return query_data\n'
+        'app.test_client().get("/?name=foo")',
+    ],
+)
+def test_deferred_imports(code):
+    imported = get_imported_modules(code)
+    assert 'apiflask' in imported
+    assert not imported & deferred_modules
+
+
+def test_import_apiflask_is_lazy():
+    imported = get_imported_modules('import apiflask')
+    assert 'apiflask' in imported
+    assert not imported & {'apiflask.app', 'apiflask.security', 'marshmallow', 'flask_httpauth'}
+
+
+def test_spec_generation_imports_apispec():
+    imported = get_imported_modules(
+        'from apiflask import APIFlask\n'
+        'app = APIFlask(__name__)\n'
+        'with app.app_context():\n'
+        '    app.spec'
+    )
+    assert {'apispec', 'apiflask.ui_templates'} <= imported
+
+
+pydantic_app = """
+from pydantic import BaseModel, Field
+from apiflask import APIFlask, HTTPTokenAuth
+
+class PetIn(BaseModel):
+    name: str = Field(min_length=1)
+
+class PetOut(BaseModel):
+    id: int
+    name: str
+
+app = APIFlask(__name__)
+auth = HTTPTokenAuth()
+auth.verify_token(lambda token: token)
+
+@app.post('/pets')
+@app.input(PetIn)
+@app.output(PetOut, status_code=201)
+def create_pet(json_data):
+    return {'id': 1, **json_data.model_dump()}
+
+@app.delete('/pets/<int:pet_id>')
+@app.auth_required(auth)
+@app.output({}, status_code=204)
+def delete_pet(pet_id):
+    return ''
+
+client = app.test_client()
+assert client.post('/pets', json={'name': 'foo'}).json == {'id': 1, 'name': 'foo'}
+assert client.post('/pets', json={'name': ''}).status_code == 422
+assert client.delete('/pets/1', headers={'Authorization': 'Bearer foo'}).status_code == 204
+spec = client.get('/openapi.json').json
+assert {'PetIn', 'PetOut', 'HTTPError', 'ValidationError'} <= set(spec['components']['schemas'])
+assert client.get('/docs').status_code == 200
+"""
+
+marshmallow_modules = {'marshmallow', 'webargs', 'flask_marshmallow', 'apispec.ext.marshmallow'}
+
+
+def test_pydantic_only_app():
+    imported = get_imported_modules(pydantic_app)
+    assert 'pydantic' in imported
+    assert not imported & marshmallow_modules
+
+
+def test_pydantic_only_app_without_marshmallow():
+    # the import of the marshmallow modules fails as they are not installed
+    blocked = ''.join(f'sys.modules[{name!r}] = None\n' for name in marshmallow_modules)
+    get_imported_modules(f'import sys\n{blocked}{pydantic_app}')
+
+
+def test_lazy_attributes():
+    for name in apiflask.__all__:
+        assert getattr(apiflask, name) is not None
+    assert set(apiflask.__all__) <= set(dir(apiflask))
+    with pytest.raises(AttributeError, match='has no attribute'):
+        apiflask.missing  # noqa: B018
+
+
+def test_lazy_flask_marshmallow_attributes():
+    from flask_marshmallow import fields
+    from flask_marshmallow import validate
+
+    from apiflask.fields import File
+    from apiflask.validators import FileSize
+
+    assert File is fields.File
+    assert apiflask.fields.URLFor is fields.URLFor
+    assert FileSize is validate.FileSize
+    with pytest.raises(AttributeError):
+        apiflask.fields.Missing  # noqa: B018
+    with pytest.raises(AttributeError):
+        apiflask.validators.Missing  # noqa: B018
@@ -0,0 +1,149 @@
+import datetime
+
+import pytest
+from marshmallow import post_dump
+from marshmallow import pre_dump
+
+from .schemas import Foo
+from apiflask import Schema
+from apiflask.fields import Boolean
+from apiflask.fields import DateTime
+from apiflask.fields import Float
+from apiflask.fields import Integer
+from apiflask.fields import List
+from apiflask.fields import Method
+from apiflask.fields import Nested
+from apiflask.fields import Raw
+from apiflask.fields import String
+from apiflask.schema_adapters.marshmallow_compiler import get_compiled_dump
+
+
+class Owner(Schema):
+    name = String()
+
+
+class Pet(Schema):
+    id = Integer()
+    name = String(data_key='petName')
+    category = String(dump_default='dog')
+    weight = Float()
+    price = Integer(as_string=True)
+    vaccinated = Boolean()
+    extra = Raw()
+    tags = List(String())
+    owner = Nested(Owner)
+    owner_name = String(attribute='owner.name')
+    created_at = DateTime(dump_default=lambda: datetime.datetime(2024, 1, 1))
+    label = Method('get_label')
+    password = String(load_only=True)
+
+    def get_label(self, obj):
+        return 'label'
+
+
+class PetObject:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class PetMapping(dict):
+    """A dict subclass to test the generic accessor."""
+
+
+pet_data = {
+    'id': '1',
+    'name': b'Kitty',
+    'weight': 2,
+    'price': 10,
+    'vaccinated': True,
+    'extra': {'foo': 'bar'},
+    'tags': ['cute', 'small'],
+    'owner': {'name': 'Grey'},
+    'password': 'secret',
+}
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        pet_data,
+        PetObject(**pet_data),
+        PetMapping(pet_data),
+        {'id': None, 'name': None, 'weight': None},
+        {},
+    ],
+)
+def test_compiled_dump(obj):
+    schema = Pet()
+    dump = get_compiled_dump(schema)
+    assert dump is not None
+    assert dump(obj, False) == schema.dump(obj)
+    assert dump([obj, obj], True) == schema.dump([obj, obj], many=True)
+
+
+@pytest.mark.parametrize('value', [1, 0, 'no', 'yes', None])
+def test_compiled_dump_boolean(monkeypatch, value):
+    from marshmallow import fields
+
+    # the Boolean field of marshmallow 3 converts the truthy and falsy values
+    truthy = {1, 'yes'}
+    monkeypatch.setattr(
+        fields.Boolean,
+        '_serialize',
+        lambda self, value, attr, obj, **kwargs: None if value is None else value in truthy,
+    )
+
+    class Flags(Schema):
+        active = Boolean()
+
+    schema = Flags()
+    dump = get_compiled_dump(schema)
+    assert dump({'active': value}, False) == schema.dump({'active': value})
+
+
+def test_compiled_dump_cache():
+    assert get_compiled_dump(Pet()) is get_compiled_dump(Pet())
+    only_dump = get_compiled_dump(Pet(only=('id',)))
+    assert only_dump is not get_compiled_dump(Pet())
+    assert only_dump(pet_data, False) == {'id': 1}
+    assert get_compiled_dump(Pet(exclude=('id',)))(pet_data, False)['petName'] == 'Kitty'
+
+
+def test_compiled_dump_unsupported_schema():
+    class PreDumpSchema(Schema):
+        name = String()
+
+        @pre_dump
+        def process(self, data, **kwargs):
+            return data
+
+    class PostDumpSchema(Schema):
+        name = String()
+
+        @post_dump
+        def process(self, data, **kwargs):
+            return data
+
+    class CustomAttributeSchema(Schema):
+        name = String()
+
+        def get_attribute(self, obj, attr, default):
+            return 'foo'
+
+    assert get_compiled_dump(PreDumpSchema()) is None
+    assert get_compiled_dump(PostDumpSchema()) is None
+    assert get_compiled_dump(CustomAttributeSchema()) is None
+
+
+@pytest.mark.parametrize('config_value', [True, False])
+def test_compile_output_schemas_config(app, client, config_value):
+    app.config['COMPILE_OUTPUT_SCHEMAS'] = config_value
+
+    @app.get('/foo')
+    @app.output(Foo(many=True))
+    def foo():
+        return [{'id': str(i), 'name': 'foo'} for i in range(3)]
+
+    rv = client.get('/foo')
+    assert rv.status_code == 200
+    assert rv.json == [{'id': i, 'name': 'foo'} for i in range(3)]
@@ -0,0 +1,155 @@
+import gc
+import threading
+
+import pytest
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask import APIFlask
+from apiflask import HTTPTokenAuth
+from apiflask.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def metrics_app():
+    app = APIFlask(__name__, metrics_path='/metrics')
+    app.config['METRICS'] = True
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return token == 'a'
+
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    @app.output(Foo)
+    def foo(query_data):
+        return {'id': query_data['id'], 'name': 'foo'}
+
+    @app.get('/bar')
+    @app.auth_required(auth)
+    def bar():
+        return {}
+
+    return app
+
+
+def get_metrics(client):
+    rv = client.get('/metrics')
+    assert rv.status_code == 200
+    assert rv.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+    return rv.text.splitlines()
+
+
+def test_metrics(metrics_app):
+    client = metrics_app.test_client()
+    client.get('/foo?id=1')
+    client.get('/foo?id=2')
+    client.get('/foo?id=x')
+    client.get('/bar', headers={'Authorization': 'Bearer b'})
+    client.get('/bar', headers={'Authorization': 'Bearer a'})
+
+    lines = get_metrics(client)
+    assert '# TYPE apiflask_requests_total counter' in lines
+    assert 'apiflask_requests_total{endpoint="foo",method="GET",status="2xx"} 2' in lines
+    assert 'apiflask_requests_total{endpoint="foo",method="GET",status="4xx"} 1' in lines
+    assert 'apiflask_requests_total{endpoint="bar",method="GET",status="2xx"} 1' in lines
+    assert 'apiflask_validation_errors_total{endpoint="foo"} 1' in lines
+    assert 'apiflask_auth_errors_total{endpoint="bar",status_code="401"} 1' in lines
+    assert '# TYPE apiflask_request_duration_seconds histogram' in lines
+    assert 'apiflask_request_duration_seconds_bucket{endpoint="foo",le="+Inf"} 3' in lines
+    assert 'apiflask_request_duration_seconds_count{endpoint="foo"} 3' in lines
+    assert 'apiflask_response_size_bytes_bucket{endpoint="foo",le="100"} 3' in lines
+    # the metrics endpoint is excluded from the spec
+    assert '/metrics' not in metrics_app.spec['paths']
+
+
+def test_metrics_auth_error_processor(metrics_app):
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return False
+
+    @auth.error_processor
+    def handle_auth_error(error):
+        return {'message': error.message}, error.status_code
+
+    @metrics_app.get('/baz')
+    @metrics_app.auth_required(auth)
+    def baz():
+        return {}
+
+    client = metrics_app.test_client()
+    assert client.get('/baz').status_code == 401
+    lines = get_metrics(client)
+    assert 'apiflask_auth_errors_total{endpoint="baz",status_code="401"} 1' in lines
+
+
+def test_metrics_disabled(metrics_app):
+    metrics_app.config['METRICS'] = False
+    client = metrics_app.test_client()
+    client.get('/foo?id=1')
+    assert client.get('/metrics').text == ''
+
+
+def test_metrics_path_default(app, client):
+    app.config['METRICS'] = True
+    assert client.get('/metrics').status_code == 404
+
+
+def test_metrics_decorators(metrics_app):
+    def auth(f):
+        def wrapper(*args, **kwargs):
+            return 'unauthorized', 401
+
+        return wrapper
+
+    metrics_app.config['METRICS_DECORATORS'] = [auth]
+    assert metrics_app.test_client().get('/metrics').status_code == 401
+
+
+def test_metrics_registry_shards():
+    registry = MetricsRegistry(latency_buckets=[0.1, 1], size_buckets=[10])
+
+    def worker():
+        for _ in range(1000):
+            registry.inc('requests_total', (('endpoint', 'foo'),))
+            registry.observe('duration_seconds', (('endpoint', 'foo'),), 0.5)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counters, histograms = registry.collect()
+    assert counters[('requests_total', (('endpoint', 'foo'),))] == 4000
+    assert histograms[('duration_seconds', (('endpoint', 'foo'),))] == [0, 4000, 0, 2000.0]
+    # the shards of the exited threads are folded into the retired shard
+    gc.collect()
+    assert registry._shards == []
+
+    registry.inc('requests_total', (('endpoint', 'foo'),))
+    assert registry.collect()[0][('requests_total', (('endpoint', 'foo'),))] == 4001
+    assert len(registry._shards) == 1
+
+    output = registry.to_prometheus()
+    assert '# TYPE requests_total counter' in output
+    assert '# TYPE duration_seconds histogram' in output
+    assert 'duration_seconds_bucket{endpoint="foo",le="0.1"} 0' in output
+    assert 'duration_seconds_bucket{endpoint="foo",le="1"} 4000' in output
+    assert 'duration_seconds_sum{endpoint="foo"} 2000' in output
+
+    registry.clear()
+    assert registry.to_prometheus() == ''
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert registry.collect()[0][('requests_total', (('endpoint', 'foo'),))] == 1000
+
+
+def test_metrics_label_escaping():
+    registry = MetricsRegistry()
+    registry.inc('foo_total', (('name', 'a"b\\c\nd'),))
+    assert 'foo_total{name="a\\"b\\\\c\\nd"} 1' in registry.to_prometheus()
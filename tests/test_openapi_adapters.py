@@ -4,6 +4,7 @@ from marshmallow import validate
 
 from apiflask.openapi_adapters import get_unique_schema_name
 from apiflask.openapi_adapters import OpenAPIHelper
+from apiflask.openapi_adapters import SchemaNameIndex
 
 
 class SimpleSchema(Schema):
@@ -49,6 +50,31 @@ def test_get_unique_schema_name():
     assert unique_name2 == 'TestSchema2'
 
 
+def test_schema_name_index():
+    """Test SchemaNameIndex class."""
+    from apispec import APISpec
+
+    spec = APISpec(title='Test', version='1.0.0', openapi_version='3.0.3')
+    index = SchemaNameIndex()
+    assert index.get_unique_name(spec, 'TestSchema') == 'TestSchema'
+    spec.components.schema('TestSchema', {'type': 'object'})
+    spec.components.schema('TestSchema1', {'type': 'object'})
+    assert index.get_unique_name(spec, 'TestSchema') == 'TestSchema2'
+    # the name is the same until it's registered
+    assert index.get_unique_name(spec, 'TestSchema') == 'TestSchema2'
+    spec.components.schema('TestSchema2', {'type': 'object'})
+    spec.components.schema('TestSchema3', {'type': 'object'})
+    assert index.get_unique_name(spec, 'TestSchema') == 'TestSchema4'
+    assert index.get_unique_name(spec, 'Other') == 'Other'
+
+    index.add(SimpleSchema(), 'SimpleSchema')
+    index.add(SimpleSchema(partial=True), 'SimpleSchemaUpdate')
+    assert index.get(SimpleSchema()) == 'SimpleSchema'
+    assert index.get(SimpleSchema(partial=True)) == 'SimpleSchemaUpdate'
+    assert index.get(SimpleSchema(only=['name'])) is None
+    assert index.get(list[SimpleSchema]) is None
+
+
 class TestOpenAPIHelper:
     """Test OpenAPIHelper class."""
 
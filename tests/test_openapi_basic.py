@@ -1,4 +1,5 @@
 import json
+import os
 
 import openapi_spec_validator as osv
 import pytest
@@ -11,6 +12,7 @@ from apiflask import APIBlueprint
 from apiflask import Schema
 from apiflask.commands import spec_command
 from apiflask.fields import Integer
+from apiflask.spec_file import write_spec_file
 
 
 def test_spec(app):
@@ -161,6 +163,39 @@ def test_spec_schemas(app):
     assert 'array' == list_schema['type']
 
 
+def test_spec_schema_variants(app):
+    @app.get('/foo')
+    @app.output(Foo)
+    def foo():
+        pass
+
+    @app.patch('/foo')
+    @app.input(Foo(partial=True))
+    @app.output(Foo(partial=True))
+    def update_foo(json_data):
+        pass
+
+    @app.put('/foo')
+    @app.input(Foo(partial=True))
+    @app.output(Foo(only=['id']))
+    def replace_foo(json_data):
+        pass
+
+    spec = app.spec
+    assert set(spec['components']['schemas']) == {'Foo', 'FooUpdate', 'Foo1', 'ValidationError'}
+    operations = spec['paths']['/foo']
+
+    def get_ref(operation):
+        return operation['responses']['200']['content']['application/json']['schema']['$ref']
+
+    assert get_ref(operations['get']).endswith('/Foo')
+    assert get_ref(operations['patch']).endswith('/FooUpdate')
+    assert get_ref(operations['put']).endswith('/Foo1')
+    for method in ['patch', 'put']:
+        body = operations[method]['requestBody']['content']['application/json']['schema']
+        assert body['$ref'].endswith('/FooUpdate')
+
+
 def test_servers_and_externaldocs(app):
     assert app.external_docs is None
     assert app.servers is None
@@ -198,6 +233,101 @@ def test_default_servers(app):
         ]
 
 
+def test_auto_servers_for_each_host(app, client, monkeypatch):
+    calls = []
+    generate_spec = app._generate_spec
+    monkeypatch.setattr(app, '_generate_spec', lambda: calls.append(1) or generate_spec())
+
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert rv.json['servers'] == [{'url': 'http://foo.example.com/'}]
+    rv = client.get('/openapi.json', base_url='https://bar.example.com/api')
+    assert rv.json['servers'] == [{'url': 'https://bar.example.com/api/'}]
+    assert len(calls) == 1
+    assert 'servers' not in app._get_spec()
+    with app.test_request_context():
+        spec = app._get_spec()
+        assert list(spec) == ['info', 'tags', 'servers', 'paths', 'openapi']
+
+
+def test_auto_servers_yaml_spec(app, client):
+    app.config['SPEC_FORMAT'] = 'yaml'
+    app.config['AUTO_SERVERS_HOSTS'] = ['.example.com']
+    app._auto_servers_cache.max_size = 1
+
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert b'- url: http://foo.example.com/' in rv.data
+    rv = client.get('/openapi.json', base_url='http://bar.example.com')
+    assert b'- url: http://bar.example.com/' in rv.data
+    assert app._auto_servers_cache.keys() == [('', 'http://bar.example.com/', 'yaml')]
+
+
+def test_auto_servers_with_spec_processor(app, client):
+    @app.spec_processor
+    def update_spec(spec):
+        spec['servers'] = [{'url': 'https://example.com'}]
+        return spec
+
+    rv = client.get('/openapi.json')
+    assert rv.json['servers'] == [{'url': 'https://example.com'}]
+
+
+@pytest.mark.parametrize('pass_object', [False, True])
+def test_auto_servers_passed_to_spec_processor(app, client, pass_object):
+    app.config['SPEC_PROCESSOR_PASS_OBJECT'] = pass_object
+    app.config['AUTO_SERVERS_HOSTS'] = ['foo.example.com', 'bar.example.com']
+
+    @app.spec_processor
+    def update_spec(spec):
+        servers = spec.options['servers'] if pass_object else spec['servers']
+        servers[0]['url'] = servers[0]['url'].replace('http://', 'https://')
+        return spec
+
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert rv.json['servers'] == [{'url': 'https://foo.example.com/'}]
+    rv = client.get('/openapi.json', base_url='http://bar.example.com')
+    assert rv.json['servers'] == [{'url': 'https://bar.example.com/'}]
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert rv.json['servers'] == [{'url': 'https://foo.example.com/'}]
+    assert 'servers' not in app._get_spec()
+
+
+@pytest.mark.parametrize('spec_format', ['json', 'yaml'])
+def test_auto_servers_untrusted_host(app, client, spec_format):
+    app.config['SPEC_FORMAT'] = spec_format
+    app.config['SERVER_NAME'] = 'foo.example.com'
+
+    @app.spec_processor
+    def update_spec(spec):
+        spec['info']['title'] = 'Updated'
+        return spec
+
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert b'http://foo.example.com/' in rv.data
+    app.config['SERVER_NAME'] = None
+    app.config['AUTO_SERVERS_HOSTS'] = ['.example.com']
+    rv = client.get('/openapi.json', base_url='http://bar.example.com')
+    assert b'http://bar.example.com/' in rv.data
+    # the spec without the servers for the other hosts, which are not cached
+    rv = client.get('/openapi.json', base_url='http://evil.test')
+    assert b'Updated' in rv.data
+    assert b'servers' not in rv.data
+    assert {key[1] for key in app._auto_servers_cache.keys()} == {
+        'http://foo.example.com/',
+        'http://bar.example.com/',
+    }
+
+
+def test_auto_servers_with_spec_file(app, client, tmp_path):
+    local_spec_path = tmp_path / 'openapi.json'
+    local_spec_path.write_text(json.dumps(app.spec))
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+    app.config['SPEC_SOURCE'] = 'file'
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'ignore'
+
+    rv = client.get('/openapi.json', base_url='http://foo.example.com')
+    assert rv.json['servers'] == [{'url': 'http://foo.example.com/'}]
+
+
 def test_default_servers_without_req_context(cli_runner):
     result = cli_runner.invoke(spec_command)
     assert 'openapi' in result.output
@@ -276,6 +406,47 @@ def test_sync_local_yaml_spec(app, client, tmp_path):
         assert 'title: APIFlask' in spec_content
 
 
+def test_sync_local_spec_only_writes_changes(app, client, tmp_path):
+    app.config['AUTO_SERVERS'] = False
+    local_spec_path = tmp_path / 'openapi.json'
+    app.config['SYNC_LOCAL_SPEC'] = True
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+
+    client.get('/openapi.json')
+    os.utime(local_spec_path, ns=(0, 0))
+    client.get('/openapi.json')
+    app.spec  # noqa: B018
+    assert local_spec_path.stat().st_mtime_ns == 0
+
+    app.title = 'Foo'
+    app.spec  # noqa: B018
+    assert local_spec_path.stat().st_mtime_ns != 0
+    assert json.loads(local_spec_path.read_text())['info']['title'] == 'Foo'
+    assert sorted(os.listdir(tmp_path)) == ['openapi.json', 'openapi.json.lock']
+
+
+def test_sync_local_spec_background(app, client, tmp_path):
+    local_spec_path = tmp_path / 'openapi.json'
+    app.config['SYNC_LOCAL_SPEC'] = True
+    app.config['SYNC_LOCAL_SPEC_BACKGROUND'] = True
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+
+    rv = client.get('/openapi.json')
+    app._spec_sync_thread.join()
+    # the servers of the request host are not saved
+    assert json.loads(local_spec_path.read_text()) == {
+        key: value for key, value in rv.json.items() if key != 'servers'
+    }
+
+
+def test_write_spec_file(tmp_path):
+    local_spec_path = tmp_path / 'openapi.json'
+    assert write_spec_file(local_spec_path, b'{}')
+    assert not write_spec_file(local_spec_path, b'{}')
+    assert write_spec_file(str(local_spec_path), b'{"a": 1}')
+    assert local_spec_path.read_bytes() == b'{"a": 1}'
+
+
 def test_sync_local_spec_no_path(app):
     app.config['SYNC_LOCAL_SPEC'] = True
 
@@ -1,7 +1,12 @@
+import openapi_spec_validator as osv
 import pytest
+from flask import url_for
 
+from apiflask import APIBlueprint
 from apiflask import APIFlask
 
+from .schemas import Bar, Baz, Foo
+
 
 def test_openapi_blueprint(app):
     assert 'openapi' in app.blueprints
@@ -149,3 +154,123 @@ def test_openapi_blueprint_url_prefix(app):
     assert rv.status_code == 404
     rv = client.get(f'{prefix}/docs')
     assert rv.status_code == 200
+
+
+@pytest.fixture
+def sub_spec_app(app):
+    app.config['SUB_SPECS'] = True
+    pets = APIBlueprint('pets', __name__, tag='Pet')
+    users = APIBlueprint('users', __name__)
+
+    @pets.get('/pets/<int:pet_id>')
+    @pets.output(Bar)
+    def get_pet(pet_id):
+        pass
+
+    @pets.post('/pets')
+    @pets.input(Foo)
+    def create_pet(json_data):
+        pass
+
+    @users.get('/users')
+    @users.output(Baz)
+    @users.doc(tags=['Pet', 'User'])
+    def get_users():
+        pass
+
+    app.register_blueprint(pets)
+    app.register_blueprint(users)
+    return app
+
+
+def test_sub_spec(sub_spec_app, client):
+    rv = client.get('/openapi/Pet.json')
+    assert rv.status_code == 200
+    osv.validate(rv.json)
+    assert list(rv.json['paths']) == ['/pets', '/pets/{pet_id}', '/users']
+    # the unused Users tag is removed
+    assert [tag['name'] for tag in rv.json['tags']] == ['Pet']
+    assert set(rv.json['components']['schemas']) == {
+        'Bar',
+        'Baz',
+        'Foo',
+        'HTTPError',
+        'ValidationError',
+    }
+    assert rv.json['servers'] == [{'url': 'http://localhost/'}]
+
+    rv = client.get('/openapi/User.json')
+    assert list(rv.json['paths']) == ['/users']
+    assert list(rv.json['paths']['/users']) == ['get']
+    assert [tag['name'] for tag in rv.json['tags']] == ['Pet']
+    assert set(rv.json['components']['schemas']) == {'Baz'}
+
+
+def test_blueprint_sub_spec(sub_spec_app, client):
+    rv = client.get('/openapi/pets.json')
+    assert rv.status_code == 200
+    assert list(rv.json['paths']) == ['/pets', '/pets/{pet_id}']
+    assert [tag['name'] for tag in rv.json['tags']] == ['Pet']
+    assert 'Baz' not in rv.json['components']['schemas']
+
+    assert client.get('/openapi/openapi.json').status_code == 404
+    assert client.get('/openapi/missing.json').status_code == 404
+
+
+def test_sub_spec_cache(sub_spec_app, client):
+    client.get('/openapi/Pet.json')
+    sub_spec = sub_spec_app._sub_spec_cache[('Pet', 'json')]
+    client.get('/openapi/Pet.json')
+    assert sub_spec_app._sub_spec_cache[('Pet', 'json')] is sub_spec
+    # invalidated with the main spec
+    sub_spec_app.spec  # noqa: B018
+    assert sub_spec_app._sub_spec_cache == {}
+
+    sub_spec_app.config['SPEC_FORMAT'] = 'yaml'
+    sub_spec_app.config['AUTO_SERVERS_HOSTS'] = ['localhost']
+    rv = client.get('/openapi/Pet.json')
+    assert rv.headers['Content-Type'] == 'text/vnd.yaml'
+    assert b'/pets/{pet_id}:' in rv.data
+    assert b'- url: http://localhost/' in rv.data
+
+
+def test_sub_spec_disabled(app, client):
+    assert client.get('/openapi/Pet.json').status_code == 404
+    assert 'openapi.sub_spec' not in app.view_functions
+
+    # the route is registered with the first app context, the later config has no effect
+    app.config['SUB_SPECS'] = True
+    assert client.get('/openapi/Pet.json').status_code == 404
+    assert 'openapi.sub_spec' not in app.view_functions
+
+
+def test_sub_spec_url_prefix():
+    app = APIFlask(__name__, openapi_blueprint_url_prefix='/api')
+    app.config['SUB_SPECS'] = True
+    app.tags = ['Pet']
+    client = app.test_client()
+    assert 'openapi.sub_spec' not in app.view_functions
+    with app.test_request_context():
+        assert url_for('openapi.sub_spec', name='Pet') == '/api/openapi/Pet.json'
+    assert client.get('/api/openapi/Pet.json').status_code == 200
+
+
+@pytest.mark.parametrize('ui_name', ['swagger-ui', 'redoc', 'elements', 'rapidoc', 'rapipdf'])
+def test_docs_sub_spec_selector(ui_name):
+    app = APIFlask(__name__, docs_ui=ui_name)
+    app.tags = ['Pet', 'User']
+    client = app.test_client()
+    rv = client.get('/docs')
+    assert b'<select' not in rv.data
+
+    app = APIFlask(__name__, docs_ui=ui_name)
+    app.tags = ['Pet', 'User']
+    app.config['SUB_SPECS'] = True
+    client = app.test_client()
+    rv = client.get('/docs')
+    assert b'<option value="Pet">Pet</option>' in rv.data
+    assert b'"/openapi.json"' in rv.data
+
+    rv = client.get('/docs?spec=User')
+    assert b'<option value="User" selected>User</option>' in rv.data
+    assert b'"/openapi/User.json"' in rv.data
@@ -0,0 +1,108 @@
+import json
+import os
+
+import pytest
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask.commands import profile_report_command
+from apiflask.profiling import load_profiles
+
+
+@pytest.fixture
+def profile_app(app, tmp_path):
+    app.config['PROFILE_DIR'] = str(tmp_path)
+
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    @app.output(Foo)
+    def get_foo(query_data):
+        return {'id': query_data['id'], 'name': 'foo'}
+
+    @app.post('/bar')
+    def create_bar():
+        return {}
+
+    return app
+
+
+def test_profiling_disabled_by_default(profile_app, client, tmp_path):
+    assert client.get('/foo').status_code == 200
+    assert os.listdir(tmp_path) == []
+
+
+def test_profile_routes(profile_app, client, tmp_path):
+    profile_app.config['PROFILE_ROUTES'] = ['get_*']
+    for _ in range(3):
+        assert client.get('/foo?id=2').json == {'id': 2, 'name': 'foo'}
+        assert client.post('/bar').status_code == 200
+    assert os.listdir(tmp_path) == ['get_foo']
+    files = sorted(os.listdir(tmp_path / 'get_foo'))
+    assert len(files) == 6
+    with open(tmp_path / 'get_foo' / files[0]) as f:
+        info = json.load(f)
+    assert info['method'] == 'GET'
+    assert info['path'] == '/foo'
+    assert info['status_code'] == 200
+    assert set(info['timings']) == {'input-query', 'view', 'output', 'total'}
+    # the request timing is not enabled by the profiling
+    assert 'Server-Timing' not in client.get('/foo').headers
+
+    profiles = load_profiles(str(tmp_path))
+    assert [profile.endpoint for profile in profiles] == ['get_foo']
+    profile = profiles[0]
+    assert profile.requests == 4
+    assert list(profile.phases) == ['input-query', 'view', 'output', 'other', 'total']
+    functions = [
+        function['function'] for function in profile.top_functions(len(profile.stats.stats))
+    ]
+    assert any(function.endswith('(get_foo)') for function in functions)
+    assert profile.top_functions(3, sort='tottime')[0]['tottime'] >= 0
+
+
+def test_profile_sample_rate(profile_app, client, tmp_path):
+    profile_app.config['PROFILE_ROUTES'] = ['*']
+    profile_app.config['PROFILE_SAMPLE_RATE'] = 0
+    client.get('/foo')
+    assert os.listdir(tmp_path) == []
+
+
+def test_profile_with_request_timing(profile_app, client, tmp_path):
+    profile_app.config['PROFILE_ROUTES'] = ['get_foo']
+    profile_app.config['REQUEST_TIMING'] = True
+    rv = client.get('/foo')
+    assert 'view;dur=' in rv.headers['Server-Timing']
+    assert len(load_profiles(str(tmp_path))) == 1
+
+
+def test_profile_error_response(profile_app, client, tmp_path):
+    profile_app.config['PROFILE_ROUTES'] = ['get_foo']
+    assert client.get('/foo?id=x').status_code == 422
+    assert client.get('/foo?id=1').status_code == 200
+    assert load_profiles(str(tmp_path))[0].requests == 2
+
+
+def test_flask_profile_report(profile_app, client, cli_runner, tmp_path):
+    result = cli_runner.invoke(profile_report_command)
+    assert result.exit_code == 1
+    assert 'No profile found' in result.output
+
+    profile_app.config['PROFILE_ROUTES'] = ['*']
+    client.get('/foo')
+    client.post('/bar')
+    result = cli_runner.invoke(profile_report_command, ['-n', '5'])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith('get_foo (1 requests, ')
+    assert lines[1].startswith('PHASES  input-query ')
+    assert lines[2].split() == ['NCALLS', 'TOTTIME', 'CUMTIME', 'FUNCTION']
+    assert len(lines) == 2 + 6 + 1 + 2 + 6
+
+    result = cli_runner.invoke(
+        profile_report_command,
+        ['-d', str(tmp_path), '-e', 'create_*', '--sort', 'tottime', '--json'],
+    )
+    report = json.loads(result.output)
+    assert [item['endpoint'] for item in report] == ['create_bar']
+    assert report[0]['requests'] == 1
+    assert len(report[0]['functions']) == 15
@@ -1,4 +1,5 @@
 import sys
+import typing as t
 
 import openapi_spec_validator as osv
 import pytest
@@ -601,3 +602,153 @@ class TestPydanticIntegration:
             assert isinstance(data, dict)
             assert data['user_id'] == 1
             assert data['username'] == 'John Doe'
+
+    def test_trusted_output(self):
+        """Test serializing trusted output without validation."""
+        app = APIFlask(__name__)
+
+        class Tag(BaseModel):
+            name: str
+
+        class Pet(BaseModel):
+            pet_id: int = Field(alias='petId')
+            name: str
+            category: str = 'dog'
+            owner: t.Optional[Tag] = None
+            tags: list[Tag] = []
+
+        class PetObject:
+            def __init__(self, pet_id):
+                self.pet_id = pet_id
+                self.name = 'Kitty'
+                self.owner = {'name': 'Grey'}
+                self.tags = [{'name': 'cute'}]
+
+        @app.get('/pets/<int:pet_id>')
+        @app.output(Pet, validate=False)
+        def get_pet(pet_id):
+            return PetObject(pet_id)
+
+        @app.get('/pets')
+        @app.output(list[Pet], validate=False)
+        def get_pets():
+            return [{'petId': 1, 'name': 'Kitty'}, {'pet_id': 'invalid', 'name': 'Coco'}]
+
+        with app.test_client() as client:
+            rv = client.get('/pets/1')
+            assert rv.status_code == 200
+            assert rv.json == {
+                'petId': 1,
+                'name': 'Kitty',
+                'category': 'dog',
+                'owner': {'name': 'Grey'},
+                'tags': [{'name': 'cute'}],
+            }
+
+            rv = client.get('/pets')
+            assert rv.status_code == 200
+            assert rv.json[0] == {
+                'petId': 1,
+                'name': 'Kitty',
+                'category': 'dog',
+                'owner': None,
+                'tags': [],
+            }
+            # the trusted data is not validated
+            assert rv.json[1]['petId'] == 'invalid'
+
+    def test_trusted_output_config(self):
+        """Test the VALIDATE_OUTPUT config and the validation sampling."""
+        app = APIFlask(__name__)
+        app.config['VALIDATE_OUTPUT'] = False
+
+        @app.get('/users')
+        @app.output(UserModel)
+        def get_user():
+            return {'id': 'invalid', 'name': 'John Doe', 'email': 'john@example.com'}
+
+        @app.get('/validated-users')
+        @app.output(UserModel, validate=True)
+        def get_validated_user():
+            return {'id': 'invalid', 'name': 'John Doe', 'email': 'john@example.com'}
+
+        with app.test_client() as client:
+            rv = client.get('/users')
+            assert rv.json['id'] == 'invalid'
+
+            assert client.get('/validated-users').status_code == 500
+
+            app.config['OUTPUT_VALIDATION_SAMPLING'] = 2
+            # the sampling only works in debug mode
+            assert client.get('/users').status_code == 200
+
+            app.debug = True
+            with pytest.raises(pydantic.ValidationError):
+                client.get('/users')
+            assert client.get('/users').status_code == 200
+            with pytest.raises(pydantic.ValidationError):
+                client.get('/users')
+
+    def test_trusted_output_model_construct(self):
+        """Test the trusted output of models with private attributes and post init."""
+        app = APIFlask(__name__)
+
+        class Pet(BaseModel):
+            _secret: str = pydantic.PrivateAttr(default='secret')
+            name: str
+            tags: list[str] = []
+
+            def model_post_init(self, context):
+                self.tags.append('constructed')
+
+        @app.get('/pets')
+        @app.output(list[Pet], validate=False)
+        def get_pets():
+            return [{'name': 'Kitty'}, {'name': 'Coco'}]
+
+        with app.test_client() as client:
+            rv = client.get('/pets')
+            assert rv.status_code == 200
+            assert rv.json == [
+                {'name': 'Kitty', 'tags': ['constructed']},
+                {'name': 'Coco', 'tags': ['constructed']},
+            ]
+
+    def test_trusted_output_nested_annotations(self):
+        """Test the trusted output of the models in dicts, Annotated, and unions."""
+        app = APIFlask(__name__)
+
+        class Tag(BaseModel):
+            name: str
+
+        class Category(BaseModel):
+            title: str
+
+        class Pet(BaseModel):
+            name: str
+            tags: dict[str, Tag] = {}
+            owner: t.Optional[t.Annotated[Tag, Field(description='The owner')]] = None
+            labels: list[t.Annotated[Tag, Field(description='A label')]] = []
+            group: t.Union[Tag, Category, None] = None
+
+        @app.get('/pets')
+        @app.output(Pet, validate=False)
+        def get_pet():
+            return {
+                'name': 'Kitty',
+                'tags': {'a': {'name': 'cute', 'secret': 'x'}},
+                'owner': {'name': 'Grey', 'secret': 'x'},
+                'labels': [{'name': 'small', 'secret': 'x'}],
+                'group': {'title': 'cats', 'secret': 'x'},
+            }
+
+        with app.test_client() as client:
+            rv = client.get('/pets')
+            assert rv.status_code == 200
+            assert rv.json == {
+                'name': 'Kitty',
+                'tags': {'a': {'name': 'cute'}},
+                'owner': {'name': 'Grey'},
+                'labels': [{'name': 'small'}],
+                'group': {'title': 'cats'},
+            }
@@ -1,9 +1,12 @@
+import sys
+
 import pytest
 from marshmallow import fields
 from marshmallow import Schema
 from marshmallow import ValidationError
 
 from apiflask.schema_adapters import registry
+from apiflask.schema_adapters.empty import EmptySchemaAdapter
 from apiflask.schema_adapters.marshmallow import MarshmallowAdapter
 
 
@@ -78,6 +81,26 @@ class TestAdapterRegistry:
             # Expected to raise for invalid types
             pass
 
+    def test_create_adapter_with_empty_dict(self):
+        adapter = registry.create_adapter({})
+
+        assert isinstance(adapter, MarshmallowAdapter)
+        assert adapter.schema_type == 'marshmallow'
+
+    def test_create_adapter_with_empty_dict_without_marshmallow(self, monkeypatch):
+        # an app that never imported marshmallow can't use marshmallow schemas
+        monkeypatch.setitem(sys.modules, 'marshmallow', None)
+        adapter = registry.create_adapter({})
+
+        assert isinstance(adapter, EmptySchemaAdapter)
+        assert adapter.schema_type == 'empty'
+        assert adapter.get_schema_name() == 'Empty'
+        assert adapter.get_openapi_schema() == {}
+        assert adapter.serialize_output('') == ''
+
+    def test_available_types(self):
+        assert set(registry.get_available_types()) == {'marshmallow', 'pydantic', 'empty'}
+
 
 class TestMarshmallowAdapter:
     """Test MarshmallowAdapter class."""
@@ -0,0 +1,180 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask import APIFlask
+from apiflask import Schema
+from apiflask.fields import Nested
+from apiflask.fields import String
+from apiflask.openapi_adapters import OpenAPIHelper
+from apiflask.schema_cache import SchemaCache
+
+
+class Pet(BaseModel):
+    name: str = Field(min_length=1)
+
+
+class Owner(BaseModel):
+    name: str
+    pets: list[Pet]
+
+
+def validate_name(value):
+    return True
+
+
+def default_name():
+    return 'Kitty'
+
+
+class PetIn(Schema):
+    name = String(validate=validate_name, load_default=default_name)
+
+
+class Toy(BaseModel):
+    name: str = Field(default_factory=default_name, json_schema_extra={'x-check': validate_name})
+
+
+def create_app(cache_path):
+    app = APIFlask(__name__)
+    app.config['SCHEMA_CACHE_PATH'] = cache_path
+
+    @app.get('/pets')
+    @app.input(Query, location='query')
+    @app.output(list[Pet])
+    def get_pets(query_data):
+        pass
+
+    @app.post('/owners')
+    @app.input(Owner)
+    @app.output(Foo)
+    def create_owner(json_data):
+        pass
+
+    @app.post('/pets')
+    @app.input(PetIn)
+    @app.output(Toy)
+    def create_pet(json_data):
+        pass
+
+    return app
+
+
+def test_schema_cache(tmp_path, monkeypatch):
+    spec = create_app(None).spec
+    app = create_app(tmp_path)
+    assert app.spec == spec
+    assert len(os.listdir(tmp_path)) > 0
+
+    def convert(*args, **kwargs):
+        raise AssertionError('the conversion should be cached')
+
+    monkeypatch.setattr(OpenAPIHelper, '_schema_to_json_schema', convert)
+    monkeypatch.setattr(OpenAPIHelper, '_schema_to_parameters', convert)
+    app = create_app(tmp_path)
+    assert app.spec == spec
+
+
+def test_schema_cache_across_processes(tmp_path):
+    # the keys of the schemas with the callables are the same in another process
+    root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = f'from tests.test_schema_cache import create_app; create_app({str(tmp_path)!r}).spec'
+    subprocess.run([sys.executable, '-c', code], cwd=root_path, check=True)
+    filenames = sorted(os.listdir(tmp_path))
+    assert len(filenames) > 0
+    subprocess.run([sys.executable, '-c', code], cwd=root_path, check=True)
+    assert sorted(os.listdir(tmp_path)) == filenames
+
+
+def test_schema_cache_with_spec_parallel(tmp_path):
+    spec = create_app(None).spec
+    app = create_app(tmp_path)
+    app.config['SPEC_PARALLEL'] = 'thread'
+    assert app.spec == spec
+    app = create_app(tmp_path)
+    app.config['SPEC_PARALLEL'] = 'thread'
+    assert app.spec == spec
+
+
+def test_schema_cache_key(tmp_path):
+    cache = SchemaCache(tmp_path)
+    key = cache.get_key('json_schema', Pet)
+    assert key is not None
+    assert cache.get_key('json_schema', Pet) == key
+    assert SchemaCache(tmp_path).get_key('json_schema', Pet) == key
+    assert cache.get_key('parameters', Pet, 'query') != key
+    assert cache.get_key('json_schema', Owner) != key
+    assert cache.get_key('json_schema', Foo) is not None
+    assert cache.get_key('parameters', {'name': String(required=True)}, 'query') != (
+        cache.get_key('parameters', {'name': String()}, 'query')
+    )
+
+    class NestedByName(Schema):
+        foo = Nested('Foo')
+
+    assert cache.get_key('json_schema', NestedByName) is None
+
+    class LambdaValidator(Schema):
+        name = String(validate=lambda value: True)
+
+    class LocalDefault(BaseModel):
+        name: str = Field(default_factory=lambda: 'Kitty')
+
+    assert cache.get_key('json_schema', LambdaValidator) is None
+    assert cache.get_key('json_schema', LocalDefault) is None
+    assert cache.get_key('json_schema', PetIn) is not None
+
+
+def test_schema_cache_save_and_load(tmp_path):
+    cache = SchemaCache(tmp_path / 'cache')
+    assert cache.load('foo') is None
+    cache.save('foo', {'type': 'object', 'properties': {'name': {'type': 'string'}}})
+    assert cache.load('foo') == {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+    # the values changed by the JSON round trip are not saved
+    cache.save('bar', {'enum': ('a', 'b')})
+    cache.save('baz', {'default': object()})
+    assert cache.load('bar') is None
+    assert cache.load('baz') is None
+    assert os.listdir(tmp_path / 'cache') == ['foo.json']
+
+
+def test_schema_cache_load_once(tmp_path):
+    cache = SchemaCache(tmp_path)
+    cache.save('foo', {'type': 'string'})
+    (tmp_path / 'bar.json').write_text('{"type": "integer"}')
+    assert cache.load('bar') == {'type': 'integer'}
+    (tmp_path / 'foo.json').unlink()
+    (tmp_path / 'bar.json').unlink()
+    result = cache.load('bar')
+    assert result == {'type': 'integer'}
+    # each call gets a new copy
+    result['type'] = 'string'
+    assert cache.load('bar') == {'type': 'integer'}
+    assert cache.load('foo') == {'type': 'string'}
+    # the removed files are skipped when pruning
+    cache.prune()
+
+
+@pytest.mark.parametrize('max_size', [None, 0, 30])
+def test_schema_cache_prune(tmp_path, max_size):
+    cache = SchemaCache(tmp_path, max_size=max_size)
+    for index, key in enumerate(['a', 'b', 'c']):
+        cache.save(key, {'type': 'string'})
+        os.utime(tmp_path / f'{key}.json', ns=(index * 10**9, index * 10**9))
+    # loading an entry makes it the most recently used one when pruning
+    cache.load('a')
+    assert os.stat(tmp_path / 'a.json').st_mtime_ns == 0
+    cache.prune()
+    remaining = sorted(os.listdir(tmp_path))
+    if max_size is None:
+        assert remaining == ['a.json', 'b.json', 'c.json']
+    elif max_size == 0:
+        assert remaining == []
+    else:
+        assert remaining == ['a.json']
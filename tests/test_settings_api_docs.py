@@ -1,6 +1,8 @@
 import pytest
+from jinja2 import Template
 
 from apiflask import APIFlask
+from apiflask.docs_assets import get_docs_asset_urls
 
 
 def test_docs_favicon(app, client):
@@ -11,6 +13,166 @@ def test_docs_favicon(app, client):
     assert b'href="/my-favicon.png"' in rv.data
 
 
+@pytest.mark.parametrize('path', ['/docs', '/docs/oauth2-redirect'])
+def test_docs_cache_control(app, client, path):
+    rv = client.get(path)
+    assert rv.status_code == 200
+    assert rv.mimetype == 'text/html'
+    assert rv.headers['Cache-Control'] == 'no-cache'
+    etag = rv.headers['ETag']
+
+    rv = client.get(path, headers={'If-None-Match': etag})
+    assert rv.status_code == 304
+    assert rv.data == b''
+
+    app.config['DOCS_CACHE_CONTROL'] = 'public, max-age=300'
+    rv = client.get(path)
+    assert rv.headers['Cache-Control'] == 'public, max-age=300'
+    assert rv.headers['ETag'] == etag
+
+    app.config['DOCS_CACHE_CONTROL'] = None
+    rv = client.get(path)
+    assert 'Cache-Control' not in rv.headers
+
+
+def test_docs_page_cache(app, client, monkeypatch):
+    rv = client.get('/docs')
+    etag = rv.headers['ETag']
+    page = rv.data
+
+    renders = []
+    render = Template.render
+
+    def counted_render(*args, **kwargs):
+        renders.append(1)
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(Template, 'render', counted_render)
+    rv = client.get('/docs')
+    assert rv.data == page
+    assert renders == []
+
+    # the page is rendered again when the config or the context changes
+    app.config['DOCS_FAVICON'] = '/my-favicon.png'
+    rv = client.get('/docs')
+    assert b'href="/my-favicon.png"' in rv.data
+    assert rv.headers['ETag'] != etag
+    app.title = 'Pet API'
+    rv = client.get('/docs')
+    assert b'Pet API' in rv.data
+    assert len(renders) == 2
+    assert len(app._docs_templates) == 1
+
+
+@pytest.fixture
+def assets_app(tmp_path):
+    (tmp_path / 'swagger-ui-bundle.js').write_text('window.SwaggerUIBundle = {};')
+    (tmp_path / 'swagger-ui.css').write_text('body {}')
+    app = APIFlask(__name__)
+    app.config['DOCS_ASSETS_FOLDER'] = tmp_path
+    return app
+
+
+def get_asset_url(app, config_name):
+    with app.test_request_context():
+        return get_docs_asset_urls()[config_name]
+
+
+def test_docs_assets_folder(assets_app, tmp_path):
+    client = assets_app.test_client()
+    url = get_asset_url(assets_app, 'SWAGGER_UI_BUNDLE_JS')
+    assert url.startswith('/docs/assets/')
+    assert url.endswith('/swagger-ui-bundle.js')
+
+    rv = client.get('/docs')
+    assert f'src="{url}"'.encode() in rv.data
+    assert b'href="/docs/assets/' in rv.data
+    # the resources without a local file are loaded from the config URL
+    assert assets_app.config['SWAGGER_UI_STANDALONE_PRESET_JS'].encode() in rv.data
+    assert assets_app.config['DOCS_FAVICON'].encode() in rv.data
+
+    rv = client.get(url)
+    assert rv.status_code == 200
+    assert rv.data == b'window.SwaggerUIBundle = {};'
+    assert rv.mimetype == 'text/javascript'
+    assert rv.cache_control.max_age == 31536000
+    assert rv.cache_control.immutable
+    assert 'Content-Encoding' not in rv.headers
+    etag = rv.headers['ETag']
+
+    rv = client.get(url, headers={'If-None-Match': etag})
+    assert rv.status_code == 304
+    rv = client.get(url, headers={'Range': 'bytes=0-5'})
+    assert rv.status_code == 206
+    assert rv.data == b'window'
+    rv = client.head(url)
+    assert rv.status_code == 200
+    assert rv.data == b''
+    assert rv.content_length == len('window.SwaggerUIBundle = {};')
+
+    # the URL changes with the content, the outdated URL is redirected
+    (tmp_path / 'swagger-ui-bundle.js').write_text('window.SwaggerUIBundle = {version: 2};')
+    new_url = get_asset_url(assets_app, 'SWAGGER_UI_BUNDLE_JS')
+    assert new_url != url
+    rv = client.get(url)
+    assert rv.status_code == 302
+    assert rv.headers['Location'] == new_url
+    rv = client.get('/docs')
+    assert f'src="{new_url}"'.encode() in rv.data
+
+
+def test_docs_assets_precompressed(assets_app, tmp_path):
+    (tmp_path / 'swagger-ui-bundle.js.gz').write_bytes(b'gzip content')
+    (tmp_path / 'swagger-ui-bundle.js.br').write_bytes(b'br content')
+    client = assets_app.test_client()
+    url = get_asset_url(assets_app, 'SWAGGER_UI_BUNDLE_JS')
+
+    rv = client.get(url, headers={'Accept-Encoding': 'gzip, br'})
+    assert rv.data == b'br content'
+    assert rv.headers['Content-Encoding'] == 'br'
+    assert rv.mimetype == 'text/javascript'
+    assert 'Accept-Encoding' in rv.vary
+    br_etag = rv.headers['ETag']
+
+    rv = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert rv.data == b'gzip content'
+    assert rv.headers['Content-Encoding'] == 'gzip'
+    assert rv.headers['ETag'] != br_etag
+
+    rv = client.get(url)
+    assert rv.data == b'window.SwaggerUIBundle = {};'
+    assert 'Content-Encoding' not in rv.headers
+
+
+def test_docs_assets_not_found(app, client, assets_app):
+    rv = client.get('/docs/assets/abc/swagger-ui-bundle.js')
+    assert rv.status_code == 404
+    assert 'openapi.docs_asset' not in app.view_functions
+
+    client = assets_app.test_client()
+    for filename in ['redoc.standalone.js', 'app.py', '..%2Fapp.py']:
+        rv = client.get(f'/docs/assets/abc/{filename}')
+        assert rv.status_code == 404
+
+
+def test_docs_assets_spec_source_file(assets_app, tmp_path):
+    from flask.cli import routes_command
+
+    from apiflask.commands import spec_command
+
+    assets_app.config['LOCAL_SPEC_PATH'] = tmp_path / 'api.json'
+    assets_app.config['SPEC_SOURCE'] = 'file'
+    assets_app.config['SPEC_FINGERPRINT_MISMATCH'] = 'error'
+    cli_runner = assets_app.test_cli_runner()
+    assert cli_runner.invoke(spec_command, ['--quiet']).exit_code == 0
+    assert 'openapi.docs_asset' in cli_runner.invoke(routes_command).output
+
+    client = assets_app.test_client()
+    assert client.get('/openapi.json').status_code == 200
+    url = get_asset_url(assets_app, 'SWAGGER_UI_BUNDLE_JS')
+    assert client.get(url).status_code == 200
+
+
 @pytest.mark.parametrize('config_value', [True, False])
 def test_docs_use_google_font(client, config_value):
     app = APIFlask(__name__, docs_ui='redoc')
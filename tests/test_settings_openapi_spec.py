@@ -1,9 +1,17 @@
 import json
+import typing as t
+import warnings
 
 import pytest
+from pydantic import BaseModel
 
+from .schemas import Foo
+from .schemas import Query
+from .schemas import ResponseHeader
 from apiflask import APIFlask
+from apiflask.fields import String
 from apiflask.commands import spec_command
+from apiflask.views import MethodView
 
 
 def test_json_spec_mimetype(app, client):
@@ -70,3 +78,280 @@ def test_local_spec_json_indent(app, cli_runner, indent):
         assert '{"info": {' in result.output
     else:
         assert f'{{\n{" " * indent}"info": {{' in result.output
+
+
+@pytest.mark.parametrize('filename', ['api.json', 'api.yaml'])
+def test_spec_source_file(app, client, cli_runner, tmp_path, filename):
+    app.config['AUTO_SERVERS'] = False
+    local_spec_path = tmp_path / filename
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+    app.config['SPEC_SOURCE'] = 'file'
+
+    @app.get('/foo')
+    def foo():
+        pass
+
+    result = cli_runner.invoke(spec_command, ['--quiet', '--format', filename[-4:]])
+    assert result.exit_code == 0
+    assert 'x-apiflask-fingerprint' in local_spec_path.read_text()
+    spec = app.spec
+    assert app._get_spec('json') == spec
+
+    # the spec is only loaded once
+    local_spec_path.write_text('{"openapi": "3.1.0", "info": {}, "paths": {}}')
+    assert app._get_spec('json') == spec
+    rv = client.get('/openapi.json')
+    assert rv.json == spec
+    assert 'x-apiflask-fingerprint' not in rv.json
+    assert 'title: APIFlask' in app._get_spec('yaml')
+
+
+def test_spec_source_file_fingerprint_mismatch(app, cli_runner, tmp_path):
+    local_spec_path = tmp_path / 'api.json'
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+    app.config['SPEC_SOURCE'] = 'file'
+    cli_runner.invoke(spec_command, ['--quiet'])
+
+    with app.app_context():
+        app.load_spec_file()
+
+    @app.get('/foo')
+    def foo():
+        pass
+
+    with pytest.warns(UserWarning, match='is out of date'):
+        app.load_spec_file()
+
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'error'
+    with pytest.raises(RuntimeError, match='is out of date'):
+        app.load_spec_file()
+
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'ignore'
+    local_spec_path.write_text(json.dumps(app.spec))
+    assert app.load_spec_file() == app.spec
+
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'warn'
+    with pytest.warns(UserWarning, match='has no fingerprint'):
+        app.load_spec_file()
+
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'raise'
+    with pytest.raises(ValueError, match='SPEC_FINGERPRINT_MISMATCH'):
+        app.load_spec_file()
+
+
+@pytest.mark.parametrize('mismatch', ['warn', 'error'])
+def test_spec_source_file_sub_specs(app, client, cli_runner, tmp_path, mismatch):
+    from flask.cli import routes_command
+
+    app.config['LOCAL_SPEC_PATH'] = tmp_path / 'api.json'
+    app.config['SPEC_SOURCE'] = 'file'
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = mismatch
+    app.config['SUB_SPECS'] = True
+    app.tags = ['Pet']
+
+    @app.get('/pets')
+    @app.doc(tags=['Pet'])
+    def get_pets():
+        pass
+
+    result = cli_runner.invoke(spec_command, ['--quiet'])
+    assert result.exit_code == 0
+    assert 'openapi.sub_spec' in cli_runner.invoke(routes_command).output
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert client.get('/openapi.json').status_code == 200
+        rv = client.get('/openapi/Pet.json')
+    assert rv.status_code == 200
+    assert list(rv.json['paths']) == ['/pets']
+
+
+def create_fingerprint_app(
+    length=10, description='The name', default='Kitty', max_age=20, info=None, processor=False
+):
+    from pydantic import Field
+
+    from apiflask import APIBlueprint
+    from apiflask import Schema
+    from apiflask.validators import Length
+
+    class PetIn(Schema):
+        name = String(
+            validate=Length(max=length), metadata={'description': description}, load_default=default
+        )
+
+    class PetOut(BaseModel):
+        age: int = Field(le=max_age)
+
+    app = APIFlask(__name__)
+    app.config['INFO'] = info
+    bp = APIBlueprint('pet', __name__, tag='Pet')
+
+    @bp.post('/pets')
+    @bp.input(PetIn)
+    @bp.output(PetOut)
+    def create_pet(json_data):
+        pass
+
+    app.register_blueprint(bp)
+    if processor:
+
+        @app.spec_processor
+        def update_spec(spec):
+            spec['info']['title'] = 'Updated'
+            return spec
+
+    return app
+
+
+@pytest.mark.parametrize(
+    'changes',
+    [
+        {'length': 20},
+        {'description': 'The pet name'},
+        {'default': 'Coco'},
+        {'max_age': 30},
+        {'info': {'contact': {'name': 'Grey'}}},
+        {'processor': True},
+    ],
+)
+def test_spec_fingerprint(changes):
+    from apiflask.spec_file import get_spec_fingerprint
+
+    fingerprint = get_spec_fingerprint(create_fingerprint_app())
+    # the fingerprint is stable across the instances (e.g., no memory addresses)
+    assert get_spec_fingerprint(create_fingerprint_app()) == fingerprint
+    assert get_spec_fingerprint(create_fingerprint_app(**changes)) != fingerprint
+
+
+def test_spec_fingerprint_app_config(app):
+    from apiflask.spec_file import get_spec_fingerprint
+
+    fingerprint = get_spec_fingerprint(app)
+    app.config['BASE_RESPONSE_SCHEMA'] = {'properties': {'data': {}}}
+    assert get_spec_fingerprint(app) != fingerprint
+    app.config['BASE_RESPONSE_SCHEMA'] = None
+    app.config['SERVERS'] = [{'url': 'https://example.com'}]
+    assert get_spec_fingerprint(app) != fingerprint
+    app.config['SERVERS'] = None
+    assert get_spec_fingerprint(app) == fingerprint
+
+
+def test_spec_fingerprint_skips_docs_routes():
+    from apiflask.spec_file import get_spec_fingerprint
+
+    fingerprint = get_spec_fingerprint(APIFlask(__name__))
+    assert get_spec_fingerprint(APIFlask(__name__, docs_path=None)) == fingerprint
+    assert get_spec_fingerprint(APIFlask(__name__, docs_ui='redoc')) == fingerprint
+    app = APIFlask(__name__)
+    app.add_url_rule('/docs/assets/<digest>/<filename>', 'openapi.docs_asset', lambda: '')
+    assert get_spec_fingerprint(app) == fingerprint
+
+
+def test_spec_source_file_skips_sync(app, tmp_path):
+    local_spec_path = tmp_path / 'api.json'
+    local_spec_path.write_text('{"openapi": "3.1.0", "info": {}, "paths": {}}')
+    app.config['LOCAL_SPEC_PATH'] = local_spec_path
+    app.config['SYNC_LOCAL_SPEC'] = True
+    app.config['SPEC_SOURCE'] = 'file'
+    app.config['SPEC_FINGERPRINT_MISMATCH'] = 'ignore'
+
+    assert app._get_spec() == {'openapi': '3.1.0', 'info': {}, 'paths': {}}
+    assert app.spec['info']['title'] == 'APIFlask'
+    assert json.loads(local_spec_path.read_text())['info'] == {}
+
+    app.config['SPEC_SOURCE'] = 'files'
+    with pytest.raises(ValueError, match='SPEC_SOURCE'):
+        app._get_spec()
+
+
+class PetIn(BaseModel):
+    name: str
+    category: t.Optional[str] = None
+
+
+class PetOut(BaseModel):
+    id: int
+    name: str
+
+
+class Owner(BaseModel):
+    name: str
+    pets: list[PetOut]
+
+
+def create_parallel_spec_app():
+    app = APIFlask(__name__)
+
+    @app.get('/pets')
+    @app.input(Query, location='query')
+    @app.output(PetOut, headers=ResponseHeader)
+    def get_pets(query_data):
+        pass
+
+    @app.post('/pets')
+    @app.input(PetIn)
+    @app.output(PetOut, status_code=201)
+    def create_pet(json_data):
+        pass
+
+    @app.route('/owners/<int:owner_id>')
+    class OwnerView(MethodView):
+        @app.output(Owner)
+        def get(self, owner_id):
+            pass
+
+        @app.input(Foo)
+        @app.output(Foo)
+        def put(self, owner_id, json_data):
+            pass
+
+    return app
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+def test_spec_parallel(mode):
+    app = create_parallel_spec_app()
+    spec = app.spec
+
+    app = create_parallel_spec_app()
+    app.config['SPEC_PARALLEL'] = mode
+    app.config['SPEC_PARALLEL_WORKERS'] = 2
+    assert app.spec == spec
+    assert list(app.spec['components']['schemas']) == list(spec['components']['schemas'])
+    assert app.spec['paths']['/pets']['get']['parameters'][0]['in'] == 'query'
+
+
+def test_spec_parallel_with_base_response_schema():
+    app = create_parallel_spec_app()
+    app.config['BASE_RESPONSE_SCHEMA'] = Foo
+    app.config['BASE_RESPONSE_DATA_KEY'] = 'name'
+    spec = app.spec
+
+    app = create_parallel_spec_app()
+    app.config['BASE_RESPONSE_SCHEMA'] = Foo
+    app.config['BASE_RESPONSE_DATA_KEY'] = 'name'
+    app.config['SPEC_PARALLEL'] = 'thread'
+    assert app.spec == spec
+
+
+def test_spec_parallel_with_unpicklable_schema():
+    app = create_parallel_spec_app()
+
+    class LocalPet(BaseModel):
+        name: str
+
+    @app.post('/local')
+    @app.input(LocalPet)
+    @app.input({'name': String()}, location='query')
+    def local(json_data, query_data):
+        pass
+
+    spec = app.spec
+    app.config['SPEC_PARALLEL'] = 'process'
+    assert app._get_spec(force_update=True) == spec
+
+
+def test_bad_spec_parallel(app):
+    app.config['SPEC_PARALLEL'] = 'fork'
+    with pytest.raises(ValueError, match='SPEC_PARALLEL'):
+        app.spec
@@ -0,0 +1,50 @@
+from .schemas import Foo
+from .schemas import Query
+from apiflask import APIFlask
+from apiflask.spec_profile import get_spec_profile
+from apiflask.spec_profile import spec_profiling
+
+
+def test_spec_profiling():
+    app = APIFlask(__name__)
+
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    @app.output(Foo)
+    def foo(query_data):
+        pass
+
+    @app.post('/foo')
+    @app.input(Foo)
+    def create_foo(json_data):
+        pass
+
+    spec = app.spec
+    assert get_spec_profile() is None
+    with spec_profiling() as profile:
+        assert get_spec_profile() is profile
+        assert app.spec == spec
+    assert get_spec_profile() is None
+
+    report = profile.to_dict()
+    assert report['total'] > 0
+    assert set(report['phases']) == {
+        'schemas',
+        'parameters',
+        'responses',
+        'operations',
+        'spec_processor',
+        'other',
+    }
+    assert sum(report['phases'].values()) >= report['total'] * 0.99
+    assert {rule['name'] for rule in report['rules']} == {'GET /foo', 'POST /foo'}
+    get_foo = next(rule for rule in report['rules'] if rule['name'] == 'GET /foo')
+    assert set(get_foo['phases']) == {'operations', 'parameters', 'responses', 'schemas'}
+    totals = [rule['total'] for rule in report['rules']]
+    assert totals == sorted(totals, reverse=True)
+    schemas = {schema['name']: schema['phases'] for schema in report['schemas']}
+    assert 'schemas' in schemas['tests.schemas.Foo']
+    assert 'parameters' in schemas['tests.schemas.Query']
+    components = {component['name']: component['size'] for component in report['components']}
+    assert set(components) == set(spec['components']['schemas'])
+    assert components['ValidationError'] > components['Foo'] > 0
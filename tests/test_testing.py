@@ -0,0 +1,232 @@
+import datetime as dt
+import enum
+import typing as t
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+from werkzeug.datastructures import FileStorage
+
+from apiflask import Schema
+from apiflask import fields
+from apiflask.fields import UploadFile
+from apiflask.testing import PayloadGenerator
+from apiflask.testing import generate_example
+from apiflask.testing import generate_payload
+from apiflask.validators import Length
+from apiflask.validators import OneOf
+from apiflask.validators import Range
+
+
+class Color(enum.Enum):
+    red = 'red'
+    blue = 'blue'
+
+
+class Owner(Schema):
+    name = fields.String(required=True, validate=Length(2, 5))
+    email = fields.Email()
+
+
+class Pet(Schema):
+    name = fields.String(required=True, validate=Length(equal=4))
+    category = fields.String(validate=OneOf(['dog', 'cat']))
+    age = fields.Integer(validate=Range(min=1, max=3, max_inclusive=False))
+    weight = fields.Float(validate=Range(min=0, min_inclusive=False))
+    price = fields.Decimal(places=2)
+    id = fields.UUID(data_key='pet_id')
+    born = fields.Date()
+    updated_at = fields.DateTime()
+    color = fields.Enum(Color)
+    owners = fields.List(fields.Nested(Owner), validate=Length(min=1, max=2))
+    tags = fields.Dict(keys=fields.String(), values=fields.Integer())
+    location = fields.Tuple((fields.Float(), fields.Float()))
+    readonly = fields.String(dump_only=True)
+
+
+class OwnerModel(BaseModel):
+    name: str = Field(min_length=2, max_length=5)
+    email: t.Optional[str] = None
+
+
+class PetModel(BaseModel):
+    name: str = Field(min_length=4, max_length=4, alias='petName')
+    category: t.Literal['dog', 'cat']
+    age: int = Field(gt=0, le=3)
+    weight: float = Field(ge=0.5, lt=1, multiple_of=0.25)
+    color: Color
+    born: dt.date
+    owners: list[OwnerModel] = Field(min_length=1, max_length=2)
+    tags: dict[str, int] = {}
+    labels: set[str] = set()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_generate_marshmallow_payload(seed):
+    pet = generate_payload(Pet, seed=seed)
+    assert Pet().validate(pet) == {}
+    assert len(pet['name']) == 4
+    assert 1 <= pet['age'] < 3
+    assert 'readonly' not in pet
+    assert 'pet_id' in pet
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_generate_pydantic_payload(seed):
+    pet = generate_payload(PetModel, seed=seed)
+    model = PetModel.model_validate(pet)
+    assert 0 < model.age <= 3
+    assert model.weight in (0.5, 0.75)
+    assert 1 <= len(model.owners) <= 2
+
+
+@pytest.mark.parametrize('schema', [Pet, Pet(), PetModel])
+def test_generate_payload_with_seed(schema):
+    assert generate_payload(schema, many=True, seed=1) == generate_payload(
+        schema, many=True, seed=1
+    )
+    assert generate_payload(schema, many=True, seed=1) != generate_payload(
+        schema, many=True, seed=2
+    )
+
+
+def test_generate_many_payload():
+    generator = PayloadGenerator(seed=0)
+    pets = generator.generate(PetModel, many=True, count=10_000)
+    assert len(pets) == 10_000
+    PetModel.model_validate(pets[-1])
+
+
+def test_generate_dict_schema_payload():
+    payload = generate_payload(
+        {'page': fields.Integer(validate=Range(1, 10)), 'q': fields.String()}, seed=0
+    )
+    assert set(payload) == {'page', 'q'}
+    assert 1 <= payload['page'] <= 10
+
+
+def test_generate_nested_payload_max_depth():
+    class Node(Schema):
+        name = fields.String()
+        child = fields.Nested(lambda: Node())
+
+    payload = PayloadGenerator(seed=0, max_depth=2).generate(Node)
+    assert 'child' not in payload['child']['child']
+
+
+def test_generate_inputs(app, client):
+    class Query(BaseModel):
+        page: int = Field(ge=1, le=10)
+
+    class Image(Schema):
+        image = fields.File(required=True)
+
+    class Avatar(BaseModel):
+        avatar: UploadFile
+
+    @app.post('/pets')
+    @app.input(Query, location='query')
+    @app.input(Pet)
+    def create_pet(query_data, json_data):
+        return {'page': query_data.page}
+
+    @app.post('/images')
+    @app.input(Image, location='files')
+    def upload_image(files_data):
+        return {'filename': files_data['image'].filename}
+
+    @app.post('/avatars')
+    @app.input(Avatar, location='files')
+    def upload_avatar(files_data):
+        return {'filename': files_data.avatar.filename}
+
+    generator = PayloadGenerator(seed=0)
+    inputs = generator.generate_inputs(create_pet)
+    assert set(inputs) == {'query', 'json'}
+    rv = client.post('/pets', query_string=inputs['query'], json=inputs['json'])
+    assert rv.status_code == 200
+    assert rv.json == inputs['query']
+
+    for endpoint, view_func in [('/images', upload_image), ('/avatars', upload_avatar)]:
+        inputs = generator.generate_inputs(view_func)
+        assert isinstance(next(iter(inputs['files'].values())), FileStorage)
+        rv = client.post(endpoint, data=inputs['files'], content_type='multipart/form-data')
+        assert rv.status_code == 200, rv.json
+        assert rv.json['filename'].endswith('.png')
+
+
+@pytest.mark.parametrize(
+    ('schema', 'example'),
+    [
+        ({'type': 'integer'}, 1),
+        ({'type': 'integer', 'minimum': 5, 'maximum': 10}, 5),
+        ({'type': 'integer', 'maximum': -3}, -3),
+        ({'type': 'integer', 'minimum': 5, 'exclusiveMinimum': True}, 6),
+        ({'type': 'integer', 'exclusiveMinimum': 5}, 6),
+        ({'type': 'integer', 'exclusiveMaximum': 0}, -1),
+        ({'type': 'integer', 'minimum': 4, 'multipleOf': 3}, 6),
+        ({'type': 'number', 'minimum': 0.5}, 1.0),
+        ({'type': 'number', 'exclusiveMaximum': 0.5, 'multipleOf': 0.25}, 0.25),
+        ({'type': 'number', 'minimum': 1, 'maximum': 2, 'exclusiveMinimum': True}, 1.5),
+        ({'type': 'boolean'}, True),
+        ({'type': 'string'}, 'string'),
+        ({'type': 'string', 'minLength': 10}, 'stringxxxx'),
+        ({'type': 'string', 'maxLength': 3}, 'str'),
+        ({'type': 'string', 'format': 'email'}, 'user@example.com'),
+        ({'type': 'string', 'format': 'date-time'}, '2024-01-01T00:00:00Z'),
+        ({'type': 'string', 'enum': ['b', 'a']}, 'b'),
+        ({'enum': [None, 'a']}, 'a'),
+        ({'type': 'string', 'default': 'foo'}, 'foo'),
+        ({'type': 'string', 'example': 'bar'}, 'bar'),
+        ({'type': 'string', 'examples': ['baz']}, 'baz'),
+        ({'const': 'qux'}, 'qux'),
+        ({'type': ['null', 'integer']}, 1),
+        ({'anyOf': [{'type': 'null'}, {'type': 'boolean'}]}, True),
+        ({'type': 'array', 'items': {'type': 'integer'}}, [1]),
+        ({'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2}, [1, 1]),
+        ({'type': 'array', 'items': {'type': 'integer'}, 'maxItems': 0}, []),
+        (
+            {
+                'type': 'object',
+                'properties': {'id': {'type': 'integer', 'readOnly': True}, 'name': {}},
+            },
+            {'name': 'string'},
+        ),
+        (
+            {
+                'allOf': [
+                    {'properties': {'a': {'type': 'integer'}}},
+                    {'$ref': '#/components/schemas/B'},
+                ]
+            },
+            {'a': 1, 'b': True},
+        ),
+    ],
+)
+def test_generate_example(schema, example):
+    components = {'B': {'properties': {'b': {'type': 'boolean'}}}}
+    assert generate_example(schema, components) == example
+
+
+def test_generate_example_recursive_schema():
+    components = {
+        'Node': {
+            'type': 'object',
+            'properties': {
+                'children': {'type': 'array', 'items': {'$ref': '#/components/schemas/Node'}}
+            },
+        }
+    }
+    example = generate_example({'$ref': '#/components/schemas/Node'}, components)
+    depth = 0
+    while example is not None:
+        example = example['children'][0]
+        depth += 1
+    assert depth > 1
+
+
+def test_generate_example_file():
+    file = generate_example({'type': 'string', 'format': 'binary'})
+    assert isinstance(file, FileStorage)
+    assert file.filename == 'file.png'
+    assert file.read().startswith(b'\x89PNG')
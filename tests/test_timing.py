@@ -0,0 +1,85 @@
+from pydantic import BaseModel
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask import HTTPTokenAuth
+from apiflask.signals import request_timed
+from apiflask.timing import get_request_timings
+
+
+def parse_server_timing(header):
+    timings = {}
+    for metric in header.split(', '):
+        name, duration = metric.split(';dur=')
+        timings[name] = float(duration)
+    return timings
+
+
+def test_request_timing_disabled_by_default(app, client):
+    @app.get('/foo')
+    @app.output(Foo)
+    def foo():
+        assert get_request_timings() is None
+        return {'id': 1, 'name': 'foo'}
+
+    rv = client.get('/foo')
+    assert rv.status_code == 200
+    assert 'Server-Timing' not in rv.headers
+
+
+def test_request_timing(app, client):
+    app.config['REQUEST_TIMING'] = True
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return token
+
+    class Body(BaseModel):
+        name: str
+
+    @app.post('/foo')
+    @app.auth_required(auth)
+    @app.input(Query, location='query')
+    @app.input(Body)
+    @app.output(Foo)
+    def foo(query_data, json_data):
+        assert get_request_timings() is not None
+        return {'id': query_data['id'], 'name': json_data.name}
+
+    rv = client.post('/foo?id=1', json={'name': 'bar'}, headers={'Authorization': 'Bearer a'})
+    assert rv.status_code == 200
+    timings = parse_server_timing(rv.headers['Server-Timing'])
+    assert set(timings) == {'auth', 'input-query', 'input-json', 'view', 'output', 'total'}
+    assert timings['total'] >= timings['view']
+
+
+def test_request_timing_callback_and_signal(app, client):
+    app.config['REQUEST_TIMING'] = True
+    app.config['SERVER_TIMING_HEADER'] = False
+    results = []
+
+    @app.request_timings
+    def collect(timings):
+        results.append(timings)
+
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    def foo(query_data):
+        return {}
+
+    def receiver(sender, timings):
+        assert sender is app
+        results.append(timings)
+
+    with request_timed.connected_to(receiver, app):
+        rv = client.get('/foo')
+    assert 'Server-Timing' not in rv.headers
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert set(results[0]) == {'input-query', 'total'}
+
+    # the failed phases are also recorded
+    rv = client.get('/foo?id=x')
+    assert rv.status_code == 422
+    assert 'input-query' in results[-1]
@@ -0,0 +1,128 @@
+import pytest
+
+from .schemas import Foo
+from .schemas import Query
+from apiflask import HTTPTokenAuth
+
+pytest.importorskip('opentelemetry.sdk')
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+
+@pytest.fixture
+def exporter(app):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    app.tracer_provider = provider
+    app.config['TRACING'] = True
+    return exporter
+
+
+def test_tracing(app, client, exporter):
+    auth = HTTPTokenAuth()
+
+    @auth.verify_token
+    def verify_token(token):
+        return token
+
+    @app.post('/foo')
+    @app.auth_required(auth)
+    @app.input(Query, location='query')
+    @app.input(Foo)
+    @app.output(Foo, status_code=201)
+    def foo(query_data, json_data):
+        return json_data
+
+    tracer = app.tracer_provider.get_tracer('test')
+    with tracer.start_as_current_span('request') as parent:
+        rv = client.post('/foo?id=1', json={'name': 'foo'}, headers={'Authorization': 'Bearer a'})
+    assert rv.status_code == 201
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans.pop('request') is not None
+    for span in spans.values():
+        assert span.parent.span_id == parent.get_span_context().span_id
+    assert set(spans) == {
+        'apiflask.auth',
+        'apiflask.input.query',
+        'apiflask.input.json',
+        'apiflask.view',
+        'apiflask.output',
+    }
+    assert spans['apiflask.auth'].attributes['apiflask.auth.class'] == 'HTTPTokenAuth'
+    assert spans['apiflask.input.json'].attributes['apiflask.input.schema'] == 'Foo'
+    assert spans['apiflask.input.json'].attributes['apiflask.input.size'] == 15
+    assert spans['apiflask.view'].attributes['apiflask.endpoint'] == 'foo'
+    assert spans['apiflask.output'].attributes['apiflask.output.schema'] == 'Foo'
+    assert spans['apiflask.output'].attributes['apiflask.output.status_code'] == 201
+    assert spans['apiflask.output'].attributes['apiflask.output.size'] > 0
+
+
+def test_tracing_pydantic_input(app, client, exporter):
+    from pydantic import BaseModel
+
+    class PetQuery(BaseModel):
+        page: int = 1
+
+    @app.get('/pets')
+    @app.input(PetQuery, location='query')
+    def get_pets(query_data):
+        return {}
+
+    rv = client.get('/pets?page=x')
+    assert rv.status_code == 422
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'apiflask.input.query'
+    assert span.attributes['apiflask.input.schema'] == 'PetQuery'
+    (event,) = span.events
+    assert event.name == 'apiflask.validation_error'
+    assert event.attributes['apiflask.error.status_code'] == 422
+    assert span.status.status_code == StatusCode.UNSET
+
+
+def test_tracing_validation_error(app, client, exporter):
+    @app.get('/foo')
+    @app.input(Query, location='query')
+    def foo(query_data):
+        return {}
+
+    rv = client.get('/foo?id=x')
+    assert rv.status_code == 422
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'apiflask.input.query'
+    assert span.attributes['apiflask.input.schema'] == 'Query'
+    (event,) = span.events
+    assert event.name == 'apiflask.validation_error'
+    assert 'Not a valid integer' in event.attributes['apiflask.error.detail']
+
+
+def test_tracing_view_exception(app, client, exporter):
+    app.testing = False
+
+    @app.get('/foo')
+    @app.output(Foo)
+    def foo():
+        raise RuntimeError('boom')
+
+    assert client.get('/foo').status_code == 500
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'apiflask.view'
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == 'exception'
+
+
+def test_tracing_disabled(app, client, exporter):
+    app.config['TRACING'] = False
+
+    @app.get('/foo')
+    @app.output(Foo)
+    def foo():
+        return {}
+
+    client.get('/foo')
+    assert exporter.get_finished_spans() == ()